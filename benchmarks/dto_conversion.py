@@ -0,0 +1,78 @@
+"""ORM 행을 DTO로 변환하는 방법별 처리 시간을 비교합니다.
+
+    python -m benchmarks.dto_conversion [--rows 10000] [--repeat 5]
+"""
+import argparse
+import timeit
+from datetime import datetime, timezone
+
+from src.domain.novels.models import Chapter, Novel
+from src.domain.novels.schemas import ChapterDTO, ChaptersDTO, NovelDTO, NovelsDTO
+from src.domain.novels.service import to_dto
+
+
+def make_novels(rows: int) -> list[Novel]:
+    """측정에 사용할 소설 객체를 만듭니다."""
+    now = datetime.now(timezone.utc)
+    return [
+        Novel(
+            id=i,
+            title=f"전지적 독자 시점 {i}",
+            author="싱숑",
+            description="멸망한 세계에서 살아남는 방법을 아는 사람은 오직 나 하나뿐이다. " * 10,
+            published_at=now,
+            last_updated_at=now,
+            category="판타지",
+            ridi_id=str(1000000 + i),
+            image_url=f"https://img.ridicdn.net/cover/{1000000 + i}/xxlarge",
+        )
+        for i in range(rows)
+    ]
+
+
+def make_chapters(rows: int) -> list[Chapter]:
+    """측정에 사용할 챕터 객체를 만듭니다."""
+    now = datetime.now(timezone.utc)
+    return [
+        Chapter(novel_id=1, chapter_no=i, title=f"{i}화", published_at=now, ridi_id=str(2000000 + i))
+        for i in range(rows)
+    ]
+
+
+def validated(objs: list, dto: type, page: type) -> object:
+    """기존 방식: 행마다 model_validate 후 목록 DTO에서 다시 검증합니다."""
+    return page(items=[dto.model_validate(obj) for obj in objs])
+
+
+def trusted(objs: list, page: type) -> object:
+    """검증 없이 DTO를 만드는 방식입니다."""
+    return page.from_trusted({"items": [to_dto(obj) for obj in objs]})
+
+
+def main() -> None:
+    """벤치마크를 실행합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, objs, dto, page in (
+        ("novels", make_novels(args.rows), NovelDTO, NovelsDTO),
+        ("chapters", make_chapters(args.rows), ChapterDTO, ChaptersDTO),
+    ):
+        # 두 방식의 결과가 같은지 먼저 확인합니다.
+        assert validated(objs, dto, page).model_dump_json() == trusted(objs, page).model_dump_json()
+        before = min(
+            timeit.repeat(
+                lambda objs=objs, dto=dto, page=page: validated(objs, dto, page), number=1, repeat=args.repeat
+            )
+        )
+        after = min(timeit.repeat(lambda objs=objs, page=page: trusted(objs, page), number=1, repeat=args.repeat))
+        print(
+            f"{name:<8} rows={args.rows} validate={before * 1000:.1f}ms trusted={after * 1000:.1f}ms "
+            f"speedup={before / after:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""엔드포인트별 응답 직렬화 처리량을 FastAPI 기본 방식과 `DTOResponse`로 비교합니다.
+
+    python -m benchmarks.response_encoding [--items 100] [--number 200] [--repeat 5]
+"""
+import argparse
+import asyncio
+import timeit
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from benchmarks.dto_conversion import make_chapters, make_novels
+from src.domain.novels.schemas import ChaptersDTO, NovelsDTO
+from src.domain.novels.service import to_dto
+from src.domain.users.schemas import UserDTO
+from src.libs.responses import DTOResponse
+from src.main import app
+
+
+def find_route(path: str, method: str) -> APIRoute:
+    """앱에 등록된 라우트를 찾습니다."""
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods:
+            return route
+    raise LookupError(f"{method} {path}")
+
+
+async def default_body(route: APIRoute, content: object) -> bytes:
+    """기존 방식: 응답 모델로 다시 검증하고 `jsonable_encoder`를 거쳐 `JSONResponse`로 직렬화합니다."""
+    serialized = await serialize_response(field=route.response_field, response_content=content)
+    return JSONResponse(serialized).body
+
+
+async def dto_body(_route: APIRoute, content: object) -> bytes:
+    """`DTORoute`가 사용하는 방식입니다."""
+    return DTOResponse(content).body
+
+
+def measure(encode, route: APIRoute, content: object, number: int, repeat: int) -> float:
+    """`number`번 직렬화하는 데 걸린 가장 짧은 시간(초)을 반환합니다."""
+
+    async def run() -> None:
+        for _ in range(number):
+            await encode(route, content)
+
+    loop = asyncio.new_event_loop()
+    try:
+        return min(timeit.repeat(lambda: loop.run_until_complete(run()), number=1, repeat=repeat))
+    finally:
+        loop.close()
+
+
+def main() -> None:
+    """벤치마크를 실행합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100, help="목록 응답의 항목 수")
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    novels = [to_dto(novel) for novel in make_novels(args.items)]
+    chapters = [to_dto(chapter) for chapter in make_chapters(args.items)]
+    cases = (
+        ("GET", "/v1/novels", NovelsDTO.from_trusted({"items": novels, "next_cursor": "eyJhIjoxfQ"})),
+        ("GET", "/v1/novels/{novel_id}", novels[0]),
+        ("GET", "/v1/novels/{novel_id}/chapters", ChaptersDTO.from_trusted({"items": chapters})),
+        ("GET", "/v1/users/me", UserDTO(email="reader@example.com", nickname="독자", is_admin=False, is_active=True)),
+    )
+    for method, path, content in cases:
+        route = find_route(path, method)
+        before = asyncio.run(default_body(route, content))
+        after = asyncio.run(dto_body(route, content))
+        # 두 방식의 응답 본문이 바이트 단위로 같은지 먼저 확인합니다.
+        assert before == after, f"{method} {path} 응답이 다릅니다."
+
+        default_time = measure(default_body, route, content, args.number, args.repeat)
+        dto_time = measure(dto_body, route, content, args.number, args.repeat)
+        print(
+            f"{method} {path:<32} bytes={len(after):<7} "
+            f"default={args.number / default_time:>9.0f}/s dto={args.number / dto_time:>9.0f}/s "
+            f"speedup={default_time / dto_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+-- Extensions
+-- 제목/작가/설명의 부분 일치 검색(ILIKE)과 유사도 정렬에 사용합니다.
+-- 한글 trigram을 추출하려면 데이터베이스의 LC_CTYPE이 UTF-8 로케일이어야 합니다.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Users Table
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
@@ -41,6 +46,10 @@ CREATE TABLE novels (
 );
 
 CREATE INDEX novels_title_author_idx ON novels(title, author);
+-- 부분 일치 검색(ILIKE '%검색어%')에 사용합니다. 세 글자 미만의 검색어는 trigram을 뽑을 수 없어 이 인덱스를 쓰지 못합니다.
+CREATE INDEX novels_title_trgm_idx ON novels USING GIN (title gin_trgm_ops);
+CREATE INDEX novels_author_trgm_idx ON novels USING GIN (author gin_trgm_ops);
+CREATE INDEX novels_description_trgm_idx ON novels USING GIN (description gin_trgm_ops);
 
 COMMENT ON TABLE novels IS '소설';
 COMMENT ON COLUMN novels.id IS '아이디 (기본 키)';
@@ -58,29 +67,92 @@ COMMENT ON COLUMN novels.image_url IS '이미지 URL';
 COMMENT ON COLUMN novels.created_at IS '생성일';
 COMMENT ON COLUMN novels.updated_at IS '수정일';
 
+-- Novel Stats Table
+-- 챕터와 소설 메모의 집계입니다. 행이 없는 소설은 주기적인 재계산에서 채웁니다.
+CREATE TABLE novel_stats (
+    novel_id INT PRIMARY KEY REFERENCES novels(id),
+    chapter_count INT NOT NULL DEFAULT 0,
+    latest_chapter_no INT,
+    reader_count INT NOT NULL DEFAULT 0,
+    favorite_count INT NOT NULL DEFAULT 0,
+    star_sum BIGINT NOT NULL DEFAULT 0,
+    star_count INT NOT NULL DEFAULT 0,
+    average_star FLOAT GENERATED ALWAYS AS (
+        CASE WHEN star_count > 0 THEN ROUND(star_sum::NUMERIC / star_count, 2)::FLOAT ELSE 0 END
+    ) STORED,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX novel_stats_reader_count_idx ON novel_stats(reader_count, novel_id);
+CREATE INDEX novel_stats_favorite_count_idx ON novel_stats(favorite_count, novel_id);
+CREATE INDEX novel_stats_average_star_idx ON novel_stats(average_star, novel_id);
+
+COMMENT ON TABLE novel_stats IS '소설 통계';
+COMMENT ON COLUMN novel_stats.novel_id IS '소설 아이디 (기본 키, 외래 키)';
+COMMENT ON COLUMN novel_stats.chapter_count IS '챕터 수';
+COMMENT ON COLUMN novel_stats.latest_chapter_no IS '마지막 챕터 번호';
+COMMENT ON COLUMN novel_stats.reader_count IS '소설 메모가 있는 사용자 수';
+COMMENT ON COLUMN novel_stats.favorite_count IS '즐겨찾기 수';
+COMMENT ON COLUMN novel_stats.star_sum IS '모든 사용자의 별점 합계';
+COMMENT ON COLUMN novel_stats.star_count IS '모든 사용자가 별점을 등록한 챕터 수';
+COMMENT ON COLUMN novel_stats.average_star IS '평균 별점, 별점이 없으면 0';
+COMMENT ON COLUMN novel_stats.created_at IS '생성일';
+COMMENT ON COLUMN novel_stats.updated_at IS '수정일';
+
 -- Novel Memos Table
 CREATE TABLE novel_memos (
     novel_id INT NOT NULL REFERENCES novels(id),
     user_id INT NOT NULL REFERENCES users(id),
     content TEXT,
-    average_star FLOAT,
+    star_sum INT NOT NULL DEFAULT 0,
+    star_count INT NOT NULL DEFAULT 0,
+    average_star FLOAT GENERATED ALWAYS AS (
+        CASE WHEN star_count > 0 THEN ROUND(star_sum::NUMERIC / star_count, 2)::FLOAT END
+    ) STORED,
     is_favorite BOOLEAN NOT NULL DEFAULT FALSE,
     created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     content_updated_at TIMESTAMP WITH TIME ZONE,
+    progress BYTEA NOT NULL DEFAULT ''::BYTEA,
     PRIMARY KEY (novel_id, user_id)
 );
 
-CREATE INDEX novel_memos_user_id_idx ON novel_memos(user_id);
+CREATE INDEX novel_memos_user_id_updated_at_idx ON novel_memos(user_id, updated_at);
 
 COMMENT ON TABLE novel_memos IS '소설 메모';
 COMMENT ON COLUMN novel_memos.novel_id IS '소설 아이디 (외래 키)';
 COMMENT ON COLUMN novel_memos.user_id IS '사용자 아이디 (외래 키)';
 COMMENT ON COLUMN novel_memos.content IS '내용';
+COMMENT ON COLUMN novel_memos.star_sum IS '별점 합계';
+COMMENT ON COLUMN novel_memos.star_count IS '별점을 등록한 챕터 수';
 COMMENT ON COLUMN novel_memos.average_star IS '평균 별점';
 COMMENT ON COLUMN novel_memos.created_at IS '생성일';
 COMMENT ON COLUMN novel_memos.updated_at IS '수정일';
 COMMENT ON COLUMN novel_memos.content_updated_at IS '내용 수정일';
+COMMENT ON COLUMN novel_memos.progress IS '챕터 메모가 있는 챕터 번호의 비트맵';
+
+-- 챕터 번호 n은 (n / 8)번째 바이트의 (n % 8)번째 비트(최하위 비트부터)입니다. 끝의 0인 바이트는 남기지 않습니다.
+CREATE OR REPLACE FUNCTION progress_update(progress BYTEA, added INT[], removed INT[]) RETURNS BYTEA
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    chapter_no INT;
+BEGIN
+    progress := COALESCE(progress, ''::BYTEA);
+    FOREACH chapter_no IN ARRAY COALESCE(added, '{}') LOOP
+        CONTINUE WHEN chapter_no < 0;
+        IF length(progress) * 8 <= chapter_no THEN
+            progress := progress || decode(repeat('00', chapter_no / 8 + 1 - length(progress)), 'hex');
+        END IF;
+        progress := set_bit(progress, chapter_no, 1);
+    END LOOP;
+    FOREACH chapter_no IN ARRAY COALESCE(removed, '{}') LOOP
+        CONTINUE WHEN chapter_no < 0 OR chapter_no >= length(progress) * 8;
+        progress := set_bit(progress, chapter_no, 0);
+    END LOOP;
+    RETURN rtrim(progress, '\x00'::BYTEA);
+END
+$$;
 
 
 -- Chapter Table
@@ -99,6 +171,7 @@ CREATE TABLE chapters (
 );
 
 CREATE INDEX chapters_chapter_no_idx ON chapters(chapter_no DESC);
+CREATE INDEX chapters_novel_id_updated_at_idx ON chapters(novel_id, updated_at);
 
 COMMENT ON TABLE chapters IS '챕터';
 COMMENT ON COLUMN chapters.novel_id IS '소설 아이디 (외래 키)';
@@ -129,7 +202,7 @@ CREATE TABLE chapter_memos (
 
 CREATE INDEX chapter_memos_novel_id_chapter_no_idx ON chapter_memos(novel_id, chapter_no);
 CREATE INDEX chapter_memos_novel_id_user_id_idx ON chapter_memos(novel_id, user_id);
-CREATE INDEX chapter_memos_user_id_idx ON chapter_memos(user_id);
+CREATE INDEX chapter_memos_user_id_updated_at_idx ON chapter_memos(user_id, updated_at);
 
 COMMENT ON TABLE chapter_memos IS '챕터 메모';
 COMMENT ON COLUMN chapter_memos.novel_id IS '소설 아이디 (외래 키)';
@@ -140,3 +213,179 @@ COMMENT ON COLUMN chapter_memos.star IS '별점';
 COMMENT ON COLUMN chapter_memos.created_at IS '생성일';
 COMMENT ON COLUMN chapter_memos.updated_at IS '수정일';
 COMMENT ON COLUMN chapter_memos.content_updated_at IS '내용 수정일';
+
+
+-- Reading Positions Table
+CREATE TABLE reading_positions (
+    user_id INT NOT NULL REFERENCES users(id),
+    novel_id INT NOT NULL REFERENCES novels(id),
+    chapter_no INT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (user_id, novel_id)
+);
+
+CREATE INDEX reading_positions_user_id_updated_at_idx ON reading_positions(user_id, updated_at, novel_id);
+
+COMMENT ON TABLE reading_positions IS '이어 읽기 위치';
+COMMENT ON COLUMN reading_positions.user_id IS '사용자 아이디 (외래 키)';
+COMMENT ON COLUMN reading_positions.novel_id IS '소설 아이디 (외래 키)';
+COMMENT ON COLUMN reading_positions.chapter_no IS '마지막으로 메모를 남긴 챕터 번호';
+COMMENT ON COLUMN reading_positions.created_at IS '생성일';
+COMMENT ON COLUMN reading_positions.updated_at IS '마지막으로 읽은 시각';
+
+
+-- Memo Tombstones Table
+CREATE TABLE memo_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    user_id INT NOT NULL REFERENCES users(id),
+    novel_id INT NOT NULL,
+    chapter_no INT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX memo_tombstones_user_id_updated_at_idx ON memo_tombstones(user_id, updated_at);
+
+COMMENT ON TABLE memo_tombstones IS '삭제된 메모';
+COMMENT ON COLUMN memo_tombstones.id IS '아이디';
+COMMENT ON COLUMN memo_tombstones.user_id IS '사용자 아이디 (외래 키)';
+COMMENT ON COLUMN memo_tombstones.novel_id IS '소설 아이디';
+COMMENT ON COLUMN memo_tombstones.chapter_no IS '챕터 번호, 소설 메모이면 NULL';
+COMMENT ON COLUMN memo_tombstones.created_at IS '생성일';
+COMMENT ON COLUMN memo_tombstones.updated_at IS '삭제일';
+
+
+-- Novel Activity Table
+CREATE TABLE novel_activity (
+    novel_id INT NOT NULL REFERENCES novels(id),
+    bucket_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    count INT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (novel_id, bucket_at)
+);
+
+CREATE INDEX novel_activity_bucket_at_idx ON novel_activity(bucket_at);
+
+COMMENT ON TABLE novel_activity IS '소설 활동 수';
+COMMENT ON COLUMN novel_activity.novel_id IS '소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_activity.bucket_at IS '버킷 시작 시각';
+COMMENT ON COLUMN novel_activity.count IS '활동 수';
+COMMENT ON COLUMN novel_activity.created_at IS '생성일';
+COMMENT ON COLUMN novel_activity.updated_at IS '수정일';
+
+
+-- Novel Rankings Table
+CREATE TABLE novel_rankings (
+    ranking VARCHAR(20) NOT NULL,
+    rank INT NOT NULL,
+    novel_id INT NOT NULL REFERENCES novels(id),
+    score FLOAT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (ranking, rank)
+);
+
+COMMENT ON TABLE novel_rankings IS '소설 순위';
+COMMENT ON COLUMN novel_rankings.ranking IS '순위 종류';
+COMMENT ON COLUMN novel_rankings.rank IS '순위';
+COMMENT ON COLUMN novel_rankings.novel_id IS '소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_rankings.score IS '순위를 정한 값';
+COMMENT ON COLUMN novel_rankings.created_at IS '계산한 시각';
+COMMENT ON COLUMN novel_rankings.updated_at IS '수정일';
+
+-- Novel Similarities Table
+CREATE TABLE novel_similarities (
+    novel_id INT NOT NULL REFERENCES novels(id),
+    rank INT NOT NULL,
+    similar_novel_id INT NOT NULL REFERENCES novels(id),
+    score FLOAT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (novel_id, rank)
+);
+
+COMMENT ON TABLE novel_similarities IS '비슷한 소설';
+COMMENT ON COLUMN novel_similarities.novel_id IS '소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_similarities.rank IS '순위';
+COMMENT ON COLUMN novel_similarities.similar_novel_id IS '비슷한 소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_similarities.score IS '코사인 유사도';
+COMMENT ON COLUMN novel_similarities.created_at IS '계산한 시각';
+COMMENT ON COLUMN novel_similarities.updated_at IS '수정일';
+
+-- Novel Content Similarities Table
+CREATE TABLE novel_content_similarities (
+    novel_id INT NOT NULL REFERENCES novels(id),
+    rank INT NOT NULL,
+    similar_novel_id INT NOT NULL REFERENCES novels(id),
+    score FLOAT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (novel_id, rank)
+);
+
+COMMENT ON TABLE novel_content_similarities IS '내용이 비슷한 소설';
+COMMENT ON COLUMN novel_content_similarities.novel_id IS '소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_content_similarities.rank IS '순위';
+COMMENT ON COLUMN novel_content_similarities.similar_novel_id IS '비슷한 소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_content_similarities.score IS 'TF-IDF 코사인 유사도';
+COMMENT ON COLUMN novel_content_similarities.created_at IS '계산한 시각';
+COMMENT ON COLUMN novel_content_similarities.updated_at IS '수정일';
+
+-- User Recommendations Table
+CREATE TABLE user_recommendations (
+    user_id INT NOT NULL REFERENCES users(id),
+    rank INT NOT NULL,
+    novel_id INT NOT NULL REFERENCES novels(id),
+    score FLOAT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (user_id, rank)
+);
+
+COMMENT ON TABLE user_recommendations IS '추천 소설';
+COMMENT ON COLUMN user_recommendations.user_id IS '사용자 아이디 (외래 키)';
+COMMENT ON COLUMN user_recommendations.rank IS '순위';
+COMMENT ON COLUMN user_recommendations.novel_id IS '소설 아이디 (외래 키)';
+COMMENT ON COLUMN user_recommendations.score IS '추천 점수';
+COMMENT ON COLUMN user_recommendations.created_at IS '계산한 시각';
+COMMENT ON COLUMN user_recommendations.updated_at IS '수정일';
+
+-- Novel Jobs Table
+-- 모든 워커 프로세스가 공유하는 소설 등록 작업 큐입니다. 완료된 작업은 보관 시간이 지나면 삭제합니다.
+CREATE TABLE novel_jobs (
+    id VARCHAR(32) PRIMARY KEY,
+    user_id INT NOT NULL REFERENCES users(id),
+    platform VARCHAR(20) NOT NULL,
+    platform_id VARCHAR(20),
+    url VARCHAR(255),
+    novel_key VARCHAR(255) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    novel_id INT REFERENCES novels(id),
+    error TEXT,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- 사용자마다 같은 소설에 대해 대기 중이거나 진행 중인 작업은 하나입니다.
+CREATE UNIQUE INDEX novel_jobs_user_id_novel_key_idx ON novel_jobs(user_id, platform, novel_key)
+    WHERE status IN ('pending', 'running');
+CREATE INDEX novel_jobs_status_created_at_idx ON novel_jobs(status, created_at);
+
+COMMENT ON TABLE novel_jobs IS '소설 등록 작업';
+COMMENT ON COLUMN novel_jobs.id IS '아이디 (기본 키)';
+COMMENT ON COLUMN novel_jobs.user_id IS '작업을 요청한 사용자 아이디 (외래 키)';
+COMMENT ON COLUMN novel_jobs.platform IS '소설 플랫폼';
+COMMENT ON COLUMN novel_jobs.platform_id IS '플랫폼의 소설 아이디';
+COMMENT ON COLUMN novel_jobs.url IS '소설 URL';
+COMMENT ON COLUMN novel_jobs.novel_key IS '같은 소설인지 구분하는 키, 플랫폼의 소설 아이디가 없으면 URL';
+COMMENT ON COLUMN novel_jobs.status IS '작업 상태';
+COMMENT ON COLUMN novel_jobs.novel_id IS '등록된 소설 아이디 (외래 키)';
+COMMENT ON COLUMN novel_jobs.error IS '실패 사유';
+COMMENT ON COLUMN novel_jobs.started_at IS '작업 시작일';
+COMMENT ON COLUMN novel_jobs.finished_at IS '작업 종료일';
+COMMENT ON COLUMN novel_jobs.created_at IS '생성일';
+COMMENT ON COLUMN novel_jobs.updated_at IS '수정일';
@@ -3,9 +3,11 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
-from src.core.security import decode_jwt_token, oauth2_scheme, oauth2_scheme_optional
+from src.core.security import oauth2_scheme, oauth2_scheme_optional
 from src.db import AsyncSessionLocal
+from src.domain.auth.cache import token_cache
 from src.domain.auth.schemas import TokenPayload
+from src.libs.responses import UserError
 
 __all__ = ("get_db",)
 
@@ -24,7 +26,7 @@ async def get_token_payload(
     token: Annotated[str, Depends(oauth2_scheme)],
 ) -> TokenPayload:
     """토큰의 payload를 반환합니다."""
-    return TokenPayload(**decode_jwt_token(token))
+    return token_cache.get_payload(token)
 
 
 async def get_token_payload_optional(
@@ -32,5 +34,14 @@ async def get_token_payload_optional(
 ) -> TokenPayload | None:
     """토큰의 payload를 반환합니다."""
     if token:
-        return TokenPayload(**decode_jwt_token(token))
+        return token_cache.get_payload(token)
     return None
+
+
+async def get_admin_token_payload(
+    token: Annotated[TokenPayload, Depends(get_token_payload)],
+) -> TokenPayload:
+    """관리자 토큰의 payload를 반환합니다."""
+    if not token.is_admin:
+        raise UserError.FORBIDDEN.http_exception
+    return token
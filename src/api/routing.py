@@ -0,0 +1,62 @@
+"""API 라우트 클래스를 정의합니다."""
+import asyncio
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute, request_response
+
+from src.libs.responses import DTOResponse
+
+__all__ = ("DTORoute",)
+
+
+class DTORoute(APIRoute):
+    """응답 모델 객체를 다시 검증하지 않고 바로 직렬화하는 라우트입니다.
+
+    FastAPI는 엔드포인트가 반환한 모델을 dict로 덤프하고, `response_model`로 다시 검증한 뒤,
+    `jsonable_encoder`를 거쳐 `json.dumps`로 직렬화합니다. 반환값의 타입이 `response_model`과 같으면
+    이 과정이 같은 JSON을 만드므로, 응답 클래스가 `DTOResponse`일 때 반환값을 바로 응답으로 감쌉니다.
+
+    `Response` 파라미터로 헤더나 상태 코드를 바꾸는 엔드포인트와 `response_model_*` 옵션을 사용하는
+    라우트는 FastAPI의 기본 동작을 그대로 사용합니다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        if self._can_serialize_directly(response_class):
+            self.dependant.call = self._wrap_endpoint(self.dependant.call, response_class)
+            self.app = request_response(self.get_route_handler())
+
+    def _can_serialize_directly(self, response_class: type) -> bool:
+        """반환값을 FastAPI의 검증과 인코딩 없이 바로 직렬화해도 결과가 같은 라우트인지 확인합니다."""
+        if not isinstance(self.response_model, type) or not issubclass(response_class, DTOResponse):
+            return False
+        if not asyncio.iscoroutinefunction(self.dependant.call) or self.dependant.response_param_name is not None:
+            return False
+        return (
+            self.response_model_include is None
+            and self.response_model_exclude is None
+            and not (
+                self.response_model_exclude_unset
+                or self.response_model_exclude_defaults
+                or self.response_model_exclude_none
+            )
+        )
+
+    def _wrap_endpoint(self, call: Callable[..., Any], response_class: type[DTOResponse]) -> Callable[..., Any]:
+        """반환값이 응답 모델 객체이면 바로 응답으로 감싸는 엔드포인트를 반환합니다."""
+        response_model = self.response_model
+        status_code = self.status_code
+
+        @wraps(call)
+        async def endpoint(**values: Any) -> Any:
+            result = await call(**values)
+            if type(result) is response_model:  # pylint: disable=unidiomatic-typecheck
+                return response_class(result, status_code=status_code or 200)
+            return result
+
+        return endpoint
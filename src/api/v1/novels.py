@@ -1,32 +1,42 @@
 """소설 관련 API"""
 # pylint: disable=redefined-builtin,too-many-arguments
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
 from src.api import deps
+from src.api.routing import DTORoute
 from src.domain.auth.schemas import TokenPayload
 from src.domain.novels.schemas import (
     ChapterDTO,
+    ChapterMemoBatch,
     ChapterMemoContent,
     ChapterMemoContentNull,
     ChapterMemoCreate,
     ChapterMemoDTO,
+    ChapterMemosDTO,
     ChapterMemoUpdate,
     ChaptersDTO,
     ChaptersRequest,
     NovelCreate,
     NovelDTO,
+    NovelJobDTO,
     NovelMemoContent,
     NovelMemoCreate,
     NovelMemoDTO,
+    NovelProgressDTO,
+    NovelRankingsDTO,
+    NovelRankingsRequest,
+    NovelRecommendationsDTO,
     NovelsDTO,
     NovelsRequest,
+    SimilarNovelsRequest,
 )
 from src.domain.novels.service import ChapterService, NovelService
-from src.libs.responses import UserError, get_error_response
+from src.libs.conditional import conditional_response
+from src.libs.responses import DTOResponse, UserError, get_error_response
 
-router = APIRouter()
+router = APIRouter(route_class=DTORoute, default_response_class=DTOResponse)
 
 
 async def get_novel_service(db: Annotated[AsyncSession, Depends(deps.get_db)]) -> NovelService:
@@ -41,26 +51,51 @@ async def get_chapter_service(db: Annotated[AsyncSession, Depends(deps.get_db)])
 
 @router.post(
     "",
-    response_model=NovelDTO,
-    status_code=status.HTTP_201_CREATED,
-    summary="플랫폼의 소설 id / url을 이용하여 소설을 등록합니다.",
-    responses=get_error_response(NovelCreate.errors, NovelService.create_errors, UserError.CREDENTIALS_EXCEPTION),
-    dependencies=[Depends(deps.get_token_payload)],
+    response_model=NovelJobDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="플랫폼의 소설 id / url을 이용하여 소설 등록 작업을 생성합니다.",
+    responses=get_error_response(NovelCreate.errors, NovelService.register_errors, UserError.CREDENTIALS_EXCEPTION),
 )
 async def create_novel(
+    request: Request,
+    response: Response,
     novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
     *,
     novel_create: Annotated[NovelCreate, Body(...)],
-) -> NovelDTO:
-    """플랫폼의 소설 id / url을 이용하여 소설을 등록합니다.(현재는 리디북스만 지원)"""
-    return await novel_service.create(novel_create)
+) -> NovelJobDTO:
+    """플랫폼의 소설 id / url을 이용하여 소설 등록 작업을 생성합니다.(현재는 리디북스만 지원)
+
+    등록은 백그라운드에서 진행되며, 진행 상황은 `GET /novels/jobs/{job_id}`로 확인합니다.
+    """
+    job = await novel_service.register(novel_create, token.id)
+    response.headers["Location"] = str(request.url_for("get_novel_job", job_id=job.id))
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=NovelJobDTO,
+    summary="소설 등록 작업의 진행 상황을 조회합니다.",
+    responses=get_error_response(NovelService.get_job_errors, UserError.CREDENTIALS_EXCEPTION),
+)
+async def get_novel_job(
+    novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
+    job_id: Annotated[str, Path(description="작업 ID")],
+) -> NovelJobDTO:
+    """소설 등록 작업의 진행 상황을 조회합니다. 완료되면 등록된 소설을 함께 반환합니다.
+
+    작업을 요청한 사용자만 조회할 수 있습니다.
+    """
+    return await novel_service.get_job(job_id, token.id)
 
 
 @router.get(
     "",
     response_model=NovelsDTO,
     summary="모든 소설을 조회합니다.",
-    responses=get_error_response(),
+    responses=get_error_response(NovelService.get_multi_errors),
 )
 async def get_novel_list(
     novel_service: Annotated[NovelService, Depends(get_novel_service)],
@@ -70,10 +105,27 @@ async def get_novel_list(
 ) -> NovelsDTO:
     """모든 소설을 조회합니다."""
     if token:
-        return await novel_service.get_multi_with_memo(token.id, novels_request)
+        return await novel_service.get_multi_with_memo(novels_request, token.id)
     return await novel_service.get_multi(novels_request)
 
 
+@router.get(
+    "/rankings",
+    response_model=NovelRankingsDTO,
+    summary="소설 순위를 조회합니다.",
+)
+async def get_novel_rankings(
+    novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    *,
+    rankings_request: Annotated[NovelRankingsRequest, Depends()],
+) -> NovelRankingsDTO:
+    """평균 별점, 즐겨찾기 수, 최근 활동 수 순위를 조회합니다.
+
+    순위는 주기적으로 미리 계산한 스냅샷이며, 계산한 시각을 `computed_at`으로 함께 반환합니다.
+    """
+    return await novel_service.get_rankings(rankings_request)
+
+
 @router.get(
     "/{novel_id}",
     response_model=NovelDTO,
@@ -81,11 +133,34 @@ async def get_novel_list(
     responses=get_error_response(NovelService.get_errors),
 )
 async def get_novel(
+    request: Request,
     novel_service: Annotated[NovelService, Depends(get_novel_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
 ) -> NovelDTO:
-    """특정 소설을 조회합니다."""
-    return await novel_service.get(novel_id)
+    """특정 소설을 조회합니다. ETag / Last-Modified로 조건부 요청을 지원합니다."""
+    version = await novel_service.get_version(novel_id)
+    return await conditional_response(request, version, lambda: novel_service.get(novel_id, version))
+
+
+@router.get(
+    "/{novel_id}/similar",
+    response_model=NovelRecommendationsDTO,
+    summary="특정 소설과 비슷한 소설을 조회합니다.",
+)
+async def get_similar_novels(
+    novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    novel_id: Annotated[int, Path(description="소설 ID")],
+    *,
+    similar_novels_request: Annotated[SimilarNovelsRequest, Depends()],
+) -> NovelRecommendationsDTO:
+    """특정 소설과 비슷한 소설을 유사도 순서로 조회합니다.
+
+    `by=ratings`는 메모를 남긴 사용자들이 비슷하게 평가한 소설을, `by=content`는 같은 카테고리에서 제목과 설명이
+    비슷한 소설을 조회합니다. 평가가 없는 새 소설은 `by=content`를 사용합니다.
+
+    주기적으로 미리 계산한 결과이며, 계산한 시각을 `computed_at`으로 함께 반환합니다.
+    """
+    return await novel_service.get_similar(novel_id, similar_novels_request)
 
 
 @router.get(
@@ -95,12 +170,34 @@ async def get_novel(
     responses=get_error_response(UserError.CREDENTIALS_EXCEPTION),
 )
 async def get_novel_memo(
+    request: Request,
     novel_service: Annotated[NovelService, Depends(get_novel_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
     token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
 ) -> NovelMemoDTO:
-    """특정 소설의 메모를 조회합니다."""
-    return await novel_service.get_memo(novel_id, token.id)
+    """특정 소설의 메모를 조회합니다. ETag / Last-Modified로 조건부 요청을 지원합니다."""
+    version = await novel_service.get_memo_version(novel_id, token.id)
+    return await conditional_response(request, version, lambda: novel_service.get_memo(novel_id, token.id))
+
+
+@router.get(
+    "/{novel_id}/progress",
+    response_model=NovelProgressDTO,
+    summary="특정 소설에서 메모를 남긴 챕터 번호를 조회합니다.",
+    responses=get_error_response(UserError.CREDENTIALS_EXCEPTION),
+)
+async def get_novel_progress(
+    request: Request,
+    novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    novel_id: Annotated[int, Path(description="소설 ID")],
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
+) -> NovelProgressDTO:
+    """특정 소설에서 메모를 남긴(읽은) 챕터 번호를 구간 목록으로 조회합니다.
+
+    챕터 메모를 읽지 않고 소설 메모에 저장된 비트맵으로 만듭니다. ETag / Last-Modified로 조건부 요청을 지원합니다.
+    """
+    version = await novel_service.get_progress_version(novel_id, token.id)
+    return await conditional_response(request, version, lambda: novel_service.get_progress(novel_id, token.id))
 
 
 @router.post(
@@ -192,19 +289,26 @@ async def unmark_as_favorite(
     "/{novel_id}/chapters",
     response_model=ChaptersDTO,
     summary="특정 소설의 챕터 목록을 조회합니다.",
-    responses=get_error_response(NovelService.get_errors),
+    responses=get_error_response(NovelService.get_errors, ChapterService.get_multi_errors),
 )
 async def get_novel_chapters(
+    request: Request,
     chapter_service: Annotated[ChapterService, Depends(get_chapter_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
     token: Annotated[TokenPayload, Depends(deps.get_token_payload_optional)],
     *,
     chapters_request: Annotated[ChaptersRequest, Depends()],
 ) -> ChaptersDTO:
-    """특정 소설의 챕터 목록을 조회합니다."""
+    """특정 소설의 챕터 목록을 조회합니다. ETag / Last-Modified로 조건부 요청을 지원합니다."""
     if token:
-        return await chapter_service.get_multi_with_memo(novel_id, chapters_request, token.id)
-    return await chapter_service.get_multi(novel_id, chapters_request)
+        version = await chapter_service.get_multi_version(novel_id, token.id)
+        return await conditional_response(
+            request, version, lambda: chapter_service.get_multi_with_memo(novel_id, chapters_request, token.id)
+        )
+    version = await chapter_service.get_multi_version(novel_id)
+    return await conditional_response(
+        request, version, lambda: chapter_service.get_multi(novel_id, chapters_request, version)
+    )
 
 
 @router.get(
@@ -232,13 +336,17 @@ async def get_novel_chapter(
     responses=get_error_response(ChapterService.get_memo_errors),
 )
 async def get_novel_chapter_memo(
+    request: Request,
     chapter_service: Annotated[ChapterService, Depends(get_chapter_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
     chapter_no: Annotated[int, Path(description="챕터 번호")],
     token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
 ) -> ChapterMemoDTO:
-    """특정 회차에 등록된 메모 및 별점을 조회합니다."""
-    return await chapter_service.get_memo(novel_id, chapter_no, token.id)
+    """특정 회차에 등록된 메모 및 별점을 조회합니다. ETag / Last-Modified로 조건부 요청을 지원합니다."""
+    version = await chapter_service.get_memo_version(novel_id, chapter_no, token.id)
+    return await conditional_response(
+        request, version, lambda: chapter_service.get_memo(novel_id, chapter_no, token.id)
+    )
 
 
 @router.post(
@@ -249,7 +357,6 @@ async def get_novel_chapter_memo(
 )
 async def create_novel_chapter_memo(
     chapter_service: Annotated[ChapterService, Depends(get_chapter_service)],
-    novel_service: Annotated[NovelService, Depends(get_novel_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
     chapter_no: Annotated[int, Path(description="챕터 번호")],
     token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
@@ -260,9 +367,7 @@ async def create_novel_chapter_memo(
     chapter_memo_create = ChapterMemoCreate(
         **chapter_memo_content.model_dump(), novel_id=novel_id, chapter_no=chapter_no, user_id=token.id
     )
-    chapter_memo = await chapter_service.create_memo(chapter_memo_create)
-    await novel_service.update_average_star(novel_id, token.id)
-    return chapter_memo
+    return await chapter_service.create_memo(chapter_memo_create)
 
 
 @router.patch(
@@ -273,7 +378,6 @@ async def create_novel_chapter_memo(
 )
 async def update_novel_chapter_memo(
     chapter_service: Annotated[ChapterService, Depends(get_chapter_service)],
-    novel_service: Annotated[NovelService, Depends(get_novel_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
     chapter_no: Annotated[int, Path(description="챕터 번호")],
     token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
@@ -284,9 +388,7 @@ async def update_novel_chapter_memo(
     chapter_memo_update = ChapterMemoUpdate(
         **chapter_memo_content.model_dump(), novel_id=novel_id, chapter_no=chapter_no, user_id=token.id
     )
-    chapter_memo = await chapter_service.update_memo(chapter_memo_update)
-    await novel_service.update_average_star(novel_id, token.id)
-    return chapter_memo
+    return await chapter_service.update_memo(chapter_memo_update)
 
 
 @router.delete(
@@ -297,11 +399,26 @@ async def update_novel_chapter_memo(
 )
 async def delete_novel_chapter_memo(
     chapter_service: Annotated[ChapterService, Depends(get_chapter_service)],
-    novel_service: Annotated[NovelService, Depends(get_novel_service)],
     novel_id: Annotated[int, Path(description="소설 ID")],
     chapter_no: Annotated[int, Path(description="챕터 번호")],
     token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
 ) -> None:
     """특정 회차에 등록된 메모 및 별점을 삭제합니다."""
     await chapter_service.delete_memo(novel_id, chapter_no, token.id)
-    await novel_service.update_average_star(novel_id, token.id)
+
+
+@router.put(
+    "/{novel_id}/chapters/memos",
+    response_model=ChapterMemosDTO,
+    summary="여러 회차에 메모 및 별점을 한 번에 등록합니다.",
+    responses=get_error_response(ChapterService.upsert_memo_multi_errors, UserError.CREDENTIALS_EXCEPTION),
+)
+async def upsert_novel_chapter_memos(
+    chapter_service: Annotated[ChapterService, Depends(get_chapter_service)],
+    novel_id: Annotated[int, Path(description="소설 ID")],
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
+    *,
+    chapter_memo_batch: Annotated[ChapterMemoBatch, Body(...)],
+) -> ChapterMemosDTO:
+    """여러 회차에 메모 및 별점을 한 번에 등록합니다. 이미 메모가 있는 회차는 내용과 별점을 덮어씁니다."""
+    return await chapter_service.upsert_memo_multi(novel_id, token.id, chapter_memo_batch)
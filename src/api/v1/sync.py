@@ -0,0 +1,31 @@
+"""동기화 API"""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing_extensions import Annotated
+
+from src.api import deps
+from src.domain.auth.schemas import TokenPayload
+from src.domain.sync.service import SyncService
+from src.libs.responses import UserError, get_error_response
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    summary="마지막 동기화 이후 바뀐 서재의 소설, 챕터, 메모를 NDJSON으로 조회합니다.",
+    responses=get_error_response(SyncService.sync_errors, UserError.CREDENTIALS_EXCEPTION),
+)
+async def sync(
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
+    since: Annotated[str | None, Query(description="이전 동기화 응답의 next_token, 없으면 전체를 조회합니다.")] = None,
+) -> StreamingResponse:
+    """마지막 동기화 이후 바뀐 서재(메모를 남긴 소설)의 소설, 챕터, 메모와 삭제된 메모를 조회합니다.
+
+    한 줄에 `{"type": ..., "data": ...}` 하나씩 보내며, 마지막 줄은 다음 요청에 사용할 `next_token`을 담은
+    `end`입니다. `end`를 받지 못했다면 같은 `since`로 다시 요청합니다.
+    """
+    sync_service = SyncService()
+    since_at = sync_service.parse_token(since)
+    return StreamingResponse(sync_service.stream(token.id, since_at), media_type="application/x-ndjson")
@@ -4,13 +4,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Annotated
 
 from src.api import deps
+from src.api.routing import DTORoute
 from src.domain.auth.schemas import TokenPayload
 from src.domain.auth.service import AuthService
+from src.domain.novels.schemas import (
+    NovelRecommendationsDTO,
+    NovelRecommendationsRequest,
+    ReadingPositionsDTO,
+    ReadingPositionsRequest,
+)
+from src.domain.novels.service import NovelService
 from src.domain.users.schemas import UserCreate, UserDTO
 from src.domain.users.service import UserService
-from src.libs.responses import get_error_response
+from src.libs.responses import DTOResponse, UserError, get_error_response
 
-router = APIRouter()
+router = APIRouter(route_class=DTORoute, default_response_class=DTOResponse)
 
 
 async def get_user_service(db: Annotated[AsyncSession, Depends(deps.get_db)]) -> UserService:
@@ -18,6 +26,11 @@ async def get_user_service(db: Annotated[AsyncSession, Depends(deps.get_db)]) ->
     return UserService(db)
 
 
+async def get_novel_service(db: Annotated[AsyncSession, Depends(deps.get_db)]) -> NovelService:
+    """소설 서비스를 반환합니다."""
+    return NovelService(db)
+
+
 async def get_auth_service(db: Annotated[AsyncSession, Depends(deps.get_db)]) -> AuthService:
     """인증 서비스를 반환합니다."""
     return AuthService(db)
@@ -53,6 +66,44 @@ async def get_me(
     return await user_service.get(id=token.id)
 
 
+@router.get(
+    "/me/continue",
+    response_model=ReadingPositionsDTO,
+    summary="이어 읽을 소설 목록을 최근에 읽은 순서로 조회합니다.",
+    responses=get_error_response(NovelService.get_reading_positions_errors, UserError.CREDENTIALS_EXCEPTION),
+)
+async def get_my_reading_positions(
+    novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
+    *,
+    reading_positions_request: Annotated[ReadingPositionsRequest, Depends()],
+) -> ReadingPositionsDTO:
+    """이어 읽을 소설 목록을 최근에 읽은 순서로 조회합니다.
+
+    소설마다 마지막으로 메모를 남긴 챕터 번호와 소설의 최신 챕터 번호를 함께 반환합니다.
+    """
+    return await novel_service.get_reading_positions(token.id, reading_positions_request)
+
+
+@router.get(
+    "/me/recommendations",
+    response_model=NovelRecommendationsDTO,
+    summary="나를 위한 추천 소설을 조회합니다.",
+    responses=get_error_response(UserError.CREDENTIALS_EXCEPTION),
+)
+async def get_my_recommendations(
+    novel_service: Annotated[NovelService, Depends(get_novel_service)],
+    token: Annotated[TokenPayload, Depends(deps.get_token_payload)],
+    *,
+    recommendations_request: Annotated[NovelRecommendationsRequest, Depends()],
+) -> NovelRecommendationsDTO:
+    """내가 평가한 소설과 비슷한 소설을 점수 순서로 조회합니다. 이미 서재에 있는 소설은 제외합니다.
+
+    주기적으로 미리 계산한 결과이며, 계산한 시각을 `computed_at`으로 함께 반환합니다.
+    """
+    return await novel_service.get_recommendations(token.id, recommendations_request)
+
+
 @router.delete(
     "/me",
     status_code=status.HTTP_204_NO_CONTENT,
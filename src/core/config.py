@@ -26,8 +26,68 @@ class CommonSettings(StartSettings):
 
     DB_PATH: PostgresDsn = Field(..., json_schema_extra={"env": "DB_PATH"})
     NOVEL_FETCH_URL: str = Field(..., json_schema_extra={"env": "NOVEL_FETCH_URL"})
+    NOVEL_FETCH_TIMEOUT: float = 30  # 크롤러 호출 마감 시간(초)
+    NOVEL_FETCH_ADVISORY_LOCK: bool = False  # 워커 프로세스 간 중복 크롤링을 advisory lock으로 막을지 여부
+
+    # Novel Job
+    NOVEL_JOB_WORKERS: int = 2  # 워커 프로세스당 소설 등록 작업자 수
+    NOVEL_JOB_QUEUE_SIZE: int = 100  # 모든 워커 프로세스에서 대기할 수 있는 작업 수
+    NOVEL_JOB_POLL_INTERVAL_SECONDS: float = 10  # 작업 추가 메시지를 놓쳤을 때 대기 중인 작업을 확인하는 간격
+    NOVEL_JOB_TIMEOUT_SECONDS: int = 10 * 60  # 이 시간이 지나도록 진행 중인 작업은 작업자가 종료된 것으로 보고 실패 처리
+    NOVEL_JOB_TTL_SECONDS: int = 60 * 60  # 완료된 작업을 보관하는 시간
+    NOVEL_JOB_CLEANUP_INTERVAL_SECONDS: float = 5 * 60  # 오래 진행 중인 작업과 보관 시간이 지난 작업을 정리하는 간격
+
+    # Novel Search
+    NOVEL_SEARCH_INDEX_ENABLED: bool = False  # 소설 목록 요청을 프로세스 내 색인으로 처리할지 여부
+    NOVEL_SEARCH_INDEX_REFRESH_INTERVAL_SECONDS: float = 30 * 60  # 알림으로 반영되지 않은 변경을 위해 색인을 다시 만드는 간격
+
+    # Novel Stats
+    NOVEL_STATS_REFRESH_INTERVAL_SECONDS: float = 5 * 60  # 소설 통계를 다시 계산하여 보정하고 캐시에 반영하는 간격
+    NOVEL_STATS_REFRESH_BATCH_SIZE: int = 500  # 한 트랜잭션에서 다시 계산할 소설 수
+
+    # Novel Rankings
+    NOVEL_RANKING_SIZE: int = 100  # 순위마다 미리 계산해 둘 소설 수
+    NOVEL_RANKING_REFRESH_INTERVAL_SECONDS: float = 60  # 순위 스냅샷을 다시 계산하는 간격
+    NOVEL_RANKING_MIN_STAR_COUNT: int = 10  # 별점 순위에 오르기 위한 최소 별점 개수
+    NOVEL_ACTIVITY_BUCKET_SECONDS: int = 60 * 60  # 인기 순위 활동 수를 모으는 버킷의 길이
+    NOVEL_ACTIVITY_FLUSH_INTERVAL_SECONDS: float = 10  # 워커 프로세스에 모인 활동 수를 DB에 더하는 간격
+
+    # Novel Recommendations
+    NOVEL_RECOMMENDATION_REFRESH_INTERVAL_SECONDS: float = 6 * 60 * 60  # 비슷한 소설과 추천 소설을 다시 계산하는 간격
+    NOVEL_RECOMMENDATION_SIZE: int = 50  # 소설과 사용자마다 저장할 비슷한 소설과 추천 소설 수
+    NOVEL_RECOMMENDATION_BLOCK_SIZE: int = 256  # 한 번에 유사도를 계산할 소설 수, 사용자는 8배씩 계산
+    NOVEL_RECOMMENDATION_FETCH_SIZE: int = 10000  # 메모의 평가를 한 번에 가져올 개수
+    NOVEL_CONTENT_SIMILARITY_REFRESH_INTERVAL_SECONDS: float = 24 * 60 * 60  # 내용이 비슷한 소설을 모두 다시 계산하는 간격
+
+    # Novel Cache
+    NOVEL_CACHE_SIZE: int = 1000  # 워커 프로세스당 캐시할 소설 상세와 챕터 목록 응답 수
+    NOVEL_CACHE_TTL_SECONDS: float = 60  # 무효화 메시지를 놓친 경우에도 이 시간이 지나면 다시 읽음
+
+    # Cache Invalidation
+    INVALIDATION_CHANNEL: str = "novelog_invalidation"  # 워커 간 캐시 무효화에 사용하는 NOTIFY 채널
+
+    # Sync
+    SYNC_OVERLAP_SECONDS: float = 5  # 동기화 토큰을 이 시간만큼 앞당겨, 늦게 커밋된 트랜잭션의 변경도 다음 동기화에 포함
+    SYNC_BATCH_SIZE: int = 500  # 동기화 응답을 만들 때 서버 측 커서로 한 번에 가져올 행 수
+
+    # SQL Instrumentation
+    SQL_STATS_HEADERS: bool = False  # 응답 헤더에 요청이 실행한 SQL 문장 수와 시간, 행 수를 추가할지 여부
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # 한 요청에서 같은 형태의 문장을 이 횟수 이상 실행하면 N+1 후보로 경고
+
+    # HTTP Client
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30
+    HTTP_MAX_CONCURRENCY: int = 10  # 워커당 동시에 진행할 수 있는 외부 요청 수
+    HTTP_TIMEOUT: float = 10
+
+    # Password Hashing
+    PASSWORD_HASH_WORKERS: int = 2  # 워커 프로세스당 bcrypt를 실행할 작업자 수
+    PASSWORD_HASH_MAX_PENDING: int = 32  # 진행 중인 작업을 포함한 최대 대기 작업 수, 넘으면 503을 반환
+    PASSWORD_HASH_USE_PROCESSES: bool = False  # bcrypt는 GIL을 해제하므로 기본값은 스레드 풀
 
     # AUTH
+    TOKEN_CACHE_SIZE: int = 10000  # 워커 프로세스당 캐시할 검증된 토큰 수
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_MINUTES: int
 
@@ -56,6 +116,9 @@ class DevSettings(CommonSettings):
 
     SECRET_KEY: SecretStr = SecretStr("secret")
 
+    # SQL Instrumentation
+    SQL_STATS_HEADERS: bool = True
+
 
 class ProdSettings(CommonSettings):
     """운영환경에서 사용하는 환경변수를 읽어오는 클래스"""
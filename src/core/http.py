@@ -0,0 +1,104 @@
+"""외부 서비스 호출에 사용하는 공용 비동기 HTTP 클라이언트를 정의합니다."""
+import asyncio
+
+import httpx
+
+from src.core.config import settings
+
+__all__ = ("HTTPClient", "http_client")
+
+
+class HTTPClient:
+    """커넥션 풀과 keep-alive를 공유하는 비동기 HTTP 클라이언트입니다.
+
+    앱 lifespan에서 `start`/`close`를 호출하며, 동시에 진행되는 요청 수는
+    세마포어로 제한합니다. 모든 호출에는 대기 시간을 포함한 전체 마감 시간이 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        max_concurrency: int,
+        timeout: float,
+    ):
+        """HTTPClient 생성자
+
+        Args:
+            max_connections (int): 풀의 최대 커넥션 수입니다.
+            max_keepalive_connections (int): 유지할 최대 keep-alive 커넥션 수입니다.
+            keepalive_expiry (float): keep-alive 커넥션 유지 시간(초)입니다.
+            max_concurrency (int): 동시에 진행할 수 있는 최대 요청 수입니다.
+            timeout (float): 기본 마감 시간(초)입니다.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def start(self) -> None:
+        """클라이언트를 생성합니다."""
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self) -> None:
+        """클라이언트를 닫고 커넥션을 정리합니다."""
+        if self._client is None:
+            return
+        await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def request(self, method: str, url: str, *, timeout: float | None = None, **kwargs) -> httpx.Response:
+        """요청을 보냅니다.
+
+        Args:
+            method (str): HTTP 메서드입니다.
+            url (str): 요청 URL입니다.
+            timeout (float, optional): 이번 호출의 마감 시간(초)입니다. Defaults to None.
+            **kwargs: `httpx.AsyncClient.request`에 전달할 인자입니다.
+
+        Raises:
+            httpx.TimeoutException: 마감 시간 안에 응답을 받지 못한 경우 발생합니다.
+
+        Returns:
+            httpx.Response: 응답 객체입니다.
+        """
+        if self._client is None:
+            await self.start()
+        deadline = timeout or self.timeout
+        try:
+            return await asyncio.wait_for(self._send(method, url, deadline, **kwargs), timeout=deadline)
+        except asyncio.TimeoutError as exc:
+            raise httpx.TimeoutException(f"{method} {url} 요청이 {deadline}초 안에 끝나지 않았습니다.") from exc
+
+    async def _send(self, method: str, url: str, timeout: float, **kwargs) -> httpx.Response:
+        """동시 요청 수 제한 안에서 요청을 보냅니다."""
+        async with self._semaphore:
+            return await self._client.request(method, url, timeout=timeout, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET 요청을 보냅니다."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """POST 요청을 보냅니다."""
+        return await self.request("POST", url, **kwargs)
+
+
+http_client = HTTPClient(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    max_concurrency=settings.HTTP_MAX_CONCURRENCY,
+    timeout=settings.HTTP_TIMEOUT,
+)
@@ -0,0 +1,249 @@
+"""워커 프로세스 사이에 캐시 무효화 메시지를 전달하는 PostgreSQL LISTEN/NOTIFY 버스를 정의합니다."""
+import asyncio
+import inspect
+import logging
+from typing import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.libs.metrics import metrics
+
+__all__ = ("InvalidationBus", "invalidation_bus")
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[list[str]], Awaitable[None] | None]
+
+_PENDING_KEY = "pending_invalidations"
+# NOTIFY payload의 최대 크기는 8000바이트입니다.
+_MAX_PAYLOAD_BYTES = 7900
+
+
+def _encode(messages: dict[str, set[str]]) -> list[str]:
+    """`{topic: {key, ...}}`를 한 줄에 `topic:key` 하나씩 담은 payload 목록으로 만듭니다."""
+    payloads, lines, size = [], [], 0
+    for topic, keys in messages.items():
+        for key in sorted(keys):
+            line = f"{topic}:{key}"
+            line_size = len(line.encode("utf-8")) + 1
+            if lines and size + line_size > _MAX_PAYLOAD_BYTES:
+                payloads.append("\n".join(lines))
+                lines, size = [], 0
+            lines.append(line)
+            size += line_size
+    if lines:
+        payloads.append("\n".join(lines))
+    return payloads
+
+
+def _decode(payload: str) -> dict[str, list[str]]:
+    """payload를 `{topic: [key, ...]}`로 되돌립니다."""
+    messages: dict[str, list[str]] = {}
+    for line in payload.splitlines():
+        topic, _, key = line.partition(":")
+        messages.setdefault(topic, []).append(key)
+    return messages
+
+
+class InvalidationBus:
+    """커밋된 쓰기를 모든 워커 프로세스에 알려 프로세스 내 캐시를 무효화합니다.
+
+    CRUD는 `publish`로 세션에 `topic:key` 메시지를 쌓고, 세션이 커밋하기 직전에 한 번의 `pg_notify`로
+    보냅니다. NOTIFY는 트랜잭션이 커밋될 때만 전달되므로 롤백된 쓰기는 알리지 않습니다.
+    커밋한 프로세스는 커밋 직후에, 다른 프로세스는 LISTEN 연결로 메시지를 받아 구독한 함수를 호출합니다.
+
+    LISTEN 연결이 끊긴 동안의 메시지는 잃어버리므로, 다시 연결되면 `on_reset`으로 등록한 함수를 호출합니다.
+    """
+
+    def __init__(self, channel: str, *, reconnect_delay: float = 1, max_reconnect_delay: float = 30):
+        """InvalidationBus 생성자
+
+        Args:
+            channel (str): NOTIFY 채널 이름입니다.
+            reconnect_delay (float, optional): 처음 다시 연결할 때까지 기다리는 시간(초)입니다. Defaults to 1.
+            max_reconnect_delay (float, optional): 다시 연결할 때까지 기다리는 최대 시간(초)입니다. Defaults to 30.
+        """
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._handlers: dict[str, list[Handler]] = {}
+        self._reset_handlers: list[Callable[[], Awaitable[None] | None]] = []
+        self._task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._connected = False
+        self.published = 0
+        self.received = 0
+        self.reconnects = 0
+        self.failures = 0
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        """토픽의 메시지를 받을 함수를 등록합니다.
+
+        Args:
+            topic (str): 토픽 이름입니다.
+            handler (Handler): 메시지의 키 목록을 받는 함수 혹은 코루틴 함수입니다.
+        """
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def on_reset(self, handler: Callable[[], Awaitable[None] | None]) -> None:
+        """메시지를 잃어버렸을 수 있을 때 호출할 함수를 등록합니다.
+
+        Args:
+            handler (Callable[[], Awaitable[None] | None]): 캐시를 모두 비우는 함수 혹은 코루틴 함수입니다.
+        """
+        self._reset_handlers.append(handler)
+
+    def publish(self, db: AsyncSession, topic: str, *keys: object) -> None:
+        """세션이 커밋될 때 보낼 무효화 메시지를 추가합니다. 구독한 함수가 없는 토픽은 무시합니다.
+
+        Args:
+            db (AsyncSession): 쓰기를 수행한 세션입니다.
+            topic (str): 토픽 이름입니다.
+            *keys (object): 무효화할 키입니다. 문자열로 변환하여 보냅니다.
+        """
+        if topic not in self._handlers:
+            return
+        pending: dict[str, set[str]] = db.info.setdefault(_PENDING_KEY, {})
+        pending.setdefault(topic, set()).update(str(key) for key in keys)
+
+    async def start(self) -> None:
+        """LISTEN 연결을 유지하는 작업을 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        """LISTEN 연결을 닫고, 진행 중인 작업을 기다립니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _listen(self) -> None:
+        """LISTEN 연결을 만들고, 끊어지면 다시 연결합니다."""
+        # 엔진과 같은 접속 정보를 사용하도록 SQLAlchemy 방언으로 asyncpg 인자를 만듭니다.
+        url = make_url(str(settings.DB_PATH))
+        connect_args, connect_kwargs = url.get_dialect()().create_connect_args(url)
+        delay = self.reconnect_delay
+        first = True
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(*connect_args, **connect_kwargs)
+                closed = asyncio.get_running_loop().create_future()
+                connection.add_termination_listener(lambda _: closed.done() or closed.set_result(None))
+                await connection.add_listener(self.channel, self._on_notification)
+                self._connected = True
+                delay = self.reconnect_delay
+                if not first:
+                    # 끊어진 동안의 메시지를 알 수 없으므로 캐시를 모두 비웁니다.
+                    self.reconnects += 1
+                    self._dispatch_reset()
+                await closed
+                logger.warning("캐시 무효화 LISTEN 연결이 끊어졌습니다.")
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("캐시 무효화 LISTEN 연결에 실패했습니다. %s", exc)
+            except Exception:  # pylint: disable=broad-except
+                # 예상하지 못한 오류로 작업이 끝나면 이 프로세스의 캐시는 다시 무효화되지 않으므로 계속 다시 연결합니다.
+                self.failures += 1
+                logger.exception("캐시 무효화 LISTEN 연결에서 오류가 발생했습니다.")
+            finally:
+                self._connected = False
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+            first = False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _on_notification(self, _connection, _pid: int, _channel: str, payload: str) -> None:
+        """다른 프로세스(혹은 자신)가 보낸 메시지를 처리합니다."""
+        self.received += 1
+        self.dispatch(_decode(payload))
+
+    def dispatch(self, messages: dict[str, list[str] | set[str]]) -> None:
+        """메시지를 구독한 함수에 전달합니다.
+
+        Args:
+            messages (dict[str, list[str] | set[str]]): 토픽별 키 목록입니다.
+        """
+        for topic, keys in messages.items():
+            for handler in self._handlers.get(topic, ()):
+                self._call(handler, list(keys))
+
+    def _dispatch_reset(self) -> None:
+        """`on_reset`으로 등록한 함수를 호출합니다."""
+        for handler in self._reset_handlers:
+            self._call(handler)
+
+    def _call(self, handler: Callable, *args) -> None:
+        """함수를 호출하고, 코루틴이면 작업으로 실행합니다."""
+        try:
+            result = handler(*args)
+        except Exception:  # pylint: disable=broad-except
+            self.failures += 1
+            logger.exception("캐시 무효화 처리에 실패했습니다.")
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """작업이 끝나면 목록에서 제거하고 예외를 기록합니다."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.failures += 1
+            logger.error("캐시 무효화 처리에 실패했습니다.", exc_info=task.exception())
+
+    def _before_commit(self, session: Session) -> None:
+        """커밋하기 전에 쌓인 메시지를 같은 트랜잭션에서 NOTIFY합니다."""
+        if not (pending := session.info.get(_PENDING_KEY)):
+            return
+        for payload in _encode(pending):
+            session.execute(select(func.pg_notify(self.channel, payload)))
+            self.published += 1
+
+    def _after_commit(self, session: Session) -> None:
+        """커밋한 프로세스의 캐시는 NOTIFY를 기다리지 않고 바로 무효화합니다."""
+        if pending := session.info.pop(_PENDING_KEY, None):
+            self.dispatch(pending)
+
+    def _after_rollback(self, session: Session) -> None:
+        """롤백된 쓰기의 메시지는 버립니다."""
+        session.info.pop(_PENDING_KEY, None)
+
+    def install(self, session_class: type[Session] = Session) -> None:
+        """세션의 커밋과 롤백에 메시지 전송을 연결합니다.
+
+        Args:
+            session_class (type[Session], optional): 이벤트를 등록할 동기 세션 클래스입니다. Defaults to Session.
+        """
+        event.listen(session_class, "before_commit", self._before_commit)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(session_class, "after_rollback", self._after_rollback)
+
+    @property
+    def stats(self) -> dict:
+        """버스 상태를 반환합니다."""
+        return {
+            "connected": self._connected,
+            "topics": sorted(self._handlers),
+            "published": self.published,
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "failures": self.failures,
+            "pending_tasks": len(self._tasks),
+        }
+
+
+invalidation_bus = InvalidationBus(settings.INVALIDATION_CHANNEL)
+invalidation_bus.install()
+metrics.register("invalidation_bus", lambda: invalidation_bus.stats)
@@ -0,0 +1,185 @@
+"""요청마다 실행한 SQL 문장의 수와 시간, 행 수를 모으고 N+1 후보를 찾는 모듈입니다."""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+from src.libs.metrics import metrics
+
+__all__ = ("QueryStats", "QueryTracker", "query_tracker", "assert_max_queries")
+
+logger = logging.getLogger(__name__)
+
+_START_KEY = "query_tracker_start"
+
+_BIND = re.compile(r"\$\d+")
+# IN 목록처럼 값의 개수만큼 늘어나는 bind parameter는 하나로 묶어 같은 형태의 문장으로 봅니다.
+_BIND_LIST = re.compile(r"\?([^,()]*)(?:, \?\1)+")
+
+
+def statement_shape(statement: str) -> str:
+    """bind parameter의 번호와 개수를 지운 문장의 형태를 반환합니다.
+
+    Args:
+        statement (str): 실행한 SQL 문장입니다.
+
+    Returns:
+        str: 문장의 형태입니다.
+
+    Examples:
+        >>> statement_shape("SELECT * FROM novels WHERE id IN ($1::INTEGER, $2::INTEGER) LIMIT $3::INTEGER")
+        'SELECT * FROM novels WHERE id IN (?::INTEGER) LIMIT ?::INTEGER'
+    """
+    return _BIND_LIST.sub(r"?\1", _BIND.sub("?", statement))
+
+
+class QueryStats:
+    """한 범위에서 실행한 SQL 문장의 통계입니다."""
+
+    def __init__(self):
+        """QueryStats 생성자"""
+        self.count = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.shapes: Counter[str] = Counter()
+
+    def add(self, shape: str, duration: float, rows: int) -> None:
+        """실행한 문장 하나를 기록합니다.
+
+        Args:
+            shape (str): 문장의 형태입니다.
+            duration (float): 실행 시간(초)입니다.
+            rows (int): 반환하거나 바꾼 행 수입니다. 서버 측 커서처럼 알 수 없으면 0입니다.
+        """
+        self.count += 1
+        self.duration += duration
+        self.rows += rows
+        self.shapes[shape] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """같은 형태로 `threshold`번 이상 실행한 문장을 반환합니다. 반복문 안의 조회(N+1)일 가능성이 높습니다.
+
+        Args:
+            threshold (int): 최소 실행 횟수입니다.
+
+        Returns:
+            dict[str, int]: 문장의 형태별 실행 횟수입니다.
+        """
+        return {shape: count for shape, count in self.shapes.most_common() if count >= threshold}
+
+    def describe(self) -> str:
+        """통계와 형태별 실행 횟수를 사람이 읽기 좋은 문자열로 반환합니다."""
+        lines = [f"queries={self.count} time={self.duration:.4f}s rows={self.rows}"]
+        lines += [f"  {count}x {shape}" for shape, count in self.shapes.most_common()]
+        return "\n".join(lines)
+
+
+class QueryTracker:
+    """SQLAlchemy 엔진 이벤트로 실행한 문장을 기록합니다.
+
+    `track`으로 연 범위 안에서 실행한 문장은 그 범위의 `QueryStats`에 기록됩니다. 범위는 contextvar로 전달되므로
+    같은 요청의 의존성과 서비스가 실행한 문장이 모두 모이고, 범위가 겹치면 바깥 범위에도 함께 기록됩니다.
+    """
+
+    def __init__(self, *, n_plus_one_threshold: int):
+        """QueryTracker 생성자
+
+        Args:
+            n_plus_one_threshold (int): 한 범위에서 같은 형태의 문장을 이 횟수 이상 실행하면 N+1 후보로 기록합니다.
+        """
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+        self.statements = 0
+        self.duration = 0.0
+        self.n_plus_one = 0
+
+    @contextmanager
+    def track(self) -> Iterator[QueryStats]:
+        """범위 안에서 실행한 문장을 기록합니다.
+
+        Yields:
+            QueryStats: 범위의 통계입니다. 범위가 끝난 뒤에도 읽을 수 있습니다.
+        """
+        stats = QueryStats()
+        token = self._active.set(self._active.get() + (stats,))
+        try:
+            yield stats
+        finally:
+            self._active.reset(token)
+
+    def report(self, label: str, stats: QueryStats) -> None:
+        """범위의 통계를 로그로 남깁니다. N+1 후보가 있으면 경고합니다.
+
+        Args:
+            label (str): 로그에 남길 범위의 이름입니다. 요청이면 메서드와 경로입니다.
+            stats (QueryStats): 범위의 통계입니다.
+        """
+        logger.debug("SQL %s queries=%d time=%.4f rows=%d", label, stats.count, stats.duration, stats.rows)
+        if repeated := stats.repeated(self.n_plus_one_threshold):
+            self.n_plus_one += 1
+            for shape, count in repeated.items():
+                logger.warning("N+1 후보입니다. %s %d회 실행: %s", label, count, shape)
+
+    def install(self, engine_class: type[Engine] = Engine) -> None:
+        """엔진의 문장 실행에 기록을 연결합니다.
+
+        Args:
+            engine_class (type[Engine], optional): 이벤트를 등록할 동기 엔진 클래스입니다. Defaults to Engine.
+        """
+        event.listen(engine_class, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine_class, "after_cursor_execute", self._after_cursor_execute)
+
+    @property
+    def stats(self) -> dict:
+        """프로세스 전체의 기록을 반환합니다."""
+        return {"statements": self.statements, "duration": self.duration, "n_plus_one": self.n_plus_one}
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        """문장의 실행 시작 시각을 연결에 기록합니다."""
+        # pylint: disable=unused-argument,too-many-arguments
+        conn.info[_START_KEY] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        """실행을 마친 문장을 열린 범위마다 기록합니다."""
+        # pylint: disable=unused-argument,too-many-arguments
+        duration = time.perf_counter() - conn.info.pop(_START_KEY, time.perf_counter())
+        self.statements += 1
+        self.duration += duration
+        if active := self._active.get():
+            shape, rows = statement_shape(statement), max(cursor.rowcount, 0)
+            for stats in active:
+                stats.add(shape, duration, rows)
+
+
+query_tracker = QueryTracker(n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD)
+query_tracker.install()
+metrics.register("sql", lambda: query_tracker.stats)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """범위 안에서 실행한 문장이 `limit`개를 넘으면 AssertionError를 발생시키는 테스트 도우미입니다.
+
+    앱과 같은 이벤트 루프에서 요청을 보내면 요청 안에서 실행한 문장이 모두 기록됩니다.
+
+    Args:
+        limit (int): 최대 문장 수입니다.
+
+    Yields:
+        QueryStats: 범위의 통계입니다.
+
+    Examples:
+        >>> with assert_max_queries(2):  # doctest: +SKIP
+        ...     await client.get("/v1/novels/1")
+    """
+    with query_tracker.track() as stats:
+        yield stats
+    if stats.count > limit:
+        raise AssertionError(f"SQL 문장을 {limit}개까지 예상했지만 {stats.count}개를 실행했습니다.\n{stats.describe()}")
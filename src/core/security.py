@@ -1,13 +1,19 @@
 """앱의 보안 관련 유틸리티 함수를 정의합니다."""
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Callable, TypeVar
 
 import bcrypt
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
 from src.core.config import settings
+from src.libs.metrics import metrics
 from src.libs.responses import UserError
 
+T = TypeVar("T")
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/v1/auth/login", auto_error=False)
 
@@ -33,6 +39,109 @@ def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode()
 
 
+class PasswordHasher:
+    """bcrypt 해시와 검증을 이벤트 루프 밖의 작업자 풀에서 실행합니다.
+
+    bcrypt 한 번에 수백 ms의 CPU를 쓰므로 이벤트 루프에서 직접 호출하면 그동안 다른 요청이 모두 멈춥니다.
+    진행 중이거나 대기 중인 작업이 `max_pending`개에 이르면 새 작업은 대기열에 넣지 않고 503으로 거절합니다.
+    """
+
+    def __init__(self, *, workers: int, max_pending: int, use_processes: bool = False):
+        """PasswordHasher 생성자
+
+        Args:
+            workers (int): 작업자 수입니다.
+            max_pending (int): 진행 중인 작업을 포함해 동시에 받을 수 있는 최대 작업 수입니다.
+            use_processes (bool, optional): 스레드 대신 프로세스 풀을 사용할지 여부입니다. Defaults to False.
+        """
+        self.workers = workers
+        self.max_pending = max(max_pending, workers)
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+
+    def start(self) -> None:
+        """작업자 풀을 생성합니다."""
+        if self._executor is not None:
+            return
+        if self.use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hasher")
+
+    async def close(self) -> None:
+        """작업자 풀을 종료합니다."""
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호를 검증합니다. 인자는 `verify_password`와 같습니다."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """비밀번호를 해시합니다. 인자는 `get_password_hash`와 같습니다."""
+        return await self._run(get_password_hash, password)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """작업자 풀에서 함수를 실행합니다.
+
+        Raises:
+            HTTPException: 대기 중인 작업이 가득 찬 경우 발생합니다.
+        """
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise UserError.PASSWORD_HASHER_BUSY.http_exception
+        if self._executor is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func, *args)
+        self._pending += 1
+        # 요청이 취소되어도 이미 실행 중인 bcrypt는 멈추지 않으므로, 기다리던 코루틴이 아니라 작업이 끝날 때 자리를 비웁니다.
+        future.add_done_callback(lambda done: loop.call_soon_threadsafe(self._release, done))
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        """끝난 작업의 자리를 비우고 결과에 따라 개수를 셉니다."""
+        self._pending -= 1
+        if future.cancelled():
+            self._cancelled += 1
+        elif future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    @property
+    def stats(self) -> dict:
+        """작업자 풀의 상태를 반환합니다."""
+        running = min(self._pending, self.workers)
+        return {
+            "executor": "process" if self.use_processes else "thread",
+            "workers": self.workers,
+            "running": running,
+            "queued": self._pending - running,
+            "max_pending": self.max_pending,
+            "utilization": running / self.workers,
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+            "rejected": self._rejected,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    use_processes=settings.PASSWORD_HASH_USE_PROCESSES,
+)
+metrics.register("password_hasher", lambda: password_hasher.stats)
+
+
 def create_jwt_token(data: dict, expires_minutes: int = 15) -> str:
     """JWT 토큰을 생성합니다.
 
@@ -5,7 +5,7 @@ from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
 
-__all__ = ["AsyncSessionLocal"]
+__all__ = ["AsyncSessionLocal", "engine"]
 
 
 engine = create_async_engine(str(settings.DB_PATH), pool_pre_ping=True, echo=settings.DEBUG)
@@ -0,0 +1,92 @@
+"""검증된 토큰 payload를 재사용하기 위한 캐시를 정의합니다."""
+import hashlib
+import time
+
+from src.core.config import settings
+from src.core.invalidation import invalidation_bus
+from src.core.security import decode_jwt_token
+from src.domain.auth.schemas import TokenPayload
+from src.domain.users.crud import USER_TOPIC
+from src.libs.cache import TTLCache
+from src.libs.metrics import metrics
+
+__all__ = ("TokenCache", "token_cache")
+
+
+class TokenCache:
+    """검증한 액세스 토큰의 payload를 토큰이 만료될 때까지 캐시합니다.
+
+    키는 토큰 원문이 아닌 SHA-256 digest이며, 캐시된 `TokenPayload`는 요청 사이에 공유되므로 수정하면 안 됩니다.
+    """
+
+    def __init__(self, maxsize: int):
+        """TokenCache 생성자
+
+        Args:
+            maxsize (int): 최대 토큰 수입니다.
+        """
+        self._cache: TTLCache[bytes, TokenPayload] = TTLCache(maxsize, on_evict=self._forget)
+        self._user_keys: dict[int, set[bytes]] = {}
+
+    def get_payload(self, token: str) -> TokenPayload:
+        """토큰을 검증하고 payload를 반환합니다.
+
+        Args:
+            token (str): JWT 토큰입니다.
+
+        Raises:
+            HTTPException: 토큰이 유효하지 않은 경우 발생합니다.
+
+        Returns:
+            TokenPayload: 토큰 payload입니다.
+        """
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        if (payload := self._cache.get(key)) is not None:
+            return payload
+
+        claims = decode_jwt_token(token)
+        payload = TokenPayload(**claims)
+        if isinstance(exp := claims.get("exp"), (int, float)):
+            self._cache.set(key, payload, ttl=exp - time.time())
+            if key in self._cache:
+                self._user_keys.setdefault(payload.id, set()).add(key)
+        return payload
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자의 모든 토큰을 캐시에서 제거합니다.
+
+        Args:
+            user_id (int): 사용자의 id입니다.
+        """
+        for key in list(self._user_keys.get(user_id, ())):
+            self._cache.pop(key)
+
+    def clear(self) -> None:
+        """모든 토큰을 캐시에서 제거합니다."""
+        self._cache.clear()
+
+    def _forget(self, key: bytes, payload: TokenPayload) -> None:
+        """캐시에서 제거된 토큰을 사용자별 목록에서도 제거합니다."""
+        if keys := self._user_keys.get(payload.id):
+            keys.discard(key)
+            if not keys:
+                del self._user_keys[payload.id]
+
+    @property
+    def stats(self) -> dict:
+        """캐시 상태를 반환합니다."""
+        return {**self._cache.stats, "users": len(self._user_keys)}
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE)
+metrics.register("token_cache", lambda: token_cache.stats)
+
+
+def _invalidate_users(keys: list[str]) -> None:
+    """삭제되거나 바뀐 사용자의 토큰을 캐시에서 제거합니다."""
+    for key in keys:
+        token_cache.invalidate_user(int(key))
+
+
+invalidation_bus.subscribe(USER_TOPIC, _invalidate_users)
+invalidation_bus.on_reset(token_cache.clear)
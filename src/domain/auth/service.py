@@ -3,7 +3,7 @@ from fastapi import Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.core.security import create_jwt_token, decode_jwt_token, verify_password
+from src.core.security import create_jwt_token, decode_jwt_token, password_hasher
 from src.domain.auth.schemas import TokenDTO, TokenPayload
 from src.domain.users.crud import CRUDUser
 from src.libs.responses import UserError
@@ -20,7 +20,7 @@ class AuthService:
         user = await self.crud_user.get(email=email)
         credentials_exception = UserError.LOGIN_FAILED.http_exception
         credentials_exception.headers = {"WWW-Authenticate": "Bearer"}
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await password_hasher.verify(password, user.hashed_password):
             raise credentials_exception
         token_payload = TokenPayload(id=user.id, email=user.email)
         if user.is_admin:
@@ -65,7 +65,7 @@ class AuthService:
     @property
     def login_errors(cls) -> tuple:
         """로그인 관련 에러를 반환합니다."""
-        return (UserError.LOGIN_FAILED,)
+        return (UserError.LOGIN_FAILED, UserError.PASSWORD_HASHER_BUSY)
 
     @classmethod
     @property
@@ -1,13 +1,45 @@
 """CRUD의 베이스 클래스를 정의한 모듈입니다."""
 
 from abc import ABCMeta
-from typing import Generic
+from typing import Any, Generic
 
+from sqlalchemy import ColumnElement, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.base.models import Model
 
-__all__ = ("CRUD",)
+__all__ = ("CRUD", "keyset_condition")
+
+
+def keyset_condition(
+    column: ColumnElement,
+    value: Any,
+    tiebreaker: ColumnElement,
+    tiebreaker_value: Any,
+    desc: bool,
+) -> ColumnElement[bool]:
+    """`ORDER BY column, tiebreaker`로 정렬했을 때 커서 다음에 오는 행의 조건을 반환합니다.
+
+    PostgreSQL의 기본 정렬과 같이 NULL은 내림차순에서 처음, 오름차순에서 마지막에 온다고 가정합니다.
+    tiebreaker는 NULL이 아니고 유일해야 합니다.
+
+    Args:
+        column (ColumnElement): 정렬 기준 컬럼입니다.
+        value (Any): 커서 위치 행의 정렬 기준 값입니다.
+        tiebreaker (ColumnElement): 값이 같을 때 순서를 정하는 컬럼입니다.
+        tiebreaker_value (Any): 커서 위치 행의 tiebreaker 값입니다.
+        desc (bool): 내림차순 여부입니다.
+
+    Returns:
+        ColumnElement[bool]: 조건식입니다.
+    """
+    after_tiebreaker = tiebreaker < tiebreaker_value if desc else tiebreaker > tiebreaker_value
+    if value is None:
+        same_value = and_(column.is_(None), after_tiebreaker)
+        return or_(same_value, column.is_not(None)) if desc else same_value
+    after_value = column < value if desc else column > value
+    condition = or_(after_value, and_(column == value, after_tiebreaker))
+    return condition if desc else or_(condition, column.is_(None))
 
 
 class CRUD(Generic[Model], metaclass=ABCMeta):
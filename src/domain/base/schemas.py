@@ -1,10 +1,18 @@
 """DTO를 담당하는 기본 클래스를 정의합니다."""
 
 from abc import ABC
+from functools import partial
+from typing import Any, Mapping
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, HttpUrl
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+from pydantic_core import Url as CoreUrl
+from typing_extensions import Self
 
-__all__ = ("Base", "DTO")
+__all__ = ("Base", "DTO", "trusted_http_url")
+
+_object_setattr = object.__setattr__
 
 
 class Base(BaseModel, ABC):
@@ -27,3 +35,87 @@ class DTO(Base, ABC):
     def errors(cls) -> tuple:
         """에러 메시지"""
         return ()
+
+    @classmethod
+    def from_trusted(cls, values: Mapping[str, Any]) -> Self:
+        """값을 검증하지 않고 DTO 객체를 만듭니다.
+
+        데이터베이스에서 읽은 행처럼 이미 필드 타입에 맞는 값에만 사용합니다. `model_construct`와 같지만
+        필드별 기본값을 클래스마다 한 번만 계산하고, validator도 실행하지 않습니다. 리스트처럼 변경할 수 있는
+        기본값은 pydantic과 같이 객체마다 새로 만듭니다.
+        필수 필드가 빠져 있으면 `model_validate`로 검증하여 에러를 발생시킵니다.
+
+        Args:
+            values (Mapping[str, Any]): 필드 이름과 값입니다. 필드가 아닌 키는 무시합니다.
+
+        Returns:
+            Self: DTO 객체입니다.
+        """
+        defaults = _field_defaults(cls)
+        data = {}
+        for name, default in defaults.items():
+            if name in values:
+                data[name] = values[name]
+            elif default is PydanticUndefined:
+                return cls.model_validate(values)
+            elif isinstance(default, _DefaultFactory):
+                data[name] = default()
+            else:
+                data[name] = default
+        obj = cls.__new__(cls)
+        _object_setattr(obj, "__dict__", data)
+        _object_setattr(obj, "__pydantic_fields_set__", {name for name in values if name in defaults})
+        _object_setattr(obj, "__pydantic_extra__", None)
+        _object_setattr(obj, "__pydantic_private__", None)
+        return obj
+
+
+class _DefaultFactory(partial):
+    """객체마다 새로 만들어야 하는 필드 기본값입니다."""
+
+
+_FIELD_DEFAULTS: dict[type[DTO], dict[str, Any]] = {}
+
+
+def _field_defaults(cls: type[DTO]) -> dict[str, Any]:
+    """DTO 클래스의 필드별 기본값을 필드 순서대로 반환합니다.
+
+    필수 필드는 PydanticUndefined이고, 변경할 수 있는 기본값과 default_factory는 `_DefaultFactory`입니다.
+    """
+    if (defaults := _FIELD_DEFAULTS.get(cls)) is None:
+        defaults = _FIELD_DEFAULTS[cls] = {name: _field_default(field) for name, field in cls.model_fields.items()}
+    return defaults
+
+
+def _field_default(field: FieldInfo) -> Any:
+    """필드의 기본값을 반환합니다. 해시할 수 있는 값은 변경할 수 없는 값으로 보고 객체끼리 공유합니다."""
+    if field.is_required():
+        return PydanticUndefined
+    if field.default_factory is None:
+        try:
+            hash(field.default)
+            return field.default
+        except TypeError:
+            pass
+    # pydantic과 같이 default_factory를 호출하거나 기본값을 복사합니다.
+    return _DefaultFactory(field.get_default, call_default_factory=True)
+
+
+def trusted_http_url(value: str | None) -> HttpUrl | None:
+    """이미 검증된 URL 문자열로 HttpUrl 객체를 만듭니다.
+
+    `HttpUrl(value)`는 매번 TypeAdapter로 스킴과 길이 제약을 검증합니다. 여기서는 URL 파싱만 하므로
+    결과 문자열은 같지만 제약 조건은 검사하지 않습니다. `HttpUrl`이 클래스인 pydantic 2.10 이상의 내부 구조에
+    의존하므로 requirements에서 pydantic 버전을 고정합니다.
+
+    Args:
+        value (str|None): URL 문자열입니다.
+
+    Returns:
+        HttpUrl|None: HttpUrl 객체입니다.
+    """
+    if value is None:
+        return None
+    url = HttpUrl.__new__(HttpUrl)
+    url._url = CoreUrl(value)  # pylint: disable=protected-access
+    return url
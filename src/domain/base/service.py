@@ -1,5 +1,13 @@
 """서비스 추상화 클래스 모듈입니다."""
+from contextlib import contextmanager
 from functools import singledispatch
+from typing import Iterator
+
+from sqlalchemy.exc import IntegrityError
+
+from src.libs.responses import BaseError
+
+FOREIGN_KEY_VIOLATION = "23503"
 
 
 @singledispatch
@@ -8,3 +16,40 @@ def to_dto(obj: object | None) -> object | None:
     if obj is None:
         return None
     raise NotImplementedError(f"지원하지 않는 타입입니다. type={type(obj)}")
+
+
+def orm_values(obj: object) -> dict:
+    """ORM 객체에 로드된 컬럼 값을 반환합니다.
+
+    instrumented attribute를 거치지 않고 객체의 `__dict__`를 읽으므로, 만료되었거나 로드되지 않은 컬럼은 빠집니다.
+
+    Args:
+        obj (object): ORM 객체입니다.
+
+    Returns:
+        dict: 속성 이름과 값입니다.
+    """
+    values = dict(vars(obj))
+    values.pop("_sa_instance_state", None)
+    return values
+
+
+@contextmanager
+def foreign_key_error(error: BaseError) -> Iterator[None]:
+    """블록 안에서 외래 키 제약 조건 위반이 발생하면 주어진 에러로 바꿉니다.
+
+    쓰기 전에 참조 대상이 있는지 따로 조회하지 않고 데이터베이스의 외래 키 검사를 그대로 사용합니다.
+    예외가 발생한 트랜잭션은 더 이상 사용할 수 없으므로 요청 단위 세션에서만 사용합니다.
+
+    Args:
+        error (BaseError): 외래 키 제약 조건 위반 시 발생시킬 에러입니다.
+
+    Raises:
+        HTTPException: 외래 키 제약 조건 위반이 발생한 경우 발생합니다.
+    """
+    try:
+        yield
+    except IntegrityError as exc:
+        if getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+            raise error.http_exception from exc
+        raise
@@ -0,0 +1,117 @@
+"""소설 상세와 챕터 목록 응답을 재사용하기 위한 캐시를 정의합니다."""
+from typing import Awaitable, Callable, TypeVar
+
+from src.core.config import settings
+from src.core.invalidation import invalidation_bus
+from src.domain.novels.crud import NOVEL_TOPIC
+from src.domain.novels.schemas import ChaptersDTO, ChaptersRequest, NovelDTO
+from src.libs.cache import CacheBackend, MemoryCacheBackend
+from src.libs.conditional import ResourceVersion
+from src.libs.metrics import metrics
+from src.libs.singleflight import SingleFlight
+
+__all__ = ("NovelCache", "novel_cache")
+
+T = TypeVar("T")
+
+
+def _novel_tag(novel_id: int) -> str:
+    """소설에 속한 캐시 항목에 붙이는 태그를 반환합니다."""
+    return f"novel:{novel_id}"
+
+
+class NovelCache:
+    """소설 상세와 챕터 목록을 소설 id 단위로 캐시합니다.
+
+    없는 항목은 저장소에서 읽어 저장하는 read-through 캐시로, 같은 키의 동시 요청은 한 번만 읽습니다.
+    항목에는 소설 id 태그가 붙으므로 소설이나 챕터가 바뀌면 `invalidate`로 한 번에 제거합니다.
+    항목은 불러오기 전에 조회한 리소스 버전과 함께 저장하고, 요청의 버전과 다르면 다시 불러옵니다.
+    무효화 메시지가 없는 변경(통계 갱신 등)도 ETag와 본문이 항상 같은 버전을 가리키게 합니다.
+    캐시된 DTO는 요청 사이에 공유되므로 수정하면 안 됩니다.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        """NovelCache 생성자
+
+        Args:
+            backend (CacheBackend): 캐시 저장소입니다.
+        """
+        self.backend = backend
+        self._flight = SingleFlight()
+        self._invalidations = 0
+
+    async def get_novel(
+        self, novel_id: int, version: ResourceVersion, load: Callable[[], Awaitable[NovelDTO]]
+    ) -> NovelDTO:
+        """소설을 캐시에서 읽거나, 없거나 버전이 다르면 불러와서 저장합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            version (ResourceVersion): 불러오기 전에 조회한 소설의 버전입니다.
+            load (Callable[[], Awaitable[NovelDTO]]): 소설을 불러오는 함수입니다. 발생한 예외는 캐시하지 않습니다.
+
+        Returns:
+            NovelDTO: 소설입니다.
+        """
+        return await self._get(f"novel:{novel_id}", novel_id, version, load)
+
+    async def get_chapters(
+        self,
+        novel_id: int,
+        command: ChaptersRequest,
+        version: ResourceVersion,
+        load: Callable[[], Awaitable[ChaptersDTO]],
+    ) -> ChaptersDTO:
+        """챕터 목록을 캐시에서 읽거나, 없거나 버전이 다르면 불러와서 저장합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            command (ChaptersRequest): 챕터 목록 요청입니다.
+            version (ResourceVersion): 불러오기 전에 조회한 챕터 목록의 버전입니다.
+            load (Callable[[], Awaitable[ChaptersDTO]]): 챕터 목록을 불러오는 함수입니다.
+
+        Returns:
+            ChaptersDTO: 챕터 목록입니다.
+        """
+        return await self._get(f"chapters:{novel_id}:{command.model_dump_json()}", novel_id, version, load)
+
+    async def invalidate(self, *novel_ids: int) -> None:
+        """소설과 챕터 목록 캐시를 제거합니다.
+
+        Args:
+            *novel_ids (int): 소설의 id입니다.
+        """
+        self._invalidations += 1
+        await self.backend.invalidate_tags(*(_novel_tag(novel_id) for novel_id in novel_ids))
+
+    async def clear(self) -> None:
+        """모든 캐시를 제거합니다."""
+        self._invalidations += 1
+        await self.backend.clear()
+
+    async def _get(self, key: str, novel_id: int, version: ResourceVersion, load: Callable[[], Awaitable[T]]) -> T:
+        """캐시에서 읽거나, 없거나 버전이 다르면 불러와서 저장합니다."""
+        if (entry := await self.backend.get(key)) is not None and entry[0] == version.etag:
+            return entry[1]
+
+        async def load_and_set() -> T:
+            invalidations = self._invalidations
+            # 버전을 조회한 뒤에 불러오므로 본문은 버전보다 오래되지 않습니다.
+            value = await load()
+            # 불러오는 동안 무효화가 있었다면 이전 값일 수 있으므로 저장하지 않습니다.
+            if invalidations == self._invalidations:
+                await self.backend.set(key, (version.etag, value), tags=(_novel_tag(novel_id),))
+            return value
+
+        return await self._flight.do(f"{key}:{version.etag}", load_and_set)
+
+    @property
+    def stats(self) -> dict:
+        """캐시 상태를 반환합니다."""
+        return {**self.backend.stats, "loads": self._flight.stats}
+
+
+novel_cache = NovelCache(MemoryCacheBackend(settings.NOVEL_CACHE_SIZE, ttl=settings.NOVEL_CACHE_TTL_SECONDS))
+metrics.register("novel_cache", lambda: novel_cache.stats)
+invalidation_bus.subscribe(NOVEL_TOPIC, lambda keys: novel_cache.invalidate(*map(int, keys)))
+invalidation_bus.on_reset(novel_cache.clear)
@@ -0,0 +1,562 @@
+"""소설 챕터 CRUD 관련 모듈입니다."""
+# pylint: disable=redefined-builtin,too-many-arguments,not-callable
+from datetime import datetime
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy import (
+    CTE,
+    INTEGER,
+    TEXT,
+    ColumnElement,
+    Row,
+    Select,
+    Values,
+    and_,
+    case,
+    column,
+    delete,
+    false,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import BYTEA
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+
+from src.domain.base.crud import CRUD
+from src.domain.novels.crud import add_novel_stats, add_tombstone
+from src.domain.novels.models import Chapter, ChapterMemo, NovelMemo, ReadingPosition
+from src.domain.novels.schemas import ChapterOrder
+
+__all__ = ("CRUDChapter",)
+
+
+class CRUDChapter(CRUD[Chapter]):
+    """소설 챕터 CRUD 클래스
+
+    챕터 메모를 쓰는 메서드는 무효화 메시지를 보내지 않습니다. 메모가 담긴 응답은 캐시하지 않고, 함께 바뀌는
+    소설 통계는 `novel_stats.updated_at`이 소설 버전에 포함되므로 캐시된 소설 상세를 다음 요청에서 다시 불러옵니다.
+    """
+
+    _order_columns = {
+        ChapterOrder.CHAPTER_NO: Chapter.chapter_no,
+    }
+
+    async def get(
+        self,
+        novel_id: int,
+        chapter_no: int,
+    ) -> Chapter | None:
+        """소설 챕터를 조회합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_no (int): 챕터 번호입니다.
+
+        Returns:
+            Chapter|None: 소설 챕터 객체입니다.
+        """
+        stmt = select(Chapter).where(Chapter.novel_id == novel_id, Chapter.chapter_no == chapter_no)
+        return (await self.db.scalars(stmt)).first()
+
+    async def get_multi(
+        self,
+        novel_id: int,
+        *,
+        skip: int = 0,
+        limit: int | None = None,
+        order_by: ChapterOrder = ChapterOrder.CHAPTER_NO,
+        desc: bool = True,
+        after: int | None = None,
+    ) -> Sequence[Chapter]:
+        """소설 챕터 목록을 조회합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            skip (int): 건너뛸 개수입니다. after가 있으면 무시합니다. Defaults to 0.
+            limit (int, optional): 최대 개수입니다. Defaults to None.
+            order_by (ChapterOrder): 정렬 기준입니다. Defaults to ChapterOrder.CHAPTER_NO.
+            desc (bool): 내림차순 여부입니다. Defaults to True.
+            after (int, optional): 이전 페이지 마지막 챕터의 챕터 번호입니다. Defaults to None.
+
+        Returns:
+            Sequence[Chapter]: 소설 챕터 목록입니다.
+        """
+        stmt = self._multi_stmt(
+            select(Chapter), novel_id, skip=skip, limit=limit, order_by=order_by, desc=desc, after=after
+        )
+        return (await self.db.scalars(stmt)).all()
+
+    async def get_multi_with_memo(self, novel_id: int, user_id: int, **kwargs) -> Sequence[Row]:
+        """소설 챕터 목록을 사용자의 챕터 메모와 LEFT JOIN하여 한 번에 조회합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            user_id (int): 사용자의 id입니다.
+            **kwargs: `get_multi`와 같은 목록 조건입니다.
+
+        Returns:
+            Sequence[Row]: `Chapter`와 메모 컬럼(`star`, `modified_at`)을 담은 행 목록입니다.
+        """
+        stmt = select(Chapter, ChapterMemo.star, ChapterMemo.modified_at).outerjoin(
+            ChapterMemo,
+            and_(
+                ChapterMemo.novel_id == Chapter.novel_id,
+                ChapterMemo.chapter_no == Chapter.chapter_no,
+                ChapterMemo.user_id == user_id,
+            ),
+        )
+        return (await self.db.execute(self._multi_stmt(stmt, novel_id, **kwargs))).all()
+
+    def _multi_stmt(
+        self,
+        stmt: Select,
+        novel_id: int,
+        *,
+        skip: int = 0,
+        limit: int | None = None,
+        order_by: ChapterOrder = ChapterOrder.CHAPTER_NO,
+        desc: bool = True,
+        after: int | None = None,
+    ) -> Select:
+        """소설 챕터 목록 조회 문에 정렬과 페이지 조건을 추가합니다. 인자는 `get_multi`와 같습니다."""
+        stmt = stmt.where(Chapter.novel_id == novel_id)
+
+        # 챕터 번호는 소설 안에서 유일하므로 그 자체로 tiebreaker가 됩니다.
+        order_column = self._order_columns.get(order_by, Chapter.chapter_no)
+        if after is not None:
+            stmt = stmt.where(order_column < after if desc else order_column > after)
+        else:
+            stmt = stmt.offset(skip)
+        stmt = stmt.order_by(order_column.desc() if desc else order_column)
+
+        if limit:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    async def get_memo_multi(
+        self,
+        novel_id: int,
+        user_id: int,
+        chapter_nos: Sequence[int] | None = None,
+    ) -> Sequence[ChapterMemo]:
+        """챕터 메모 목록을 조회합니다.
+
+        Args:
+            chapter_ids (list[int]): 챕터의 id 목록입니다.
+            user_id (int): 사용자의 id입니다.
+            chapter_nos (list[int], optional): 챕터 번호 목록입니다. Defaults to None.
+
+        Returns:
+            Sequence[ChapterMemo]: 챕터 메모 목록입니다.
+        """
+        stmt = select(ChapterMemo).where(ChapterMemo.novel_id == novel_id, ChapterMemo.user_id == user_id)
+        if chapter_nos:
+            stmt = stmt.where(ChapterMemo.chapter_no.in_(chapter_nos))
+        return (await self.db.scalars(stmt)).all()
+
+    async def get_memo(
+        self,
+        novel_id: int,
+        chapter_no: int,
+        user_id: int,
+    ) -> ChapterMemo | None:
+        """챕터 메모를 조회합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_no (int): 챕터 번호입니다.
+            user_id (int): 사용자의 id입니다.
+
+        Returns:
+            ChapterMemo|None: 챕터 메모 객체입니다.
+        """
+        stmt = select(ChapterMemo).where(
+            ChapterMemo.novel_id == novel_id, ChapterMemo.chapter_no == chapter_no, ChapterMemo.user_id == user_id
+        )
+        return (await self.db.scalars(stmt)).first()
+
+    async def get_memo_updated_at(
+        self,
+        novel_id: int,
+        chapter_no: int,
+        user_id: int,
+    ) -> datetime | None:
+        """챕터 메모의 수정일을 조회합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_no (int): 챕터 번호입니다.
+            user_id (int): 사용자의 id입니다.
+
+        Returns:
+            datetime|None: 챕터 메모의 수정일입니다. 메모가 없으면 None입니다.
+        """
+        stmt = select(ChapterMemo.updated_at).where(
+            ChapterMemo.novel_id == novel_id, ChapterMemo.chapter_no == chapter_no, ChapterMemo.user_id == user_id
+        )
+        return await self.db.scalar(stmt)
+
+    async def get_multi_version(
+        self,
+        novel_id: int,
+        user_id: int | None = None,
+    ) -> Row:
+        """챕터 목록의 최근 수정일과 개수를 집계합니다. 행을 읽지 않고 조건부 요청의 검증 값을 만들 때 사용합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            user_id (int, optional): 사용자의 id입니다. 지정하면 사용자의 챕터 메모도 함께 집계합니다.
+
+        Returns:
+            Row: `updated_at`, `count`, `memo_updated_at`, `memo_count` 컬럼을 가진 행입니다.
+        """
+        # 집계만 하는 부분 질의는 항상 한 행을 반환하므로 서로 결합해도 한 행입니다.
+        chapters = (
+            select(func.max(Chapter.updated_at).label("updated_at"), func.count().label("count"))
+            .where(Chapter.novel_id == novel_id)
+            .subquery("chapters")
+        )
+        if user_id is None:
+            stmt = select(chapters, null().label("memo_updated_at"), literal(0).label("memo_count"))
+        else:
+            memos = (
+                select(func.max(ChapterMemo.updated_at).label("memo_updated_at"), func.count().label("memo_count"))
+                .where(ChapterMemo.novel_id == novel_id, ChapterMemo.user_id == user_id)
+                .subquery("memos")
+            )
+            stmt = select(chapters, memos).join_from(chapters, memos, true())
+        return (await self.db.execute(stmt)).one()
+
+    async def create_memo(
+        self,
+        novel_id: int,
+        chapter_no: int,
+        user_id: int,
+        content: str = None,
+        star: int = None,
+    ) -> ChapterMemo | None:
+        """챕터 메모를 생성합니다.
+
+        소설 메모의 별점 합계와 개수, 진행 비트맵과 이어 읽기 위치도 같은 문장에서 함께 갱신합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_no (int): 챕터 번호입니다.
+            user_id (int): 사용자의 id입니다.
+            content (str, optional): 메모 내용입니다.
+            star (int, optional): 별점입니다.
+
+        Returns:
+            ChapterMemo|None: 챕터 메모 객체입니다. 이미 메모가 있으면 None입니다.
+        """
+        table = ChapterMemo.__table__
+        memo = (
+            pg_insert(table)
+            .values(
+                novel_id=novel_id,
+                chapter_no=chapter_no,
+                user_id=user_id,
+                content=content,
+                star=star,
+                created_at=func.now(),
+                updated_at=func.now(),
+            )
+            .on_conflict_do_nothing(index_elements=[table.c.novel_id, table.c.chapter_no, table.c.user_id])
+            .returning(*table.c)
+            .cte("memo")
+        )
+        aggregate = _add_memo_aggregate(
+            memo, func.coalesce(memo.c.star, 0), _is_rated(memo.c.star), memo.c.star.is_not(None), read=literal(1)
+        )
+        return await self._select_memo(memo, aggregate, add_novel_stats(aggregate), _add_reading_position(memo))
+
+    async def update_memo(
+        self,
+        novel_id: int,
+        chapter_no: int,
+        user_id: int,
+        content: str | None = None,
+        star: int | None = None,
+    ) -> ChapterMemo | None:
+        """챕터 메모를 수정합니다.
+
+        별점이 바뀌면 이전 별점과의 차이만큼 소설 메모의 별점 합계와 개수를 같은 문장에서 갱신합니다.
+        이어 읽기 위치도 이 챕터로 옮깁니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_no (int): 챕터 번호입니다.
+            user_id (int): 사용자의 id입니다.
+            content (str, optional): 메모 내용입니다. Defaults to None.
+            star (int, optional): 별점입니다. Defaults to None.
+
+        Returns:
+            ChapterMemo: 챕터 메모 객체입니다.
+        """
+        table = ChapterMemo.__table__
+        # 수정 전 별점을 읽는 동시에 행을 잠가 동시 수정 시에도 차이를 정확히 계산합니다.
+        old = (
+            select(table.c.novel_id, table.c.chapter_no, table.c.user_id, table.c.star)
+            .where(table.c.novel_id == novel_id, table.c.chapter_no == chapter_no, table.c.user_id == user_id)
+            .with_for_update()
+            .subquery("old")
+        )
+        values = {"content_updated_at": func.now()}
+        if content is not None:
+            values["content"] = content
+        if star is not None:
+            values["star"] = star
+        memo = (
+            update(table)
+            .where(
+                table.c.novel_id == old.c.novel_id,
+                table.c.chapter_no == old.c.chapter_no,
+                table.c.user_id == old.c.user_id,
+            )
+            .values(values)
+            .returning(*table.c, old.c.star.label("old_star"))
+            .cte("memo")
+        )
+        aggregate = _add_memo_aggregate(
+            memo,
+            func.coalesce(memo.c.star, 0) - func.coalesce(memo.c.old_star, 0),
+            _is_rated(memo.c.star) - _is_rated(memo.c.old_star),
+            memo.c.star.is_distinct_from(memo.c.old_star),
+        )
+        return await self._select_memo(memo, aggregate, add_novel_stats(aggregate), _add_reading_position(memo))
+
+    async def get_chapter_nos(self, novel_id: int, chapter_nos: Sequence[int]) -> set[int]:
+        """주어진 챕터 번호 중 존재하는 챕터 번호를 조회합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_nos (Sequence[int]): 챕터 번호 목록입니다.
+
+        Returns:
+            set[int]: 존재하는 챕터 번호입니다.
+        """
+        stmt = select(Chapter.chapter_no).where(Chapter.novel_id == novel_id, Chapter.chapter_no.in_(chapter_nos))
+        return set((await self.db.scalars(stmt)).all())
+
+    async def upsert_memo_multi(
+        self,
+        novel_id: int,
+        user_id: int,
+        memos: Sequence[Mapping[str, Any]],
+    ) -> Sequence[ChapterMemo]:
+        """한 소설의 챕터 메모 여러 개를 한 번에 생성하거나 덮어씁니다.
+
+        여러 행을 한 문장으로 upsert하고, 수정 전 별점과의 차이와 새로 생긴 메모를 모아 소설 메모의 별점 합계와
+        개수, 진행 비트맵을 한 번만 갱신합니다. 이어 읽기 위치는 가장 뒤 챕터로 옮깁니다. 챕터 번호는 서로 달라야 합니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            user_id (int): 사용자의 id입니다.
+            memos (Sequence[Mapping[str, Any]]): `chapter_no`, `content`, `star` 키를 가진 메모 목록입니다.
+
+        Returns:
+            Sequence[ChapterMemo]: 챕터 번호 순으로 정렬된 챕터 메모 목록입니다.
+        """
+        table = ChapterMemo.__table__
+        new = Values(column("chapter_no", INTEGER), column("content", TEXT), column("star", INTEGER), name="new").data(
+            [(memo["chapter_no"], memo["content"], memo["star"]) for memo in memos]
+        )
+        # 수정 전 별점을 읽는 동시에 행을 잠가 동시 수정 시에도 차이를 정확히 계산합니다.
+        old = (
+            select(table.c.chapter_no, table.c.star)
+            .where(
+                table.c.novel_id == novel_id,
+                table.c.user_id == user_id,
+                table.c.chapter_no.in_([memo["chapter_no"] for memo in memos]),
+            )
+            .with_for_update()
+            .cte("old")
+        )
+        # `old`를 조인하여 행을 잠근 뒤에 쓰도록 합니다.
+        stmt = pg_insert(table).from_select(
+            ["novel_id", "chapter_no", "user_id", "content", "star", "created_at", "updated_at"],
+            select(
+                literal(novel_id), new.c.chapter_no, literal(user_id), new.c.content, new.c.star, func.now(), func.now()
+            ).select_from(new.outerjoin(old, old.c.chapter_no == new.c.chapter_no)),
+        )
+        memo = (
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.novel_id, table.c.chapter_no, table.c.user_id],
+                set_={
+                    "content": stmt.excluded.content,
+                    "star": stmt.excluded.star,
+                    "content_updated_at": func.now(),
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(*table.c)
+            .cte("memo")
+        )
+        changed = (
+            select(
+                memo.c.novel_id,
+                memo.c.user_id,
+                memo.c.chapter_no,
+                memo.c.star,
+                old.c.star.label("old_star"),
+                case((old.c.chapter_no.is_(None), 1), else_=0).label("read"),
+            )
+            .select_from(memo.outerjoin(old, old.c.chapter_no == memo.c.chapter_no))
+            .cte("changed")
+        )
+        aggregate = _add_memo_aggregate(
+            changed,
+            func.coalesce(changed.c.star, 0) - func.coalesce(changed.c.old_star, 0),
+            _is_rated(changed.c.star) - _is_rated(changed.c.old_star),
+            changed.c.star.is_distinct_from(changed.c.old_star),
+            read=changed.c.read,
+        )
+        stmt = (
+            select(aliased(ChapterMemo, memo))
+            .add_cte(aggregate, add_novel_stats(aggregate), _add_reading_position(memo))
+            .order_by(memo.c.chapter_no)
+            .execution_options(populate_existing=True)
+        )
+        return (await self.db.scalars(stmt)).all()
+
+    async def delete_memo(
+        self,
+        novel_id: int,
+        chapter_no: int,
+        user_id: int,
+    ) -> ChapterMemo:
+        """챕터 메모를 삭제합니다.
+
+        삭제한 메모의 별점과 진행 비트맵의 비트를 소설 메모에서 빼고, 동기화를 위한 삭제 기록을 같은 문장으로 남깁니다.
+
+        Args:
+            novel_id (int): 소설의 id입니다.
+            chapter_no (int): 챕터 번호입니다.
+            user_id (int): 사용자의 id입니다.
+
+        Returns:
+            ChapterMemo: 챕터 메모 객체입니다.
+        """
+        table = ChapterMemo.__table__
+        memo = (
+            delete(table)
+            .where(table.c.novel_id == novel_id, table.c.chapter_no == chapter_no, table.c.user_id == user_id)
+            .returning(*table.c)
+            .cte("memo")
+        )
+        aggregate = _add_memo_aggregate(
+            memo,
+            -func.coalesce(memo.c.star, 0),
+            -_is_rated(memo.c.star),
+            memo.c.star.is_not(None),
+            read=literal(-1),
+        )
+        return await self._select_memo(
+            memo, aggregate, add_novel_stats(aggregate), add_tombstone(memo, memo.c.chapter_no)
+        )
+
+    async def _select_memo(self, memo: CTE, *ctes: CTE) -> ChapterMemo | None:
+        """챕터 메모를 변경하는 CTE와 별점 집계 등 함께 실행할 CTE를 한 문장으로 실행하고 변경된 메모를 반환합니다."""
+        stmt = select(aliased(ChapterMemo, memo)).add_cte(*ctes).execution_options(populate_existing=True)
+        return (await self.db.scalars(stmt)).first()
+
+
+def _is_rated(star: ColumnElement[int]) -> ColumnElement[int]:
+    """별점이 있으면 1, 없으면 0인 식을 반환합니다."""
+    return case((star.is_(None), 0), else_=1)
+
+
+def _add_memo_aggregate(
+    memo: CTE,
+    star_sum: ColumnElement[int],
+    star_count: ColumnElement[int],
+    condition: ColumnElement[bool],
+    read: ColumnElement[int] | None = None,
+) -> CTE:
+    """챕터 메모 변경분을 소설 메모의 별점 합계와 개수, 진행 비트맵에 반영하는 CTE를 반환합니다.
+
+    변경된 챕터 메모가 여러 개이면 소설 메모별로 합산하여 한 번만 갱신합니다.
+    `average_star`는 두 컬럼에서 계산되는 생성 컬럼이므로 따로 갱신하지 않습니다.
+
+    Args:
+        memo (CTE): 변경된 챕터 메모를 반환하는 CTE입니다. `novel_id`, `user_id`, `chapter_no` 컬럼이 있어야 합니다.
+        star_sum (ColumnElement[int]): 챕터 메모 하나의 별점 합계 변화량입니다.
+        star_count (ColumnElement[int]): 챕터 메모 하나의 별점 개수 변화량입니다.
+        condition (ColumnElement[bool]): 별점이 바뀐 경우에만 참인 조건입니다.
+        read (ColumnElement[int], optional): 챕터 메모가 새로 생겼으면 1, 삭제되었으면 -1, 아니면 0인 식입니다.
+            None이면 진행 비트맵은 바꾸지 않습니다. Defaults to None.
+
+    Returns:
+        CTE: 소설 메모를 upsert하는 CTE입니다.
+    """
+    # INSERT ... SELECT에는 Python 쪽 기본값이 적용되지 않으므로 기본값을 직접 넣습니다.
+    table = NovelMemo.__table__
+    columns = ["novel_id", "user_id", "star_sum", "star_count", "is_favorite", "created_at", "updated_at"]
+    select_columns = [
+        memo.c.novel_id,
+        memo.c.user_id,
+        func.sum(star_sum),
+        func.sum(star_count),
+        false(),
+        func.now(),
+        func.now(),
+    ]
+    set_ = {}
+    if read is not None:
+        condition = or_(condition, read != 0)
+        added = func.array_agg(memo.c.chapter_no).filter(read > 0)
+        removed = func.array_agg(memo.c.chapter_no).filter(read < 0)
+        columns.append("progress")
+        select_columns.append(func.progress_update(literal(b"", BYTEA), added, removed))
+        # 이미 있는 소설 메모의 비트맵에는 같은 변경분을 다시 모아서 적용합니다.
+        same_memo = (memo.c.novel_id == table.c.novel_id, memo.c.user_id == table.c.user_id)
+        set_["progress"] = func.progress_update(
+            table.c.progress,
+            select(added).where(*same_memo).scalar_subquery(),
+            select(removed).where(*same_memo).scalar_subquery(),
+        )
+    stmt = pg_insert(table).from_select(
+        columns,
+        select(*select_columns).where(condition).group_by(memo.c.novel_id, memo.c.user_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.novel_id, table.c.user_id],
+        set_={
+            "star_sum": table.c.star_sum + stmt.excluded.star_sum,
+            "star_count": table.c.star_count + stmt.excluded.star_count,
+            **set_,
+            "updated_at": func.now(),
+        },
+    )
+    # 소설 통계에 반영할 수 있도록 갱신된 집계를 반환합니다.
+    stmt = stmt.returning(table.c.novel_id, table.c.user_id, table.c.is_favorite, table.c.star_sum, table.c.star_count)
+    return stmt.cte("memo_aggregate")
+
+
+def _add_reading_position(memo: CTE) -> CTE:
+    """쓴 챕터 메모 중 소설마다 가장 뒤 챕터를 이어 읽기 위치로 저장하는 CTE를 반환합니다.
+
+    Args:
+        memo (CTE): 생성되거나 수정된 챕터 메모를 반환하는 CTE입니다.
+
+    Returns:
+        CTE: 이어 읽기 위치를 upsert하는 CTE입니다.
+    """
+    table = ReadingPosition.__table__
+    stmt = pg_insert(table).from_select(
+        ["user_id", "novel_id", "chapter_no", "created_at", "updated_at"],
+        select(memo.c.user_id, memo.c.novel_id, func.max(memo.c.chapter_no), func.now(), func.now()).group_by(
+            memo.c.user_id, memo.c.novel_id
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.novel_id],
+        set_={"chapter_no": stmt.excluded.chapter_no, "updated_at": func.now()},
+    )
+    return stmt.cte("reading_position")
@@ -0,0 +1,198 @@
+"""소설 제목과 설명의 TF-IDF 벡터로 같은 카테고리의 비슷한 소설을 찾는 프로세스 내 색인을 정의합니다."""
+from array import array
+from collections import Counter
+from typing import Iterable, Iterator
+
+import numpy as np
+from scipy import sparse
+
+from src.domain.novels.recommendations import TopK, similar_novels
+from src.domain.novels.search import normalize
+
+__all__ = ("NovelContentIndex", "terms")
+
+# 제목은 설명보다 짧지만 소설을 더 잘 나타내므로 제목의 n-gram은 여러 번 센 것으로 봅니다.
+_TITLE_WEIGHT = 3
+# 이 비율보다 많은 소설에 나오는 n-gram은 조사나 어미처럼 구별력이 없으므로 무시합니다.
+_MAX_DF_RATIO = 0.5
+
+
+def terms(title: str, description: str) -> Counter:
+    """제목과 설명의 단어마다 음절 2-gram을 세어 반환합니다.
+
+    검색 색인과 같은 방식으로 정규화하되, 거의 모든 소설에 나오는 1-gram은 빼고 한 음절 단어만 그대로 셉니다.
+    단어 경계를 넘는 2-gram은 만들지 않습니다.
+
+    Args:
+        title (str): 제목입니다.
+        description (str): 설명입니다.
+
+    Returns:
+        Counter: n-gram별 개수입니다.
+    """
+    counts = Counter()
+    for text, weight in ((title, _TITLE_WEIGHT), (description, 1)):
+        grams = []
+        for word in normalize(text).split():
+            grams.extend([word[i : i + 2] for i in range(len(word) - 1)] or [word])
+        for gram, count in Counter(grams).items():
+            counts[gram] += count * weight
+    return counts
+
+
+class _Documents:
+    """한 카테고리의 소설별 n-gram 개수를 CSR 형식의 배열에 한 행씩 쌓습니다."""
+
+    def __init__(self):
+        self.ids = array("i")
+        self.indptr = array("q", [0])
+        self.indices = array("i")
+        self.counts = array("f")
+        self._matrix: sparse.csr_matrix | None = None
+
+    def append(self, novel_id: int, counts: dict[int, int]) -> None:
+        """소설 하나의 n-gram 번호별 개수를 추가합니다."""
+        self.ids.append(novel_id)
+        self.indices.extend(counts.keys())
+        self.counts.extend(counts.values())
+        self.indptr.append(len(self.indices))
+
+    def matrix(self, idf: np.ndarray) -> sparse.csr_matrix:
+        """행마다 L2 정규화한 TF-IDF 행렬을 반환합니다.
+
+        계산한 행렬은 캐시하고, 다음에는 그 뒤에 추가한 행만 계산하여 덧붙입니다. 이미 계산한 행은 IDF가 바뀌어도
+        다시 계산하지 않습니다.
+        """
+        if self._matrix is None:
+            self._matrix = self._rows(idf, 0)
+        elif (start := self._matrix.shape[0]) < len(self.ids):
+            self._matrix.resize((start, len(idf)))
+            self._matrix = sparse.vstack([self._matrix, self._rows(idf, start)], format="csr")
+        return self._matrix
+
+    def _rows(self, idf: np.ndarray, start: int) -> sparse.csr_matrix:
+        """`start`번째 행부터 행마다 L2 정규화한 TF-IDF 행렬을 반환합니다. 배열을 복사하므로 이후의 추가와 상관없습니다."""
+        begin, end = self.indptr[start], self.indptr[-1]
+        indices = np.array(self.indices[begin:end], dtype=np.int32)
+        data = (1 + np.log(np.array(self.counts[begin:end], dtype=np.float32))) * idf[indices]
+        indptr = np.array(self.indptr[start:], dtype=np.int64) - begin
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(self.ids) - start, len(idf)))
+        matrix.eliminate_zeros()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        return (sparse.diags(1 / np.where(norms > 0, norms, 1), format="csr") @ matrix).tocsr()
+
+
+class NovelContentIndex:
+    """소설 제목과 설명의 TF-IDF 벡터를 카테고리별로 모아둔 색인입니다.
+
+    n-gram의 IDF는 처음 계산할 때 고정하고, 카테고리별로 정규화한 행렬도 캐시하므로 소설을 추가하면 새 행만 계산합니다.
+    이후 추가한 소설로 바뀐 문서 빈도는 `clear`로 비우고 다시 만드는 주기적인 전체 재계산에서 반영합니다.
+    """
+
+    def __init__(self):
+        self._vocabulary: dict[str, int] = {}
+        self._df = array("i")
+        self._categories: dict[str, _Documents] = {}
+        self._positions: dict[int, tuple[str, int]] = {}
+        self._idf: np.ndarray | None = None
+        self.last_id = 0  # 색인에 추가한 가장 큰 소설 id
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, novel_id: int) -> bool:
+        return novel_id in self._positions
+
+    @property
+    def stats(self) -> dict:
+        """색인의 상태를 반환합니다."""
+        return {"novels": len(self), "terms": len(self._vocabulary), "categories": len(self._categories)}
+
+    def clear(self) -> None:
+        """색인을 비웁니다."""
+        self._vocabulary = {}
+        self._df = array("i")
+        self._categories = {}
+        self._positions = {}
+        self._idf = None
+        self.last_id = 0
+
+    def add(self, novel_id: int, category: str, title: str, description: str | None) -> None:
+        """소설을 색인에 추가합니다. 이미 있으면 무시합니다.
+
+        Args:
+            novel_id (int): 소설 id입니다.
+            category (str): 카테고리입니다. 같은 카테고리의 소설끼리만 비교합니다.
+            title (str): 제목입니다.
+            description (str|None): 설명입니다.
+        """
+        if novel_id in self._positions:
+            return
+        counts = {}
+        for term, count in terms(title, description or "").items():
+            if (index := self._vocabulary.get(term)) is None:
+                index = self._vocabulary[term] = len(self._df)
+                self._df.append(0)
+            self._df[index] += 1
+            counts[index] = count
+        documents = self._categories.setdefault(category, _Documents())
+        self._positions[novel_id] = (category, len(documents.ids))
+        documents.append(novel_id, counts)
+        self.last_id = max(self.last_id, novel_id)
+
+    def add_many(self, novels: Iterable[tuple[int, str, str, str | None]]) -> None:
+        """여러 소설을 색인에 추가합니다.
+
+        Args:
+            novels (Iterable[tuple[int, str, str, str|None]]): `add`의 인자 목록입니다.
+        """
+        for novel in novels:
+            self.add(*novel)
+
+    def neighbors(self, novel_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """같은 카테고리의 다른 소설과의 코사인 유사도를 계산합니다.
+
+        Args:
+            novel_id (int): 색인에 있는 소설 id입니다.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 유사도가 양수인 소설 id와 유사도입니다. 유사도 내림차순입니다.
+        """
+        category, row = self._positions[novel_id]
+        documents = self._categories[category]
+        matrix = documents.matrix(self._frozen_idf())
+        scores = (matrix @ matrix[row].T).toarray().ravel()
+        scores[row] = 0
+        order = np.argsort(-scores, kind="stable")
+        order = order[scores[order] > 0]
+        return np.array(documents.ids, dtype=np.int32)[order], scores[order]
+
+    def similar(self, k: int, block_size: int) -> Iterator[TopK]:
+        """카테고리마다 모든 소설의 비슷한 소설 k개를 블록 단위로 계산합니다.
+
+        Args:
+            k (int): 소설마다 남길 비슷한 소설 수입니다.
+            block_size (int): 한 번에 계산할 소설 수입니다.
+
+        Yields:
+            TopK: 행과 열이 소설 id인 블록입니다.
+        """
+        idf = self._frozen_idf()
+        for documents in self._categories.values():
+            ids = np.array(documents.ids, dtype=np.int32)
+            # `similar_novels`는 열끼리 비교하므로 소설이 열이 되도록 전치합니다.
+            for top in similar_novels(documents.matrix(idf).T.tocsr(), k, block_size):
+                yield top._replace(rows=ids[top.rows], cols=ids[top.cols])
+
+    def _frozen_idf(self) -> np.ndarray:
+        """n-gram 번호별 IDF를 반환합니다. 이미 계산한 n-gram은 처음 계산한 값을, 새 n-gram은 지금 계산한 값을 씁니다."""
+        if self._idf is None or len(self._idf) < len(self._df):
+            idf = self._compute_idf()
+            self._idf = idf if self._idf is None else np.concatenate([self._idf, idf[len(self._idf) :]])
+        return self._idf
+
+    def _compute_idf(self) -> np.ndarray:
+        """지금의 문서 빈도로 n-gram 번호별 IDF를 계산합니다. 무시할 n-gram은 0입니다."""
+        df = np.array(self._df, dtype=np.float32)
+        idf = np.log((1 + len(self)) / (1 + df)) + 1
+        return np.where(df > len(self) * _MAX_DF_RATIO, 0, idf).astype(np.float32)
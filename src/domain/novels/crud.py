@@ -1,19 +1,48 @@
 """소설 CRUD 관련 모듈입니다."""
-# pylint: disable=redefined-builtin,too-many-arguments
-from datetime import datetime, timezone
-
-from sqlalchemy import func, or_, select
-from typing_extensions import Sequence
+# pylint: disable=redefined-builtin,too-many-arguments,not-callable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    case,
+    column,
+    delete,
+    false,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import InstrumentedAttribute, aliased, contains_eager
+from typing_extensions import AsyncIterator, Sequence
 
-from src.domain.base.crud import CRUD
-from src.domain.novels.models import Chapter, ChapterMemo, Novel, NovelCategory, NovelMemo
-from src.domain.novels.schemas import ChapterOrder, NovelCategoryFilter, NovelFilter, NovelOrder, Platform
+from src.core.invalidation import invalidation_bus
+from src.domain.base.crud import CRUD, keyset_condition
+from src.domain.novels.models import Chapter, Novel, NovelCategory, NovelMemo, NovelStats, ReadingPosition
+from src.domain.novels.schemas import NovelCategoryFilter, NovelFilter, NovelOrder, Platform
+from src.domain.sync.models import MemoTombstone
 
 __all__ = (
     "CRUDNovel",
-    "CRUDChapter",
+    "NOVEL_TOPIC",
+    "add_novel_stats",
+    "add_tombstone",
 )
 
+# 캐시 무효화 토픽입니다. 소설과 그 챕터의 변경을 소설 id를 키로 알립니다.
+NOVEL_TOPIC = "novel"
+
 
 class CRUDNovel(CRUD[Novel]):
     """소설 CRUD 클래스"""
@@ -39,6 +68,13 @@ class CRUDNovel(CRUD[Novel]):
         NovelOrder.LAST_UPDATED_AT: Novel.last_updated_at,
     }
 
+    # 크롤러가 추가한 소설은 주기적인 재계산 전까지 통계 행이 없으므로, 외부 JOIN하고 없는 통계는 테이블 기본값인 0으로 봅니다.
+    _stats_order_columns = {
+        NovelOrder.READER_COUNT: func.coalesce(NovelStats.reader_count, 0),
+        NovelOrder.FAVORITE_COUNT: func.coalesce(NovelStats.favorite_count, 0),
+        NovelOrder.AVERAGE_STAR: func.coalesce(NovelStats.average_star, 0),
+    }
+
     async def get(
         self,
         id: int,
@@ -54,6 +90,36 @@ class CRUDNovel(CRUD[Novel]):
         stmt = select(Novel).where(Novel.id == id)
         return (await self.db.scalars(stmt)).first()
 
+    async def get_updated_at(
+        self,
+        id: int,
+    ) -> datetime | None:
+        """소설과 소설 통계 중 최근 수정일을 조회합니다.
+
+        Args:
+            id (int): 소설의 id입니다.
+
+        Returns:
+            datetime|None: 소설의 수정일입니다. 소설이 없으면 None입니다.
+        """
+        stmt = (
+            select(func.greatest(Novel.updated_at, NovelStats.updated_at))
+            .outerjoin(NovelStats, NovelStats.novel_id == Novel.id)
+            .where(Novel.id == id)
+        )
+        return await self.db.scalar(stmt)
+
+    async def get_multi_by_ids(self, ids: Sequence[int]) -> Sequence[Novel]:
+        """id로 소설 여러 개를 조회합니다.
+
+        Args:
+            ids (Sequence[int]): 소설의 id 목록입니다.
+
+        Returns:
+            Sequence[Novel]: 소설 목록입니다. 없는 소설은 빠집니다.
+        """
+        return (await self.db.scalars(select(Novel).where(Novel.id.in_(ids)))).all()
+
     async def get_by_platform_id(
         self,
         platform: Platform,
@@ -70,6 +136,39 @@ class CRUDNovel(CRUD[Novel]):
         stmt = select(Novel).where(getattr(Novel, f"{platform}_id") == platform_id)
         return (await self.db.scalars(stmt)).first()
 
+    async def lock_platform_id(
+        self,
+        platform: Platform,
+        platform_id: str,
+    ) -> None:
+        """플랫폼의 소설 아이디에 대한 트랜잭션 advisory lock을 획득합니다.
+
+        lock은 현재 트랜잭션이 끝날 때 해제됩니다.
+
+        Args:
+            platform (Platform): 소설 플랫폼입니다.
+            platform_id (str): 플랫폼의 소설 아이디입니다. 아이디를 모르면 소설 URL입니다.
+        """
+        await self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"novels:{platform}:{platform_id}"))))
+
+    async def stream_all(
+        self,
+        batch_size: int = 1000,
+        after: int = 0,
+    ) -> AsyncIterator[Novel]:
+        """모든 소설을 서버 측 커서로 나누어 조회합니다.
+
+        Args:
+            batch_size (int): 한 번에 가져올 개수입니다. Defaults to 1000.
+            after (int): 이 id보다 큰 소설만 조회합니다. Defaults to 0.
+
+        Yields:
+            Novel: 소설 객체입니다.
+        """
+        stmt = select(Novel).where(Novel.id > after).order_by(Novel.id).execution_options(yield_per=batch_size)
+        async for novel in await self.db.stream_scalars(stmt):
+            yield novel
+
     async def get_multi(
         self,
         *,
@@ -80,404 +179,487 @@ class CRUDNovel(CRUD[Novel]):
         category: NovelCategoryFilter = NovelCategoryFilter.ALL,
         order_by: NovelOrder = NovelOrder.LAST_UPDATED_AT,
         desc: bool = True,
+        after: tuple[Any, int] | None = None,
     ) -> Sequence[Novel]:
         """소설 목록을 조회합니다.
 
         Args:
-            skip (int): 건너뛸 개수입니다. Defaults to 0.
+            skip (int): 건너뛸 개수입니다. after가 있으면 무시합니다. Defaults to 0.
             limit (int, optional): 최대 개수입니다. Defaults to None.
             query (str, optional): 검색어입니다. Defaults to None.
             filter_by (NovelFilter): 필터 기준입니다. Defaults to NovelFilter.ALL.
+            category (NovelCategoryFilter): 카테고리 필터입니다. Defaults to NovelCategoryFilter.ALL.
             order_by (NovelOrder): 정렬 기준입니다. Defaults to NovelOrder.LAST_UPDATED_AT.
             desc (bool): 내림차순 여부입니다. Defaults to True.
+            after (tuple[Any, int], optional): 이전 페이지 마지막 소설의 (정렬 기준 값, id)입니다. Defaults to None.
 
         Returns:
             Sequence[Novel]: 소설 목록입니다.
         """
-        stmt = select(Novel)
-        if query:
-            escape_query = query.replace("%", r"\%").replace("_", r"\_")
-            like_expr = f"%{escape_query}%"
-            filter_column = self._filter_columns.get(filter_by)
-            stmt = stmt.where(
-                filter_column.ilike(like_expr)
-                if filter_column
-                else or_(
-                    Novel.title.ilike(like_expr),
-                    Novel.author.ilike(like_expr),
-                    Novel.description.ilike(like_expr),
-                )
-            )
-        if catetory_column := self._category_columns.get(category):
-            stmt = stmt.where(Novel.category == catetory_column)
-
-        order_column = self._order_columns.get(order_by, Novel.last_updated_at)
-        stmt = stmt.order_by(order_column.desc() if desc else order_column).offset(skip)
-
-        if limit:
-            stmt = stmt.limit(limit)
-
+        stmt = self._multi_stmt(
+            select(Novel),
+            skip=skip,
+            limit=limit,
+            query=query,
+            filter_by=filter_by,
+            category=category,
+            order_by=order_by,
+            desc=desc,
+            after=after,
+        )
         return (await self.db.scalars(stmt)).all()
 
-    async def get_memo(
-        self,
-        novel_id: int,
-        user_id: int,
-        content_existed: bool = False,
-    ) -> NovelMemo | None:
-        """소설 메모를 조회합니다.
+    async def get_multi_with_memo(self, user_id: int, **kwargs) -> Sequence[Row]:
+        """소설 목록을 사용자의 소설 메모와 LEFT JOIN하여 한 번에 조회합니다.
 
         Args:
-            novel_id (int): 소설의 id입니다.
             user_id (int): 사용자의 id입니다.
-            content_existed (bool, optional): 메모 내용이 있는지 여부입니다. Defaults to False.
+            **kwargs: `get_multi`와 같은 목록 조건입니다.
 
         Returns:
-            NovelMemo|None: 소설 메모 객체입니다.
+            Sequence[Row]: `Novel`과 메모 컬럼(`average_star`, `is_favorite`, `content`, `modified_at`)을 담은 행 목록입니다.
         """
-        stmt = select(NovelMemo).where(NovelMemo.novel_id == novel_id).where(NovelMemo.user_id == user_id)
-        if content_existed:
-            stmt = stmt.where(NovelMemo.content.is_not(None))
-        return (await self.db.scalars(stmt)).first()
-
-    async def get_memo_multi(
+        stmt = select(
+            Novel,
+            NovelMemo.average_star,
+            func.coalesce(NovelMemo.is_favorite, false()).label("is_favorite"),
+            NovelMemo.content,
+            NovelMemo.modified_at,
+        ).outerjoin(NovelMemo, and_(NovelMemo.novel_id == Novel.id, NovelMemo.user_id == user_id))
+        return (await self.db.execute(self._multi_stmt(stmt, **kwargs))).all()
+
+    async def get_reading_positions(
         self,
         user_id: int,
-        novel_ids: Sequence[int] | None = None,
-    ) -> Sequence[NovelMemo]:
-        """소설 메모 목록을 조회합니다.
+        *,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+    ) -> Sequence[Row]:
+        """사용자가 최근에 읽은 소설을 이어 읽기 위치와 함께 조회합니다.
 
         Args:
             user_id (int): 사용자의 id입니다.
-            novel_ids (list[int], optional): 소설의 id 목록입니다. Defaults to None.
+            limit (int): 최대 개수입니다.
+            after (tuple[datetime, int], optional): 이전 페이지 마지막 행의 `(읽은 시각, 소설 id)`입니다. Defaults to None.
 
         Returns:
-            Sequence[NovelMemo]: 소설 메모 목록입니다.
+            Sequence[Row]: `Novel`과 `chapter_no`, `read_at`, `latest_chapter_no` 컬럼을 담은 행 목록입니다.
+                최근에 읽은 순서로 정렬됩니다.
         """
-        stmt = select(NovelMemo).where(NovelMemo.user_id == user_id)
-        if novel_ids:
-            stmt = stmt.where(NovelMemo.novel_id.in_(novel_ids))
-        return (await self.db.scalars(stmt)).all()
+        # 챕터 기본 키 인덱스의 역방향 스캔으로 소설마다 한 행만 읽습니다.
+        latest_chapter_no = select(func.max(Chapter.chapter_no)).where(Chapter.novel_id == Novel.id).scalar_subquery()
+        stmt = (
+            select(
+                Novel,
+                ReadingPosition.chapter_no,
+                ReadingPosition.updated_at.label("read_at"),
+                latest_chapter_no.label("latest_chapter_no"),
+            )
+            .join(ReadingPosition, ReadingPosition.novel_id == Novel.id)
+            .where(ReadingPosition.user_id == user_id)
+            .order_by(ReadingPosition.updated_at.desc(), ReadingPosition.novel_id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                keyset_condition(ReadingPosition.updated_at, after[0], ReadingPosition.novel_id, after[1], True)
+            )
+        return (await self.db.execute(stmt)).all()
 
-    async def create_memo(
+    def _multi_stmt(
         self,
-        novel_id: int,
-        user_id: int,
-        content: str,
-    ) -> NovelMemo:
-        """소설 메모를 생성합니다.
+        stmt: Select,
+        *,
+        skip: int = 0,
+        limit: int | None = None,
+        query: str | None = None,
+        filter_by: NovelFilter = NovelFilter.ALL,
+        category: NovelCategoryFilter = NovelCategoryFilter.ALL,
+        order_by: NovelOrder = NovelOrder.LAST_UPDATED_AT,
+        desc: bool = True,
+        after: tuple[Any, int] | None = None,
+    ) -> Select:
+        """소설 목록 조회 문에 검색, 필터, 정렬, 페이지 조건을 추가합니다. 인자는 `get_multi`와 같습니다."""
+        search_columns = ()
+        if query:
+            filter_column = self._filter_columns.get(filter_by)
+            search_columns = (filter_column,) if filter_column else (Novel.title, Novel.author, Novel.description)
+            stmt = stmt.where(self._search_condition(query, search_columns))
+        if catetory_column := self._category_columns.get(category):
+            stmt = stmt.where(Novel.category == catetory_column)
+
+        stmt, order_column, id_column = self._order(stmt, order_by, query, search_columns)
+        if after:
+            stmt = stmt.where(keyset_condition(order_column, after[0], id_column, after[1], desc))
+        else:
+            stmt = stmt.offset(skip)
+        stmt = stmt.order_by(*((order_column.desc(), id_column.desc()) if desc else (order_column, id_column)))
+
+        if limit:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @staticmethod
+    def _search_condition(query: str, columns: Sequence[InstrumentedAttribute]) -> ColumnElement[bool]:
+        """컬럼 중 하나라도 검색어를 포함하는 조건(ILIKE '%검색어%')을 반환합니다.
+
+        pg_trgm GIN 인덱스(novels_*_trgm_idx)는 검색어에서 뽑은 세 글자 조각(trigram)으로 후보를 찾습니다.
+        한두 글자 검색어에서는 조각을 뽑을 수 없어 인덱스로 후보를 거르지 못하고, 플래너는 테이블을 순차 탐색합니다.
+        두 음절 검색이 많으면 `NOVEL_SEARCH_INDEX_ENABLED`로 프로세스 내 n-gram 색인을 사용하세요.
 
         Args:
-            novel_id (int): 소설의 id입니다.
-            user_id (int): 사용자의 id입니다.
-            content (str): 메모 내용입니다.
+            query (str): 검색어입니다.
+            columns (Sequence[InstrumentedAttribute]): 검색 대상 컬럼입니다.
 
         Returns:
-            NovelMemo: 소설 메모 객체입니다.
+            ColumnElement[bool]: 조건식입니다.
         """
-        if not (novel_memo := await self.get_memo(novel_id, user_id)):
-            novel_memo = NovelMemo(novel_id=novel_id, user_id=user_id)
-        novel_memo.content = content
-        novel_memo.modified_at = datetime.utcnow().replace(tzinfo=timezone.utc)
-        self.db.add(novel_memo)
-        await self.db.flush()
-        await self.db.refresh(novel_memo)
-        return novel_memo
+        escape_query = query.replace("%", r"\%").replace("_", r"\_")
+        like_expr = f"%{escape_query}%"
+        return or_(*(column.ilike(like_expr) for column in columns))
 
-    async def delete_memo(
+    def _order(
         self,
-        novel_id: int,
-        user_id: int,
-    ) -> NovelMemo:
-        """소설 메모를 삭제합니다.
+        stmt: Select,
+        order_by: NovelOrder,
+        query: str | None,
+        search_columns: Sequence[InstrumentedAttribute],
+    ) -> tuple[Select, ColumnElement, ColumnElement]:
+        """정렬 기준 식과 값이 같을 때 순서를 정하는 id 컬럼을 반환합니다. 통계 순이면 통계를 외부 JOIN합니다.
 
         Args:
-            novel_id (int): 소설의 id입니다.
-            user_id (int): 사용자의 id입니다.
+            stmt (Select): 소설 목록 조회 문입니다.
+            order_by (NovelOrder): 정렬 기준입니다.
+            query (str|None): 검색어입니다. 없으면 유사도 순은 최종 업데이트 순이 됩니다.
+            search_columns (Sequence[InstrumentedAttribute]): 검색 대상 컬럼입니다.
 
         Returns:
-            NovelMemo: 소설 메모 객체입니다.
+            tuple[Select, ColumnElement, ColumnElement]: 조회 문, 정렬 기준 식, id 컬럼입니다.
         """
-        stmt = select(NovelMemo).where(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id)
-        novel_memo = (await self.db.scalars(stmt)).first()
-        if not novel_memo:
-            return
-        novel_memo.content = None
-        novel_memo.modified_at = None
-        if not (novel_memo.content and novel_memo.average_star and novel_memo.is_favorite):
-            await self.db.delete(novel_memo)
-        else:
-            self.db.add(novel_memo)
-            await self.db.flush()
-            await self.db.refresh(novel_memo)
-        return novel_memo
+        if order_by == NovelOrder.RELEVANCE and query:
+            return stmt, self._relevance(query, search_columns), Novel.id
+        if (order_column := self._stats_order_columns.get(order_by)) is not None:
+            stmt = stmt.outerjoin(NovelStats, NovelStats.novel_id == Novel.id).options(contains_eager(Novel.stats))
+            return stmt, order_column, Novel.id
+        return stmt, self._order_columns.get(order_by, Novel.last_updated_at), Novel.id
 
-    async def mark_as_favorite(
-        self,
-        novel_id: int,
-        user_id: int,
-    ) -> NovelMemo:
-        """소설 메모를 즐겨찾기합니다.
+    @staticmethod
+    def _relevance(query: str, columns: Sequence[InstrumentedAttribute]) -> ColumnElement[float]:
+        """검색어와 컬럼들의 trigram 유사도 중 가장 큰 값을 반환하는 식입니다.
 
         Args:
-            novel_id (int): 소설의 id입니다.
-            user_id (int): 사용자의 id입니다.
+            query (str): 검색어입니다.
+            columns (Sequence[InstrumentedAttribute]): 검색 대상 컬럼입니다.
 
         Returns:
-            NovelMemo: 소설 메모 객체입니다.
+            ColumnElement[float]: 유사도 식입니다.
         """
-        stmt = select(NovelMemo).where(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id)
-        novel_memo = (await self.db.scalars(stmt)).first()
-        if not novel_memo:
-            novel_memo = NovelMemo(novel_id=novel_id, user_id=user_id)
-        novel_memo.is_favorite = True
-        self.db.add(novel_memo)
-        await self.db.flush()
-        await self.db.refresh(novel_memo)
-        return novel_memo
+        similarities = [func.word_similarity(query, column) for column in columns]
+        return similarities[0] if len(similarities) == 1 else func.greatest(*similarities)
 
-    async def unmark_as_favorite(
+    async def get_memo(
         self,
         novel_id: int,
         user_id: int,
-    ) -> NovelMemo:
-        """소설 메모를 즐겨찾기 해제합니다.
+        content_existed: bool = False,
+    ) -> NovelMemo | None:
+        """소설 메모를 조회합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
             user_id (int): 사용자의 id입니다.
+            content_existed (bool, optional): 메모 내용이 있는지 여부입니다. Defaults to False.
 
         Returns:
-            NovelMemo: 소설 메모 객체입니다.
+            NovelMemo|None: 소설 메모 객체입니다.
         """
-        stmt = select(NovelMemo).where(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id)
-        novel_memo = (await self.db.scalars(stmt)).first()
-        if not novel_memo:
-            return
-        novel_memo.is_favorite = False
-        if not (novel_memo.content and novel_memo.average_star and novel_memo.is_favorite):
-            await self.db.delete(novel_memo)
-        else:
-            self.db.add(novel_memo)
-            await self.db.flush()
-            await self.db.refresh(novel_memo)
-        return novel_memo
+        stmt = select(NovelMemo).where(NovelMemo.novel_id == novel_id).where(NovelMemo.user_id == user_id)
+        if content_existed:
+            stmt = stmt.where(NovelMemo.content.is_not(None))
+        return (await self.db.scalars(stmt)).first()
 
-    async def update_average_star(
+    async def get_memo_updated_at(
         self,
         novel_id: int,
         user_id: int,
-    ) -> NovelMemo:
-        """소설의 평균 별점을 업데이트합니다.
+    ) -> datetime | None:
+        """소설 메모의 수정일을 조회합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
             user_id (int): 사용자의 id입니다.
 
         Returns:
-            NovelMemo: 소설 메모 객체입니다.
+            datetime|None: 소설 메모의 수정일입니다. 메모가 없으면 None입니다.
         """
-        stmt = select(NovelMemo).where(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id)
-        novel_memo = (await self.db.scalars(stmt)).first()
-        if not novel_memo:
-            novel_memo = NovelMemo(novel_id=novel_id, user_id=user_id)
-        stmt = select(func.avg(ChapterMemo.star)).where(
-            ChapterMemo.novel_id == novel_id, ChapterMemo.user_id == user_id, ChapterMemo.star.is_not(None)
-        )
-        average_star = await self.db.scalar(stmt)
-
-        if average_star is None:
-            return novel_memo
-        novel_memo.average_star = round(average_star, 2)
-        self.db.add(novel_memo)
-        await self.db.flush()
-        await self.db.refresh(novel_memo)
-        return novel_memo
-
-
-class CRUDChapter(CRUD[Chapter]):
-    """소설 챕터 CRUD 클래스"""
+        stmt = select(NovelMemo.updated_at).where(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id)
+        return await self.db.scalar(stmt)
 
-    _order_columns = {
-        ChapterOrder.CHAPTER_NO: Chapter.chapter_no,
-    }
-
-    async def get(
+    async def get_memo_progress(
         self,
         novel_id: int,
-        chapter_no: int,
-    ) -> Chapter | None:
-        """소설 챕터를 조회합니다.
+        user_id: int,
+    ) -> bytes | None:
+        """소설 메모의 진행 비트맵을 조회합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
-            chapter_no (int): 챕터 번호입니다.
+            user_id (int): 사용자의 id입니다.
 
         Returns:
-            Chapter|None: 소설 챕터 객체입니다.
+            bytes|None: 챕터 메모가 있는 챕터 번호의 비트맵입니다. 메모가 없으면 None입니다.
         """
-        stmt = select(Chapter).where(Chapter.novel_id == novel_id, Chapter.chapter_no == chapter_no)
-        return (await self.db.scalars(stmt)).first()
+        stmt = select(NovelMemo.progress).where(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id)
+        return await self.db.scalar(stmt)
 
-    async def get_multi(
+    async def get_memo_multi(
         self,
-        novel_id: int,
-        *,
-        skip: int = 0,
-        limit: int | None = None,
-        order_by: ChapterOrder = ChapterOrder.CHAPTER_NO,
-        desc: bool = True,
-    ) -> Sequence[Chapter]:
-        """소설 챕터 목록을 조회합니다.
+        user_id: int,
+        novel_ids: Sequence[int] | None = None,
+    ) -> Sequence[NovelMemo]:
+        """소설 메모 목록을 조회합니다.
 
         Args:
-            novel_id (int): 소설의 id입니다.
-            skip (int): 건너뛸 개수입니다. Defaults to 0.
-            limit (int, optional): 최대 개수입니다. Defaults to None.
-            order_by (ChapterOrder): 정렬 기준입니다. Defaults to ChapterOrder.CHAPTER_NO.
-            desc (bool): 내림차순 여부입니다. Defaults to True.
+            user_id (int): 사용자의 id입니다.
+            novel_ids (list[int], optional): 소설의 id 목록입니다. Defaults to None.
 
         Returns:
-            Sequence[Chapter]: 소설 챕터 목록입니다.
+            Sequence[NovelMemo]: 소설 메모 목록입니다.
         """
-        stmt = select(Chapter).where(Chapter.novel_id == novel_id)
-
-        order_column = self._order_columns.get(order_by, Chapter.chapter_no)
-        stmt = stmt.order_by(order_column.desc() if desc else order_column).offset(skip)
-
-        if limit:
-            stmt = stmt.limit(limit)
-
+        stmt = select(NovelMemo).where(NovelMemo.user_id == user_id)
+        if novel_ids:
+            stmt = stmt.where(NovelMemo.novel_id.in_(novel_ids))
         return (await self.db.scalars(stmt)).all()
 
-    async def get_memo_multi(
+    async def create_memo(
         self,
         novel_id: int,
         user_id: int,
-        chapter_nos: Sequence[int] | None = None,
-    ) -> Sequence[ChapterMemo]:
-        """챕터 메모 목록을 조회합니다.
+        content: str,
+        overwrite: bool = True,
+    ) -> NovelMemo | None:
+        """소설 메모를 생성하거나 수정합니다.
 
         Args:
-            chapter_ids (list[int]): 챕터의 id 목록입니다.
+            novel_id (int): 소설의 id입니다.
             user_id (int): 사용자의 id입니다.
-            chapter_nos (list[int], optional): 챕터 번호 목록입니다. Defaults to None.
+            content (str): 메모 내용입니다.
+            overwrite (bool, optional): 이미 내용이 있는 메모를 덮어쓸지 여부입니다. Defaults to True.
 
         Returns:
-            Sequence[ChapterMemo]: 챕터 메모 목록입니다.
+            NovelMemo|None: 소설 메모 객체입니다. 덮어쓰지 않아 변경되지 않았으면 None입니다.
         """
-        stmt = select(ChapterMemo).where(ChapterMemo.novel_id == novel_id, ChapterMemo.user_id == user_id)
-        if chapter_nos:
-            stmt = stmt.where(ChapterMemo.chapter_no.in_(chapter_nos))
-        return (await self.db.scalars(stmt)).all()
+        stmt = _insert_novel_memo(novel_id, user_id, content=content, content_updated_at=func.now())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NovelMemo.novel_id, NovelMemo.user_id],
+            set_={"content": stmt.excluded.content, "content_updated_at": func.now(), "updated_at": func.now()},
+            where=None if overwrite else NovelMemo.__table__.c.content.is_(None),
+        )
+        return await self._returning_memo(stmt)
 
-    async def get_memo(
+    async def delete_memo(
         self,
         novel_id: int,
-        chapter_no: int,
         user_id: int,
-    ) -> ChapterMemo | None:
-        """챕터 메모를 조회합니다.
+    ) -> NovelMemo | None:
+        """소설 메모의 내용을 삭제합니다. 즐겨찾기나 별점이 남아있지 않으면 메모를 삭제합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
-            chapter_no (int): 챕터 번호입니다.
             user_id (int): 사용자의 id입니다.
 
         Returns:
-            ChapterMemo|None: 챕터 메모 객체입니다.
+            NovelMemo|None: 소설 메모 객체입니다. 메모가 없거나 삭제되었으면 None입니다.
         """
-        stmt = select(ChapterMemo).where(
-            ChapterMemo.novel_id == novel_id, ChapterMemo.chapter_no == chapter_no, ChapterMemo.user_id == user_id
+        table = NovelMemo.__table__
+        return await self._clear_memo(
+            novel_id,
+            user_id,
+            {"content": None, "content_updated_at": None},
+            keep=or_(table.c.is_favorite, table.c.star_count > 0, func.length(table.c.progress) > 0),
         )
-        return (await self.db.scalars(stmt)).first()
 
-    async def create_memo(
+    async def mark_as_favorite(
         self,
         novel_id: int,
-        chapter_no: int,
         user_id: int,
-        content: str = None,
-        star: int = None,
-    ) -> ChapterMemo:
-        """챕터 메모를 생성합니다.
+    ) -> NovelMemo:
+        """소설 메모를 즐겨찾기합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
-            chapter_no (int): 챕터 번호입니다.
             user_id (int): 사용자의 id입니다.
-            content (str, optional): 메모 내용입니다.
-            star (int, optional): 별점입니다.
 
         Returns:
-            ChapterMemo: 챕터 메모 객체입니다.
+            NovelMemo: 소설 메모 객체입니다.
         """
-        chapter_memo = ChapterMemo(
-            novel_id=novel_id, chapter_no=chapter_no, user_id=user_id, content=content, star=star
+        stmt = _insert_novel_memo(novel_id, user_id, is_favorite=true())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NovelMemo.novel_id, NovelMemo.user_id],
+            set_={"is_favorite": true(), "updated_at": func.now()},
         )
-        self.db.add(chapter_memo)
-        await self.db.flush()
-        await self.db.refresh(chapter_memo)
-        return chapter_memo
+        return await self._returning_memo(stmt)
 
-    async def update_memo(
+    async def unmark_as_favorite(
         self,
         novel_id: int,
-        chapter_no: int,
         user_id: int,
-        content: str | None = None,
-        star: int | None = None,
-    ) -> ChapterMemo | None:
-        """챕터 메모를 수정합니다.
+    ) -> NovelMemo | None:
+        """소설 메모를 즐겨찾기 해제합니다. 내용이나 별점이 남아있지 않으면 메모를 삭제합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
-            chapter_no (int): 챕터 번호입니다.
             user_id (int): 사용자의 id입니다.
-            content (str, optional): 메모 내용입니다. Defaults to None.
-            star (int, optional): 별점입니다. Defaults to None.
 
         Returns:
-            ChapterMemo: 챕터 메모 객체입니다.
+            NovelMemo|None: 소설 메모 객체입니다. 메모가 없거나 삭제되었으면 None입니다.
         """
-        stmt = select(ChapterMemo).where(
-            ChapterMemo.novel_id == novel_id, ChapterMemo.chapter_no == chapter_no, ChapterMemo.user_id == user_id
+        table = NovelMemo.__table__
+        return await self._clear_memo(
+            novel_id,
+            user_id,
+            {"is_favorite": false()},
+            keep=or_(table.c.content.is_not(None), table.c.star_count > 0, func.length(table.c.progress) > 0),
         )
-        chapter_memo = (await self.db.scalars(stmt)).first()
-        if not chapter_memo:
-            return
-        if content is not None:
-            chapter_memo.content = content
-        if star is not None:
-            chapter_memo.star = star
-        chapter_memo.modified_at = datetime.utcnow().replace(tzinfo=timezone.utc)
-        self.db.add(chapter_memo)
-        await self.db.flush()
-        await self.db.refresh(chapter_memo)
-        return chapter_memo
 
-    async def delete_memo(
+    async def _clear_memo(
         self,
         novel_id: int,
-        chapter_no: int,
         user_id: int,
-    ) -> ChapterMemo:
-        """챕터 메모를 삭제합니다.
+        values: dict[str, Any],
+        keep: ColumnElement[bool],
+    ) -> NovelMemo | None:
+        """소설 메모의 일부를 지우고, 남는 정보가 없으면 메모를 삭제합니다.
+
+        삭제와 수정은 조건이 서로 배타적인 두 CTE로 한 문장에서 실행하고, 삭제되면 동기화를 위한 기록을 남깁니다.
+        소설 통계도 같은 문장에서 갱신합니다.
 
         Args:
             novel_id (int): 소설의 id입니다.
-            chapter_no (int): 챕터 번호입니다.
             user_id (int): 사용자의 id입니다.
+            values (dict[str, Any]): 지운 뒤의 컬럼 값입니다.
+            keep (ColumnElement[bool]): 지운 뒤에도 메모를 남길 조건입니다.
 
         Returns:
-            ChapterMemo: 챕터 메모 객체입니다.
+            NovelMemo|None: 수정된 소설 메모 객체입니다. 메모가 없거나 삭제되었으면 None입니다.
         """
-        stmt = select(ChapterMemo).where(
-            ChapterMemo.novel_id == novel_id, ChapterMemo.chapter_no == chapter_no, ChapterMemo.user_id == user_id
+        table = NovelMemo.__table__
+        target = (table.c.novel_id == novel_id, table.c.user_id == user_id)
+        deleted = delete(table).where(*target, ~keep).returning(*table.c).cte("deleted")
+        updated = update(table).where(*target, keep).values(values).returning(*table.c).cte("updated")
+        stmt = (
+            select(aliased(NovelMemo, updated))
+            .add_cte(deleted, add_tombstone(deleted), add_novel_stats(updated, deleted))
+            .execution_options(populate_existing=True)
         )
+        return (await self.db.scalars(stmt)).first()
 
-        if not (chapter_memo := (await self.db.scalars(stmt)).first()):
-            return
-        await self.db.delete(chapter_memo)
+    async def _returning_memo(self, stmt: Insert) -> NovelMemo | None:
+        """소설 메모를 쓰는 문장을 소설 통계 갱신과 함께 실행하고 변경된 메모를 반환합니다."""
+        memo = stmt.returning(*NovelMemo.__table__.c).cte("memo")
+        stmt = select(aliased(NovelMemo, memo)).add_cte(add_novel_stats(memo)).execution_options(populate_existing=True)
+        return (await self.db.scalars(stmt)).first()
 
-        return chapter_memo
+    def publish_changed(self, *novel_ids: int) -> None:
+        """소설과 그 챕터가 바뀌었음을 커밋할 때 모든 워커에 알립니다.
+
+        Args:
+            *novel_ids (int): 소설의 id입니다.
+        """
+        invalidation_bus.publish(self.db, NOVEL_TOPIC, *novel_ids)
+
+
+def _insert_novel_memo(novel_id: int, user_id: int, **values: Any) -> Insert:
+    """소설 메모 INSERT 문을 반환합니다. 지정하지 않은 컬럼은 기본값으로 채웁니다."""
+    return pg_insert(NovelMemo.__table__).values(
+        novel_id=novel_id,
+        user_id=user_id,
+        **{"is_favorite": false(), "created_at": func.now(), "updated_at": func.now(), **values},
+    )
+
+
+def add_novel_stats(upserted: CTE | None = None, deleted: CTE | None = None) -> CTE:
+    """소설 메모의 변경분을 소설 통계의 독자 수, 즐겨찾기 수, 별점 합계와 개수에 더하는 CTE를 반환합니다.
+
+    한 문장의 CTE들은 문장 시작 시점의 스냅샷을 보므로, `novel_memos`를 조인하면 변경 전 값을 얻습니다.
+    변경분이 없는 소설의 통계 행은 갱신하지 않고, 통계 행이 없는 소설은 주기적인 재계산에서 채웁니다.
+
+    Args:
+        upserted (CTE, optional): 생성되거나 수정된 소설 메모를 반환하는 CTE입니다. Defaults to None.
+        deleted (CTE, optional): 삭제된 소설 메모를 반환하는 CTE입니다. Defaults to None.
+            두 CTE 모두 `novel_id`, `user_id`, `is_favorite`, `star_sum`, `star_count` 컬럼이 있어야 합니다.
+
+    Returns:
+        CTE: 소설 통계를 갱신하는 CTE입니다.
+    """
+    changes = []
+    if upserted is not None:
+        before = NovelMemo.__table__.alias("before")
+        changes.append(
+            select(
+                upserted.c.novel_id,
+                case((before.c.novel_id.is_(None), 1), else_=0).label("reader_count"),
+                (_as_int(upserted.c.is_favorite) - _as_int(before.c.is_favorite)).label("favorite_count"),
+                (upserted.c.star_sum - func.coalesce(before.c.star_sum, 0)).label("star_sum"),
+                (upserted.c.star_count - func.coalesce(before.c.star_count, 0)).label("star_count"),
+            ).select_from(
+                upserted.outerjoin(
+                    before, and_(before.c.novel_id == upserted.c.novel_id, before.c.user_id == upserted.c.user_id)
+                )
+            )
+        )
+    if deleted is not None:
+        changes.append(
+            select(
+                deleted.c.novel_id,
+                literal(-1).label("reader_count"),
+                (-_as_int(deleted.c.is_favorite)).label("favorite_count"),
+                (-deleted.c.star_sum).label("star_sum"),
+                (-deleted.c.star_count).label("star_count"),
+            )
+        )
+    change = (changes[0] if len(changes) == 1 else union_all(*changes)).subquery("change")
+    counters = ("reader_count", "favorite_count", "star_sum", "star_count")
+    delta = (
+        select(change.c.novel_id, *(func.sum(change.c[name]).label(name) for name in counters))
+        .group_by(change.c.novel_id)
+        .subquery("delta")
+    )
+    table = NovelStats.__table__
+    return (
+        update(table)
+        .where(table.c.novel_id == delta.c.novel_id, or_(*(delta.c[name] != 0 for name in counters)))
+        .values({**{name: table.c[name] + delta.c[name] for name in counters}, "updated_at": func.now()})
+        .cte("novel_stats")
+    )
+
+
+def _as_int(flag: ColumnElement[bool]) -> ColumnElement[int]:
+    """참이면 1, 거짓이면 0인 식을 반환합니다."""
+    return case((flag, 1), else_=0)
+
+
+def add_tombstone(deleted: CTE, chapter_no: ColumnElement[int] | None = None) -> CTE:
+    """삭제된 메모마다 삭제 기록을 추가하는 CTE를 반환합니다.
+
+    Args:
+        deleted (CTE): `novel_id`, `user_id` 컬럼을 반환하는 삭제 CTE입니다.
+        chapter_no (ColumnElement[int], optional): 챕터 메모이면 챕터 번호 컬럼입니다. Defaults to None.
+
+    Returns:
+        CTE: 삭제 기록을 추가하는 CTE입니다.
+    """
+    return (
+        pg_insert(MemoTombstone.__table__)
+        .from_select(
+            ["user_id", "novel_id", "chapter_no", "created_at", "updated_at"],
+            select(
+                deleted.c.user_id,
+                deleted.c.novel_id,
+                chapter_no if chapter_no is not None else null(),
+                func.now(),
+                func.now(),
+            ),
+        )
+        .cte("tombstone")
+    )
@@ -0,0 +1,120 @@
+"""소설 등록 작업 큐를 정의합니다."""
+import asyncio
+import logging
+from collections import Counter
+from contextlib import suppress
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException
+
+from src.db import AsyncSessionLocal
+from src.domain.novels.jobs_crud import CRUDNovelJob
+from src.domain.novels.models import NovelJob
+from src.domain.novels.schemas import NovelCreate, NovelDTO, NovelJobStatus
+from src.libs.responses import NovelError
+
+__all__ = ("NovelJobQueue",)
+
+logger = logging.getLogger(__name__)
+
+NovelJobHandler = Callable[[NovelCreate], Awaitable[NovelDTO]]
+
+
+class NovelJobQueue:
+    """데이터베이스의 `novel_jobs` 테이블을 대기열로 사용하는 소설 등록 작업자들입니다.
+
+    작업은 모든 워커 프로세스가 공유하므로 어느 프로세스가 요청을 받았든 진행 상황을 조회할 수 있고, 어느 프로세스의
+    작업자든 작업을 처리할 수 있습니다. 작업자는 `wake`로 깨우거나 `poll_interval`마다 대기 중인 작업을 가져갑니다.
+    전체 크롤러 동시 호출 수의 상한은 워커 프로세스 수와 작업자 수의 곱입니다.
+    """
+
+    def __init__(self, handler: NovelJobHandler, *, workers: int, poll_interval: float):
+        """NovelJobQueue 생성자
+
+        Args:
+            handler (NovelJobHandler): 소설을 등록하는 코루틴 함수입니다.
+            workers (int): 작업자 수입니다.
+            poll_interval (float): 깨우지 않아도 대기 중인 작업을 확인하는 간격(초)입니다.
+        """
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self.counts: Counter[str] = Counter()
+
+    async def start(self) -> None:
+        """작업자들을 시작합니다."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._work(), name=f"novel-job-{i}") for i in range(self.workers)]
+
+    async def stop(self) -> None:
+        """작업자들을 종료합니다. 진행 중인 작업은 다른 워커 프로세스가 처리하도록 대기 상태로 되돌립니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def wake(self) -> None:
+        """작업이 추가되었으니 기다리는 작업자들을 깨웁니다. 작업자는 가장 오래 기다린 작업부터 가져갑니다."""
+        self._wakeup.set()
+
+    @property
+    def stats(self) -> dict:
+        """작업자들의 상태를 반환합니다."""
+        return {
+            "workers": len(self._tasks),
+            "succeeded": self.counts[NovelJobStatus.SUCCEEDED],
+            "failed": self.counts[NovelJobStatus.FAILED],
+        }
+
+    async def _work(self) -> None:
+        """대기 중인 작업을 가져가 처리하고, 없으면 깨우거나 `poll_interval`이 지날 때까지 기다립니다."""
+        while True:
+            # 가져가기 전에 지워야 그 사이에 추가된 작업의 신호를 놓치지 않습니다.
+            self._wakeup.clear()
+            try:
+                job = await self._claim()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("소설 등록 작업을 가져오지 못했습니다.")
+                job = None
+            if job is None:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                continue
+            await self._run(job)
+
+    async def _claim(self) -> NovelJob | None:
+        """대기 중인 작업 하나를 진행 중으로 바꾸어 가져옵니다."""
+        async with AsyncSessionLocal() as db:
+            job = await CRUDNovelJob(db).claim()
+            await db.commit()
+        return job
+
+    async def _run(self, job: NovelJob) -> None:
+        """작업 하나를 처리합니다."""
+        try:
+            novel = await self.handler(NovelCreate(platform=job.platform, id=job.platform_id, url=job.url))
+        except HTTPException as exc:
+            await self._finish(job.id, error=str(exc.detail))
+        except asyncio.CancelledError:
+            async with AsyncSessionLocal() as db:
+                await CRUDNovelJob(db).release(job.id)
+                await db.commit()
+            raise
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("소설 등록 작업이 실패했습니다. job_id=%s", job.id)
+            await self._finish(job.id, error=NovelError.UNEXPECTED_ERROR.value.detail)
+        else:
+            await self._finish(job.id, novel_id=novel.id)
+
+    async def _finish(self, job_id: str, *, novel_id: int | None = None, error: str | None = None) -> None:
+        """작업을 완료 처리합니다. 저장하지 못한 작업은 오래 진행 중인 작업을 정리할 때 실패 처리됩니다."""
+        self.counts[NovelJobStatus.FAILED if error else NovelJobStatus.SUCCEEDED] += 1
+        try:
+            async with AsyncSessionLocal() as db:
+                await CRUDNovelJob(db).finish(job_id, novel_id=novel_id, error=error)
+                await db.commit()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("소설 등록 작업의 결과를 저장하지 못했습니다. job_id=%s", job_id)
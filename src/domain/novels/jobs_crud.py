@@ -0,0 +1,172 @@
+"""소설 등록 작업 CRUD 관련 모듈입니다."""
+# pylint: disable=redefined-builtin,not-callable
+from datetime import datetime
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+
+from src.core.invalidation import invalidation_bus
+from src.domain.base.crud import CRUD
+from src.domain.novels.models import NovelJob
+from src.domain.novels.schemas import NovelCreate, NovelJobStatus
+
+__all__ = (
+    "CRUDNovelJob",
+    "NOVEL_JOB_TOPIC",
+)
+
+# 작업을 추가하면 이 토픽으로 모든 워커 프로세스의 작업자를 깨웁니다.
+NOVEL_JOB_TOPIC = "novel_job"
+
+_ACTIVE = (NovelJobStatus.PENDING, NovelJobStatus.RUNNING)
+_FINISHED = (NovelJobStatus.SUCCEEDED, NovelJobStatus.FAILED)
+
+
+class CRUDNovelJob(CRUD[NovelJob]):
+    """소설 등록 작업 CRUD"""
+
+    async def create(self, user_id: int, command: NovelCreate) -> NovelJob:
+        """소설 등록 작업을 추가합니다. 세션이 커밋되면 작업자들을 깨웁니다.
+
+        같은 사용자가 같은 소설에 대해 요청한, 대기 중이거나 진행 중인 작업이 있으면 새 작업을 만들지 않습니다.
+        플랫폼의 소설 아이디를 모르는 요청은 URL로 같은 소설인지 구분합니다.
+
+        Args:
+            user_id (int): 작업을 요청한 사용자의 id입니다.
+            command (NovelCreate): 소설 등록 요청입니다.
+
+        Returns:
+            NovelJob: 새로 만든 작업 혹은 진행 중인 작업입니다.
+        """
+        platform, novel_key = command.platform, command.key
+        values = {"platform_id": command.id, "url": str(command.url) if command.url else None}
+        stmt = (
+            pg_insert(NovelJob)
+            .values(user_id=user_id, platform=platform, novel_key=novel_key, **values)
+            .on_conflict_do_nothing(
+                index_elements=[NovelJob.user_id, NovelJob.platform, NovelJob.novel_key],
+                index_where=NovelJob.status.in_(_ACTIVE),
+            )
+            .returning(NovelJob)
+        )
+        if job := (await self.db.scalars(stmt)).first():
+            invalidation_bus.publish(self.db, NOVEL_JOB_TOPIC, job.id)
+            return job
+        stmt = select(NovelJob).where(
+            NovelJob.user_id == user_id,
+            NovelJob.platform == platform,
+            NovelJob.novel_key == novel_key,
+            NovelJob.status.in_(_ACTIVE),
+        )
+        return (await self.db.scalars(stmt)).one()
+
+    async def get(self, id: str, user_id: int) -> NovelJob | None:
+        """사용자가 요청한 작업을 등록된 소설과 함께 조회합니다.
+
+        Args:
+            id (str): 작업의 id입니다.
+            user_id (int): 사용자의 id입니다.
+
+        Returns:
+            NovelJob|None: 작업 객체입니다.
+        """
+        stmt = select(NovelJob).where(NovelJob.id == id, NovelJob.user_id == user_id)
+        return (await self.db.scalars(stmt)).first()
+
+    async def count_pending(self) -> int:
+        """대기 중인 작업 수를 반환합니다."""
+        stmt = select(func.count()).select_from(NovelJob).where(NovelJob.status == NovelJobStatus.PENDING)
+        return await self.db.scalar(stmt)
+
+    async def claim(self) -> NovelJob | None:
+        """가장 오래 기다린 작업을 진행 중으로 바꾸고 반환합니다.
+
+        같은 소설에 대해 진행 중인 작업이 있으면 건너뛰므로 같은 소설을 동시에 크롤링하지 않습니다.
+        작업자들이 같은 작업을 가져가지 않도록 트랜잭션 advisory lock으로 하나씩 가져가며, lock은 현재 트랜잭션이
+        끝날 때 해제되므로 바로 커밋해야 합니다.
+
+        Returns:
+            NovelJob|None: 가져간 작업입니다. 대기 중인 작업이 없으면 None입니다.
+        """
+        await self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext("novel_jobs:claim"))))
+        pending, running = aliased(NovelJob), aliased(NovelJob)
+        next_id = (
+            select(pending.id)
+            .where(
+                pending.status == NovelJobStatus.PENDING,
+                ~exists().where(
+                    running.status == NovelJobStatus.RUNNING,
+                    running.platform == pending.platform,
+                    running.novel_key == pending.novel_key,
+                ),
+            )
+            .order_by(pending.created_at)
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(NovelJob)
+            .where(NovelJob.id == next_id)
+            .values(status=NovelJobStatus.RUNNING, started_at=func.now())
+            .returning(NovelJob)
+        )
+        return (await self.db.scalars(stmt)).first()
+
+    async def finish(self, id: str, *, novel_id: int | None = None, error: str | None = None) -> None:
+        """작업을 완료 처리합니다.
+
+        Args:
+            id (str): 작업의 id입니다.
+            novel_id (int|None, optional): 등록된 소설의 id입니다. Defaults to None.
+            error (str|None, optional): 실패 사유입니다. 있으면 실패로 처리합니다. Defaults to None.
+        """
+        status = NovelJobStatus.FAILED if error else NovelJobStatus.SUCCEEDED
+        stmt = (
+            update(NovelJob)
+            .where(NovelJob.id == id)
+            .values(status=status, novel_id=novel_id, error=error, finished_at=func.now())
+        )
+        await self.db.execute(stmt)
+
+    async def release(self, id: str) -> None:
+        """진행 중인 작업을 다시 대기 상태로 되돌립니다.
+
+        Args:
+            id (str): 작업의 id입니다.
+        """
+        stmt = (
+            update(NovelJob)
+            .where(NovelJob.id == id, NovelJob.status == NovelJobStatus.RUNNING)
+            .values(status=NovelJobStatus.PENDING, started_at=None)
+        )
+        await self.db.execute(stmt)
+
+    async def fail_stale(self, started_before: datetime, error: str) -> int:
+        """작업자가 종료되어 끝나지 않은 것으로 보이는, 오래 진행 중인 작업을 실패 처리합니다.
+
+        Args:
+            started_before (datetime): 이 시각 전에 시작한 작업을 실패 처리합니다.
+            error (str): 실패 사유입니다.
+
+        Returns:
+            int: 실패 처리한 작업 수입니다.
+        """
+        stmt = (
+            update(NovelJob)
+            .where(NovelJob.status == NovelJobStatus.RUNNING, NovelJob.started_at < started_before)
+            .values(status=NovelJobStatus.FAILED, error=error, finished_at=func.now())
+        )
+        return (await self.db.execute(stmt)).rowcount
+
+    async def delete_finished(self, finished_before: datetime) -> int:
+        """보관 시간이 지난 완료 작업을 삭제합니다.
+
+        Args:
+            finished_before (datetime): 이 시각 전에 끝난 작업을 삭제합니다.
+
+        Returns:
+            int: 삭제한 작업 수입니다.
+        """
+        stmt = delete(NovelJob).where(NovelJob.status.in_(_FINISHED), NovelJob.finished_at < finished_before)
+        return (await self.db.execute(stmt)).rowcount
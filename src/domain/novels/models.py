@@ -1,18 +1,42 @@
 """데이터베이스 모델."""
+# pylint: disable=unsubscriptable-object
+import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import BOOLEAN, FLOAT, INTEGER, TEXT, TIMESTAMP, VARCHAR, ForeignKey, Index, PrimaryKeyConstraint
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    BIGINT,
+    BOOLEAN,
+    FLOAT,
+    INTEGER,
+    TEXT,
+    TIMESTAMP,
+    VARCHAR,
+    Computed,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import BYTEA
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.base.models import Base
 
 __all__ = (
     "NovelCategory",
     "Novel",
+    "NovelStats",
     "NovelMemo",
     "Chapter",
     "ChapterMemo",
+    "ReadingPosition",
+    "NovelActivity",
+    "NovelRanking",
+    "NovelSimilarity",
+    "NovelContentSimilarity",
+    "UserRecommendation",
+    "NovelJob",
 )
 
 
@@ -48,13 +72,53 @@ class Novel(Base):
     series_id: Mapped[str] = mapped_column(VARCHAR(20), unique=True, comment="시리즈 아이디")
     munpia_id: Mapped[str] = mapped_column(VARCHAR(20), unique=True, comment="문피아 아이디")
     image_url: Mapped[str] = mapped_column(VARCHAR(255), comment="이미지 URL")
+    # 소설을 조회할 때 항상 함께 LEFT JOIN으로 읽습니다. 통계 행이 아직 없으면 None입니다.
+    stats: Mapped["NovelStats | None"] = relationship(lazy="joined", viewonly=True)
 
     __table_args__ = (
         Index("novels_title_author_idx", title, author),
+        Index("novels_title_trgm_idx", title, postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("novels_author_trgm_idx", author, postgresql_using="gin", postgresql_ops={"author": "gin_trgm_ops"}),
+        Index(
+            "novels_description_trgm_idx",
+            description,
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
         {"comment": "소설"},
     )
 
 
+class NovelStats(Base):
+    """소설 통계. 챕터와 소설 메모의 집계로, 메모를 쓰는 문장에서 증분 갱신하고 주기적으로 다시 계산하여 보정합니다."""
+
+    __tablename__ = "novel_stats"
+
+    novel_id: Mapped[int] = mapped_column(
+        INTEGER, ForeignKey("novels.id"), primary_key=True, comment="소설 아이디 (기본 키, 외래 키)"
+    )
+    chapter_count: Mapped[int] = mapped_column(INTEGER, server_default="0", nullable=False, comment="챕터 수")
+    latest_chapter_no: Mapped[int | None] = mapped_column(INTEGER, comment="마지막 챕터 번호")
+    reader_count: Mapped[int] = mapped_column(INTEGER, server_default="0", nullable=False, comment="소설 메모가 있는 사용자 수")
+    favorite_count: Mapped[int] = mapped_column(INTEGER, server_default="0", nullable=False, comment="즐겨찾기 수")
+    star_sum: Mapped[int] = mapped_column(BIGINT, server_default="0", nullable=False, comment="모든 사용자의 별점 합계")
+    star_count: Mapped[int] = mapped_column(INTEGER, server_default="0", nullable=False, comment="모든 사용자가 별점을 등록한 챕터 수")
+    # 별점 순 정렬에서 별점이 없는 소설이 마지막에 오도록 NULL 대신 0입니다.
+    average_star: Mapped[float] = mapped_column(
+        FLOAT,
+        Computed("CASE WHEN star_count > 0 THEN ROUND(star_sum::NUMERIC / star_count, 2)::FLOAT ELSE 0 END"),
+        comment="평균 별점, 별점이 없으면 0",
+    )
+
+    __table_args__ = (
+        # 통계 순 소설 목록의 keyset 페이지네이션에 사용합니다.
+        Index("novel_stats_reader_count_idx", reader_count, novel_id),
+        Index("novel_stats_favorite_count_idx", favorite_count, novel_id),
+        Index("novel_stats_average_star_idx", average_star, novel_id),
+        {"comment": "소설 통계"},
+    )
+
+
 class NovelMemo(Base):
     """소설 메모."""
 
@@ -63,13 +127,26 @@ class NovelMemo(Base):
     novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
     user_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("users.id"), nullable=False, comment="사용자 아이디 (외래 키)")
     content: Mapped[str] = mapped_column(TEXT, comment="내용")
-    average_star: Mapped[float] = mapped_column(FLOAT, comment="평균 별점")
+    star_sum: Mapped[int] = mapped_column(INTEGER, default=0, server_default="0", nullable=False, comment="별점 합계")
+    star_count: Mapped[int] = mapped_column(
+        INTEGER, default=0, server_default="0", nullable=False, comment="별점을 등록한 챕터 수"
+    )
+    average_star: Mapped[float] = mapped_column(
+        FLOAT,
+        Computed("CASE WHEN star_count > 0 THEN ROUND(star_sum::NUMERIC / star_count, 2)::FLOAT END"),
+        comment="평균 별점",
+    )
     is_favorite: Mapped[bool] = mapped_column(BOOLEAN, comment="즐겨찾기 여부", default=False, nullable=False)
     modified_at: Mapped[datetime] = mapped_column("content_updated_at", TIMESTAMP(timezone=True), comment="내용 수정일")
+    # 챕터 번호 n은 (n / 8)번째 바이트의 (n % 8)번째 비트(최하위 비트부터)입니다. `progress_update` SQL 함수로 갱신합니다.
+    progress: Mapped[bytes] = mapped_column(
+        BYTEA, server_default=text("''::BYTEA"), nullable=False, comment="챕터 메모가 있는 챕터 번호의 비트맵"
+    )
 
     __table_args__ = (
         PrimaryKeyConstraint(novel_id, user_id),
-        Index("novel_memos_user_id_idx", user_id),
+        # 사용자별 조회와 동기화(`updated_at` 이후 변경) 조회에 함께 사용합니다.
+        Index("novel_memos_user_id_updated_at_idx", user_id, "updated_at"),
         {"comment": "소설 메모"},
     )
 
@@ -91,6 +168,8 @@ class Chapter(Base):
     __table_args__ = (
         PrimaryKeyConstraint(novel_id, chapter_no),
         Index("chapters_chapter_no_idx", chapter_no.desc()),
+        # 챕터 목록의 최근 수정일과 개수를 index-only scan으로 집계합니다.
+        Index("chapters_novel_id_updated_at_idx", novel_id, "updated_at"),
         {"comment": "소설 챕터"},
     )
 
@@ -115,6 +194,147 @@ class ChapterMemo(Base):
         PrimaryKeyConstraint(novel_id, chapter_no, user_id),
         Index("chapter_memos_novel_id_chapter_no_idx", novel_id, chapter_no),
         Index("chapter_memos_novel_id_user_id_idx", novel_id, user_id),
-        Index("chapter_memos_user_id_idx", user_id),
+        # 사용자별 조회와 동기화(`updated_at` 이후 변경) 조회에 함께 사용합니다.
+        Index("chapter_memos_user_id_updated_at_idx", user_id, "updated_at"),
         {"comment": "챕터 메모"},
     )
+
+
+class ReadingPosition(Base):
+    """이어 읽기 위치. 사용자가 소설마다 마지막으로 메모를 남긴 챕터입니다."""
+
+    __tablename__ = "reading_positions"
+
+    user_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("users.id"), nullable=False, comment="사용자 아이디 (외래 키)")
+    novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
+    chapter_no: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="마지막으로 메모를 남긴 챕터 번호")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(user_id, novel_id),
+        # 최근에 읽은 순서의 keyset 페이지네이션에 사용합니다.
+        Index("reading_positions_user_id_updated_at_idx", user_id, "updated_at", novel_id),
+        {"comment": "이어 읽기 위치"},
+    )
+
+
+class NovelActivity(Base):
+    """소설 활동 수. 워커 프로세스마다 모은 챕터 메모와 즐겨찾기 수를 시간 버킷 단위로 합산합니다."""
+
+    __tablename__ = "novel_activity"
+
+    novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
+    bucket_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False, comment="버킷 시작 시각")
+    count: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="활동 수")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(novel_id, bucket_at),
+        # 최근 기간의 활동 수 집계와 오래된 버킷 삭제에 사용합니다.
+        Index("novel_activity_bucket_at_idx", bucket_at),
+        {"comment": "소설 활동 수"},
+    )
+
+
+class NovelRanking(Base):
+    """소설 순위 스냅샷. 주기적으로 다시 계산하여 통째로 바꿉니다."""
+
+    __tablename__ = "novel_rankings"
+
+    ranking: Mapped[str] = mapped_column(VARCHAR(20), nullable=False, comment="순위 종류")
+    rank: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="순위")
+    novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
+    score: Mapped[float] = mapped_column(FLOAT, nullable=False, comment="순위를 정한 값")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(ranking, rank),
+        {"comment": "소설 순위"},
+    )
+
+
+class NovelSimilarity(Base):
+    """비슷한 소설 스냅샷. 메모를 남긴 사용자들의 평가로 계산한 소설 간 코사인 유사도 상위 목록입니다."""
+
+    __tablename__ = "novel_similarities"
+
+    novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
+    rank: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="순위")
+    similar_novel_id: Mapped[int] = mapped_column(
+        INTEGER, ForeignKey("novels.id"), nullable=False, comment="비슷한 소설 아이디 (외래 키)"
+    )
+    score: Mapped[float] = mapped_column(FLOAT, nullable=False, comment="코사인 유사도")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(novel_id, rank),
+        {"comment": "비슷한 소설"},
+    )
+
+
+class NovelContentSimilarity(Base):
+    """내용이 비슷한 소설 스냅샷. 같은 카테고리에서 제목과 설명의 TF-IDF 코사인 유사도 상위 목록입니다."""
+
+    __tablename__ = "novel_content_similarities"
+
+    novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
+    rank: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="순위")
+    similar_novel_id: Mapped[int] = mapped_column(
+        INTEGER, ForeignKey("novels.id"), nullable=False, comment="비슷한 소설 아이디 (외래 키)"
+    )
+    score: Mapped[float] = mapped_column(FLOAT, nullable=False, comment="TF-IDF 코사인 유사도")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(novel_id, rank),
+        {"comment": "내용이 비슷한 소설"},
+    )
+
+
+class UserRecommendation(Base):
+    """사용자별 추천 소설 스냅샷. 사용자가 평가한 소설과 비슷한 소설의 유사도를 평가로 가중합하여 계산합니다."""
+
+    __tablename__ = "user_recommendations"
+
+    user_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("users.id"), nullable=False, comment="사용자 아이디 (외래 키)")
+    rank: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="순위")
+    novel_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("novels.id"), nullable=False, comment="소설 아이디 (외래 키)")
+    score: Mapped[float] = mapped_column(FLOAT, nullable=False, comment="추천 점수")
+
+    __table_args__ = (
+        PrimaryKeyConstraint(user_id, rank),
+        {"comment": "추천 소설"},
+    )
+
+
+class NovelJob(Base):
+    """소설 등록 작업. 모든 워커 프로세스가 공유하는 작업 큐로, 작업자가 대기 중인 작업을 하나씩 가져가 처리합니다."""
+
+    __tablename__ = "novel_jobs"
+
+    id: Mapped[str] = mapped_column(
+        VARCHAR(32), primary_key=True, default=lambda: uuid.uuid4().hex, comment="아이디 (기본 키)"
+    )
+    user_id: Mapped[int] = mapped_column(
+        INTEGER, ForeignKey("users.id"), nullable=False, comment="작업을 요청한 사용자 아이디 (외래 키)"
+    )
+    platform: Mapped[str] = mapped_column(VARCHAR(20), nullable=False, comment="소설 플랫폼")
+    platform_id: Mapped[str | None] = mapped_column(VARCHAR(20), comment="플랫폼의 소설 아이디")
+    url: Mapped[str | None] = mapped_column(VARCHAR(255), comment="소설 URL")
+    novel_key: Mapped[str] = mapped_column(VARCHAR(255), nullable=False, comment="같은 소설인지 구분하는 키, 플랫폼의 소설 아이디가 없으면 URL")
+    status: Mapped[str] = mapped_column(VARCHAR(20), server_default="pending", nullable=False, comment="작업 상태")
+    novel_id: Mapped[int | None] = mapped_column(INTEGER, ForeignKey("novels.id"), comment="등록된 소설 아이디 (외래 키)")
+    error: Mapped[str | None] = mapped_column(TEXT, comment="실패 사유")
+    started_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), comment="작업 시작일")
+    finished_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True), comment="작업 종료일")
+    # 작업을 조회할 때 등록된 소설을 함께 LEFT JOIN으로 읽습니다.
+    novel: Mapped["Novel | None"] = relationship(lazy="joined", viewonly=True)
+
+    __table_args__ = (
+        # 사용자마다 같은 소설에 대해 대기 중이거나 진행 중인 작업은 하나입니다.
+        Index(
+            "novel_jobs_user_id_novel_key_idx",
+            user_id,
+            platform,
+            novel_key,
+            unique=True,
+            postgresql_where=status.in_(("pending", "running")),
+        ),
+        Index("novel_jobs_status_created_at_idx", status, "created_at"),
+        {"comment": "소설 등록 작업"},
+    )
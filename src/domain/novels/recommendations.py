@@ -0,0 +1,125 @@
+"""메모의 평가로 소설 간 유사도와 사용자별 추천 소설을 계산합니다.
+
+사용자 × 소설 평가를 희소 행렬 하나로 만들고, 소설(또는 사용자)을 블록 단위로 나누어 곱하므로
+메모리 사용량은 평가 수와 블록 크기에 비례합니다. 결과는 행마다 점수가 높은 k개만 남깁니다.
+"""
+from typing import Iterator, NamedTuple, Sequence
+
+import numpy as np
+from scipy import sparse
+
+__all__ = ("TopK", "interaction_matrix", "neighbor_matrix", "similar_novels", "recommend_novels")
+
+
+class TopK(NamedTuple):
+    """행마다 점수가 높은 k개의 열입니다. 모두 같은 길이의 배열이며 행, 순위 순서로 정렬됩니다."""
+
+    rows: np.ndarray  # 행 번호
+    ranks: np.ndarray  # 행 안에서의 순위, 1부터 시작합니다.
+    cols: np.ndarray  # 열 번호
+    scores: np.ndarray  # 점수
+
+
+def interaction_matrix(
+    user_ids: Sequence[int], novel_ids: Sequence[int], values: Sequence[float]
+) -> tuple[sparse.csr_matrix, np.ndarray, np.ndarray]:
+    """평가 목록으로 사용자 × 소설 희소 행렬을 만듭니다.
+
+    Args:
+        user_ids (Sequence[int]): 평가마다 사용자 id입니다. `array("i")`처럼 buffer를 지원하면 복사하지 않습니다.
+        novel_ids (Sequence[int]): 평가마다 소설 id입니다.
+        values (Sequence[float]): 평가 값입니다.
+
+    Returns:
+        tuple[sparse.csr_matrix, np.ndarray, np.ndarray]: 평가 행렬과 행 번호별 사용자 id, 열 번호별 소설 id입니다.
+    """
+    users, user_index = np.unique(np.asarray(user_ids, dtype=np.int32), return_inverse=True)
+    novels, novel_index = np.unique(np.asarray(novel_ids, dtype=np.int32), return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (np.asarray(values, dtype=np.float32), (user_index, novel_index)), shape=(len(users), len(novels))
+    )
+    matrix.sum_duplicates()
+    return matrix, users, novels
+
+
+def neighbor_matrix(tops: Sequence[TopK], size: int) -> sparse.csr_matrix:
+    """`similar_novels`의 결과를 소설 × 소설 유사도 행렬로 모읍니다.
+
+    Args:
+        tops (Sequence[TopK]): 비슷한 소설 블록 목록입니다.
+        size (int): 소설 수입니다.
+
+    Returns:
+        sparse.csr_matrix: i행에 i번째 소설과 비슷한 소설의 유사도를 담은 행렬입니다.
+    """
+    if not tops:
+        return sparse.csr_matrix((size, size), dtype=np.float32)
+    rows = np.concatenate([top.rows for top in tops])
+    cols = np.concatenate([top.cols for top in tops])
+    scores = np.concatenate([top.scores for top in tops])
+    return sparse.csr_matrix((scores, (rows, cols)), shape=(size, size))
+
+
+def similar_novels(matrix: sparse.csr_matrix, k: int, block_size: int) -> Iterator[TopK]:
+    """소설마다 코사인 유사도가 높은 소설 k개를 블록 단위로 계산합니다.
+
+    Args:
+        matrix (sparse.csr_matrix): `interaction_matrix`로 만든 평가 행렬입니다.
+        k (int): 소설마다 남길 비슷한 소설 수입니다.
+        block_size (int): 한 번에 계산할 소설 수입니다. 블록의 결과는 최대 `block_size × 소설 수`개입니다.
+
+    Yields:
+        TopK: 행과 열이 소설 번호인 블록입니다. 자기 자신과 유사도가 0인 소설은 제외합니다.
+    """
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel())
+    normalized = (matrix @ sparse.diags(1 / np.where(norms > 0, norms, 1), format="csr")).tocsr()
+    items = normalized.T.tocsr()
+    for start in range(0, items.shape[0], block_size):
+        block = items[start : start + block_size] @ normalized
+        yield _top_k(block, k, start, exclude=lambda rows, cols, start=start: cols == rows + start)
+
+
+def recommend_novels(
+    matrix: sparse.csr_matrix, neighbors: sparse.csr_matrix, k: int, block_size: int
+) -> Iterator[TopK]:
+    """사용자마다 평가한 소설과 비슷한 소설의 유사도를 평가로 가중합하여 점수가 높은 소설 k개를 계산합니다.
+
+    Args:
+        matrix (sparse.csr_matrix): `interaction_matrix`로 만든 평가 행렬입니다.
+        neighbors (sparse.csr_matrix): `neighbor_matrix`로 만든 유사도 행렬입니다.
+        k (int): 사용자마다 남길 추천 소설 수입니다.
+        block_size (int): 한 번에 계산할 사용자 수입니다.
+
+    Yields:
+        TopK: 행이 사용자 번호, 열이 소설 번호인 블록입니다. 이미 평가한 소설은 제외합니다.
+    """
+    size = matrix.shape[1]
+    for start in range(0, matrix.shape[0], block_size):
+        ratings = matrix[start : start + block_size].tocoo()
+        rated = ratings.row.astype(np.int64) * size + ratings.col
+        yield _top_k(
+            ratings.tocsr() @ neighbors,
+            k,
+            start,
+            exclude=lambda rows, cols, rated=rated: np.isin(rows.astype(np.int64) * size + cols, rated),
+        )
+
+
+def _top_k(block: sparse.spmatrix, k: int, offset: int, exclude=None) -> TopK:
+    """블록의 행마다 점수가 양수인 열 중 상위 k개를 고릅니다."""
+    block = block.tocoo()
+    rows, cols, scores = block.row, block.col, block.data
+    keep = scores > 0
+    if exclude is not None:
+        keep &= ~exclude(rows, cols)
+    rows, cols, scores = rows[keep], cols[keep], scores[keep]
+    # 여러 키로 정렬하는 `np.lexsort`보다 점수 순위와 행 번호를 정수 키 하나로 합쳐 정렬하는 편이 훨씬 빠릅니다.
+    by_score = np.argsort(-scores)
+    score_rank = np.empty_like(by_score)
+    score_rank[by_score] = np.arange(len(by_score))
+    order = np.argsort(rows.astype(np.int64) * len(rows) + score_rank)
+    rows, cols, scores = rows[order], cols[order], scores[order]
+    # 행 번호로 정렬되어 있으므로 같은 행의 첫 위치를 빼면 행 안에서의 순위입니다.
+    ranks = np.arange(1, len(rows) + 1) - np.searchsorted(rows, rows)
+    keep = ranks <= k
+    return TopK(rows[keep] + offset, ranks[keep], cols[keep], scores[keep])
@@ -2,18 +2,23 @@
 # pylint: disable=redefined-builtin
 from datetime import datetime
 from enum import Enum
+from typing import Any, Mapping
 
 from pydantic import ConfigDict, Field, HttpUrl, model_validator
 from typing_extensions import Annotated
 
-from src.domain.base.schemas import DTO, Base
+from src.domain.base.schemas import DTO, Base, trusted_http_url
 from src.libs.responses import NovelError
 from src.libs.utils import parse_last_path
 
 __all__ = (
     "Platform",
+    "platform_urls",
+    "NovelStatsDTO",
     "NovelDTO",
     "NovelCreate",
+    "NovelJobStatus",
+    "NovelJobDTO",
     "NovelOrder",
     "NovelsRequest",
     "NovelsDTO",
@@ -22,6 +27,7 @@ __all__ = (
     "NovelMemoDTO",
     "NovelMemoContent",
     "NovelMemoCreate",
+    "NovelProgressDTO",
     "ChapterOrder",
     "ChaptersRequest",
     "ChapterDTO",
@@ -31,6 +37,22 @@ __all__ = (
     "ChapterMemoCreate",
     "ChapterMemoUpdate",
     "ChapterMemoDTO",
+    "ChapterMemoBatchItem",
+    "ChapterMemoBatch",
+    "ChapterMemosDTO",
+    "ReadingPositionsRequest",
+    "ReadingPositionDTO",
+    "ReadingPositionsDTO",
+    "NovelRankingType",
+    "NovelRankingPeriod",
+    "NovelRankingsRequest",
+    "NovelRankingDTO",
+    "NovelRankingsDTO",
+    "NovelRecommendationsRequest",
+    "SimilarNovelBasis",
+    "SimilarNovelsRequest",
+    "NovelRecommendationDTO",
+    "NovelRecommendationsDTO",
 )
 
 
@@ -52,13 +74,51 @@ class Platform(StrEnum):
     MUNPIA = "munpia"
 
 
+_PLATFORM_URL_TEMPLATES: dict[Platform, str] = {
+    Platform.RIDI: "https://ridibooks.com/books/{}",
+}
+# (url 필드, id 필드, URL 템플릿)
+_PLATFORM_URL_FIELDS = tuple(
+    (f"{platform.value}_url", f"{platform.value}_id", template)
+    for platform, template in _PLATFORM_URL_TEMPLATES.items()
+)
+
+
 def id_to_url(id: str, platform: Platform) -> HttpUrl:
     """소설 아이디를 URL로 변환합니다."""
-    if platform == Platform.RIDI:
-        return HttpUrl(f"https://ridibooks.com/books/{id}")
+    if template := _PLATFORM_URL_TEMPLATES.get(platform):
+        return HttpUrl(template.format(id))
     raise ValueError(f"지원하지 않는 플랫폼입니다. platform={platform}")
 
 
+def platform_urls(values: Mapping[str, Any]) -> dict[str, HttpUrl]:
+    """플랫폼별 아이디로 `{platform}_url` 필드 값을 만듭니다.
+
+    `DTO.from_trusted`로 만드는 DTO에 `id_to_url` validator와 같은 값을 채울 때 사용합니다.
+
+    Args:
+        values (Mapping[str, Any]): `{platform}_id` 값을 담은 매핑입니다.
+
+    Returns:
+        dict[str, HttpUrl]: `{platform}_url` 필드 값입니다.
+    """
+    return {
+        url_field: trusted_http_url(template.format(values.get(id_field)))
+        for url_field, id_field, template in _PLATFORM_URL_FIELDS
+    }
+
+
+class NovelStatsDTO(DTO):
+    """소설 통계 DTO"""
+
+    chapter_count: Annotated[int, Field(description="챕터 수")] = 0
+    latest_chapter_no: Annotated[int | None, Field(description="마지막 챕터 번호")] = None
+    reader_count: Annotated[int, Field(description="서재에 추가한 사용자 수")] = 0
+    favorite_count: Annotated[int, Field(description="즐겨찾기 수")] = 0
+    average_star: Annotated[float, Field(description="모든 사용자의 평균 별점, 별점이 없으면 0")] = 0
+    star_count: Annotated[int, Field(description="별점 개수")] = 0
+
+
 class NovelDTO(DTO):
     """소설 DTO"""
 
@@ -84,6 +144,7 @@ class NovelDTO(DTO):
     is_favorite: Annotated[bool, Field(description="즐겨찾기 여부")] = False
     content: Annotated[str | None, Field(description="내용")] = None
     modified_at: Annotated[datetime | None, Field(description="내용 수정일")] = None
+    stats: Annotated[NovelStatsDTO | None, Field(description="소설 통계, 아직 집계되지 않았으면 null")] = None
 
     @model_validator(mode="after")
     @classmethod
@@ -114,6 +175,11 @@ class NovelCreate(Base):
             data.id = parse_last_path(str(data.url), is_digit=True)
         return data
 
+    @property
+    def key(self) -> str:
+        """같은 소설에 대한 요청을 구분하는 키입니다. 플랫폼의 소설 아이디를 모르면 정규화한 URL입니다."""
+        return self.id or str(self.url)
+
     @classmethod
     @property
     def errors(cls) -> tuple:
@@ -121,6 +187,29 @@ class NovelCreate(Base):
         return (NovelError.NEED_NOVEL_REF,)
 
 
+class NovelJobStatus(StrEnum):
+    """소설 등록 작업 상태"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class NovelJobDTO(DTO):
+    """소설 등록 작업 DTO"""
+
+    id: Annotated[str, Field(description="작업 ID")]
+    platform: Annotated[Platform, Field(description="소설 플랫폼")]
+    platform_id: Annotated[str | None, Field(description="플랫폼의 소설 ID")] = None
+    status: Annotated[NovelJobStatus, Field(description="작업 상태")] = NovelJobStatus.PENDING
+    novel: Annotated[NovelDTO | None, Field(description="등록된 소설")] = None
+    error: Annotated[str | None, Field(description="실패 사유")] = None
+    created_at: Annotated[datetime, Field(description="작업 생성일")]
+    started_at: Annotated[datetime | None, Field(description="작업 시작일")] = None
+    finished_at: Annotated[datetime | None, Field(description="작업 종료일")] = None
+
+
 class NovelOrder(StrEnum):
     """소설 정렬"""
 
@@ -128,6 +217,10 @@ class NovelOrder(StrEnum):
     AUTHOR = "author"
     PUBLISHED_AT = "published_at"
     LAST_UPDATED_AT = "last_updated_at"
+    RELEVANCE = "relevance"  # 검색어와의 유사도 순, 검색어가 없으면 최종 업데이트일 순
+    READER_COUNT = "reader_count"  # 서재에 추가한 사용자 수 순
+    FAVORITE_COUNT = "favorite_count"  # 즐겨찾기 수 순
+    AVERAGE_STAR = "average_star"  # 모든 사용자의 평균 별점 순
 
 
 class NovelFilter(StrEnum):
@@ -153,6 +246,7 @@ class NovelCategoryFilter(StrEnum):
 class NovelsRequest(Base):
     """소설 목록 요청"""
 
+    cursor: Annotated[str | None, Field(description="이전 응답의 next_cursor, 지정하면 skip은 무시합니다.")] = None
     skip: Annotated[int, Field(description="건너뛸 개수", ge=0)] = 0
     limit: Annotated[int | None, Field(description="최대 개수", ge=0, le=100)] = 10
     query: Annotated[str | None, Field(description="검색어")] = None
@@ -166,6 +260,7 @@ class NovelsDTO(DTO):
     """소설 목록 DTO"""
 
     items: Annotated[list[NovelDTO], Field(description="소설 목록")]
+    next_cursor: Annotated[str | None, Field(description="다음 페이지 커서, 마지막 페이지이면 null")] = None
 
 
 class NovelMemoDTO(DTO):
@@ -190,6 +285,13 @@ class NovelMemoCreate(NovelMemoContent):
     user_id: Annotated[int, Field(description="사용자 ID")]
 
 
+class NovelProgressDTO(DTO):
+    """소설 진행 상황 DTO"""
+
+    count: Annotated[int, Field(description="메모를 남긴 챕터 수")] = 0
+    ranges: Annotated[list[tuple[int, int]], Field(description="메모를 남긴 챕터 번호의 [시작, 끝] 구간 목록 (양 끝 포함)")] = []
+
+
 class ChapterOrder(StrEnum):
     """챕터 정렬"""
 
@@ -199,6 +301,7 @@ class ChapterOrder(StrEnum):
 class ChaptersRequest(Base):
     """챕터 목록 요청"""
 
+    cursor: Annotated[str | None, Field(description="이전 응답의 next_cursor, 지정하면 skip은 무시합니다.")] = None
     skip: Annotated[int, Field(description="건너뛸 개수", ge=0)] = 0
     limit: Annotated[int | None, Field(description="최대 개수", ge=0, le=100)] = 10
     order_by: Annotated[ChapterOrder, Field(description="정렬 기준")] = ChapterOrder.CHAPTER_NO
@@ -235,6 +338,7 @@ class ChaptersDTO(DTO):
     """챕터 목록 DTO"""
 
     items: Annotated[list[ChapterDTO], Field(description="챕터 목록")]
+    next_cursor: Annotated[str | None, Field(description="다음 페이지 커서, 마지막 페이지이면 null")] = None
 
 
 class ChapterMemoBase(Base):
@@ -272,3 +376,129 @@ class ChapterMemoDTO(DTO, ChapterMemoBase, ChapterMemoContent):
 
     novel_id: Annotated[int, Field(description="소설 ID")]
     updated_at: Annotated[datetime, Field(description="내용 수정일")]
+
+
+class ChapterMemoBatchItem(ChapterMemoContent):
+    """여러 챕터 메모 등록의 항목"""
+
+    chapter_no: Annotated[int, Field(description="챕터 번호")]
+
+
+class ChapterMemoBatch(Base):
+    """여러 챕터 메모 등록"""
+
+    items: Annotated[list[ChapterMemoBatchItem], Field(description="챕터 메모 목록", min_length=1, max_length=100)]
+
+    @model_validator(mode="after")
+    def check_unique_chapter_no(self) -> "ChapterMemoBatch":
+        """챕터 번호가 중복되지 않았는지 확인합니다."""
+        if len({item.chapter_no for item in self.items}) != len(self.items):
+            raise NovelError.DUPLICATE_CHAPTER_NO.http_exception
+        return self
+
+    @classmethod
+    @property
+    def errors(cls) -> tuple:
+        """에러 메시지"""
+        return (NovelError.DUPLICATE_CHAPTER_NO,)
+
+
+class ChapterMemosDTO(DTO):
+    """챕터 메모 목록 DTO"""
+
+    items: Annotated[list[ChapterMemoDTO], Field(description="챕터 메모 목록")]
+
+
+class ReadingPositionsRequest(Base):
+    """이어 읽기 목록 요청"""
+
+    cursor: Annotated[str | None, Field(description="이전 응답의 next_cursor")] = None
+    limit: Annotated[int, Field(description="최대 개수", ge=1, le=100)] = 20
+
+
+class ReadingPositionDTO(DTO):
+    """이어 읽기 DTO"""
+
+    novel: Annotated[NovelDTO, Field(description="소설")]
+    chapter_no: Annotated[int, Field(description="마지막으로 메모를 남긴 챕터 번호")]
+    latest_chapter_no: Annotated[int | None, Field(description="소설의 최신 챕터 번호")] = None
+    read_at: Annotated[datetime, Field(description="마지막으로 읽은 시각")]
+
+
+class ReadingPositionsDTO(DTO):
+    """이어 읽기 목록 DTO"""
+
+    items: Annotated[list[ReadingPositionDTO], Field(description="최근에 읽은 순서의 이어 읽기 목록")]
+    next_cursor: Annotated[str | None, Field(description="다음 페이지 커서, 마지막 페이지이면 null")] = None
+
+
+class NovelRankingType(StrEnum):
+    """소설 순위 종류"""
+
+    TOP_RATED = "top_rated"  # 모든 사용자의 평균 별점 순
+    MOST_FAVORITED = "most_favorited"  # 즐겨찾기 수 순
+    TRENDING = "trending"  # 기간 동안의 챕터 메모와 즐겨찾기 수 순
+
+
+class NovelRankingPeriod(StrEnum):
+    """인기 순위의 집계 기간"""
+
+    DAY = "day"  # 최근 24시간
+    WEEK = "week"  # 최근 7일
+
+
+class NovelRankingsRequest(Base):
+    """소설 순위 요청"""
+
+    type: Annotated[NovelRankingType, Field(description="순위 종류")] = NovelRankingType.TRENDING
+    period: Annotated[NovelRankingPeriod, Field(description="집계 기간, trending에만 사용합니다.")] = NovelRankingPeriod.DAY
+    skip: Annotated[int, Field(description="건너뛸 개수", ge=0)] = 0
+    limit: Annotated[int, Field(description="최대 개수", ge=1, le=100)] = 20
+
+
+class NovelRankingDTO(DTO):
+    """소설 순위 DTO"""
+
+    rank: Annotated[int, Field(description="순위")]
+    score: Annotated[float, Field(description="순위를 정한 값(평균 별점, 즐겨찾기 수, 활동 수)")]
+    novel: Annotated[NovelDTO, Field(description="소설")]
+
+
+class NovelRankingsDTO(DTO):
+    """소설 순위 목록 DTO"""
+
+    items: Annotated[list[NovelRankingDTO], Field(description="순위 순서의 소설 목록")]
+    computed_at: Annotated[datetime | None, Field(description="순위를 계산한 시각, 아직 계산하지 않았으면 null")] = None
+
+
+class NovelRecommendationsRequest(Base):
+    """비슷한 소설, 추천 소설 요청"""
+
+    limit: Annotated[int, Field(description="최대 개수", ge=1, le=50)] = 10
+
+
+class SimilarNovelBasis(StrEnum):
+    """비슷한 소설을 고르는 기준"""
+
+    RATINGS = "ratings"  # 메모를 남긴 사용자들의 평가
+    CONTENT = "content"  # 같은 카테고리에서 제목과 설명의 내용, 평가가 없는 새 소설에도 사용할 수 있습니다.
+
+
+class SimilarNovelsRequest(NovelRecommendationsRequest):
+    """비슷한 소설 요청"""
+
+    by: Annotated[SimilarNovelBasis, Field(description="비슷한 소설을 고르는 기준")] = SimilarNovelBasis.RATINGS
+
+
+class NovelRecommendationDTO(DTO):
+    """비슷한 소설, 추천 소설 DTO"""
+
+    score: Annotated[float, Field(description="점수(비슷한 소설은 코사인 유사도)")]
+    novel: Annotated[NovelDTO, Field(description="소설")]
+
+
+class NovelRecommendationsDTO(DTO):
+    """비슷한 소설, 추천 소설 목록 DTO"""
+
+    items: Annotated[list[NovelRecommendationDTO], Field(description="점수 순서의 소설 목록")]
+    computed_at: Annotated[datetime | None, Field(description="계산한 시각, 아직 계산하지 않았으면 null")] = None
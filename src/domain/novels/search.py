@@ -0,0 +1,231 @@
+"""소설 목록 검색을 위한 프로세스 내 n-gram 역색인을 정의합니다."""
+# pylint: disable=too-many-arguments
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+from src.domain.novels.models import NovelCategory
+from src.domain.novels.schemas import NovelCategoryFilter, NovelDTO, NovelFilter, NovelOrder
+
+__all__ = ("NovelSearchIndex", "normalize", "ngrams")
+
+_FIELDS = ("title", "author", "description")
+_FIELD_INDEXES = {
+    NovelFilter.TITLE: (0,),
+    NovelFilter.AUTHOR: (1,),
+    NovelFilter.DESCRIPTION: (2,),
+}
+
+
+def normalize(text: str | None) -> str:
+    """검색에 사용할 수 있도록 문자열을 정규화합니다.
+
+    Args:
+        text (str|None): 원본 문자열입니다.
+
+    Returns:
+        str: NFKC 정규화 후 대소문자를 구분하지 않도록 변환한 문자열입니다.
+    """
+    if not text:
+        return ""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def ngrams(text: str) -> set[str]:
+    """문자열의 1-gram과 2-gram을 반환합니다.
+
+    한국어는 띄어쓰기만으로 단어를 나눌 수 없으므로 음절 단위 n-gram을 색인합니다.
+
+    Args:
+        text (str): 정규화된 문자열입니다.
+
+    Returns:
+        set[str]: n-gram 집합입니다.
+
+    Examples:
+        >>> sorted(ngrams("전지적"))
+        ['적', '전', '전지', '지', '지적']
+    """
+    return set(text) | {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _query_grams(query: str) -> set[str]:
+    """검색어를 포함하는 문서가 반드시 가지고 있는 n-gram을 반환합니다."""
+    if len(query) == 1:
+        return {query}
+    return {query[i : i + 2] for i in range(len(query) - 1)}
+
+
+def _intersect(postings: list[array]) -> Iterable[int]:
+    """정렬된 posting 목록들의 교집합을 반환합니다."""
+    postings = sorted(postings, key=len)
+    smallest, others = postings[0], postings[1:]
+    for doc_id in smallest:
+        for posting in others:
+            index = bisect_left(posting, doc_id)
+            if index == len(posting) or posting[index] != doc_id:
+                break
+        else:
+            yield doc_id
+
+
+def _after_cursor(ordered: list[int], sort_key: Callable[[int], tuple], after: tuple, desc: bool) -> list[int]:
+    """정렬 순서에서 커서 위치 다음의 소설 id만 남깁니다. `keyset_condition`과 같은 순서를 따릅니다."""
+    position = (after[0] is None, after[0], after[1])
+    if desc:
+        return [doc_id for doc_id in ordered if sort_key(doc_id) < position]
+    return [doc_id for doc_id in ordered if sort_key(doc_id) > position]
+
+
+class NovelSearchIndex:
+    """제목, 작가, 설명의 n-gram 역색인으로 소설 목록 요청을 데이터베이스 없이 처리합니다.
+
+    posting은 소설 ID를 오름차순으로 담은 `array`로, 검색 시 n-gram posting을 교집합한 뒤
+    원문에 검색어가 실제로 포함되는지 확인하므로 결과는 ILIKE 검색과 같습니다.
+
+    색인은 `NOVEL_TOPIC` 알림으로만 갱신되므로 크롤러가 데이터베이스를 직접 고친 내용은 다음 통계 보정이나
+    주기적인 재구축 전까지 반영되지 않고, 함께 담긴 통계도 통계 보정 간격만큼 늦을 수 있습니다.
+    """
+
+    def __init__(self):
+        """NovelSearchIndex 생성자"""
+        self._docs: dict[int, NovelDTO] = {}
+        self._texts: dict[int, tuple[str, str, str]] = {}
+        self._postings: dict[tuple[int, str], array] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def build(self, novels: Iterable[NovelDTO]) -> None:
+        """색인을 새로 만듭니다.
+
+        Args:
+            novels (Iterable[NovelDTO]): 색인할 소설 목록입니다.
+        """
+        self._docs.clear()
+        self._texts.clear()
+        self._postings.clear()
+        for novel in sorted(novels, key=lambda novel: novel.id):
+            self.add(novel)
+        self.ready = True
+
+    def add(self, novel: NovelDTO) -> None:
+        """소설을 색인에 추가합니다. 이미 있는 소설이면 다시 색인합니다.
+
+        Args:
+            novel (NovelDTO): 추가할 소설입니다.
+        """
+        if novel.id in self._docs:
+            self.remove(novel.id)
+        texts = tuple(normalize(getattr(novel, field)) for field in _FIELDS)
+        self._docs[novel.id] = novel
+        self._texts[novel.id] = texts
+        for field_index, text in enumerate(texts):
+            for gram in ngrams(text):
+                posting = self._postings.setdefault((field_index, gram), array("I"))
+                if not posting or posting[-1] < novel.id:
+                    posting.append(novel.id)
+                else:
+                    posting.insert(bisect_left(posting, novel.id), novel.id)
+
+    def remove(self, novel_id: int) -> None:
+        """소설을 색인에서 제거합니다.
+
+        Args:
+            novel_id (int): 제거할 소설의 id입니다.
+        """
+        if not (texts := self._texts.pop(novel_id, None)):
+            return
+        del self._docs[novel_id]
+        for field_index, text in enumerate(texts):
+            for gram in ngrams(text):
+                posting = self._postings[(field_index, gram)]
+                del posting[bisect_left(posting, novel_id)]
+                if not posting:
+                    del self._postings[(field_index, gram)]
+
+    def search(
+        self,
+        *,
+        skip: int = 0,
+        limit: int | None = None,
+        query: str | None = None,
+        filter_by: NovelFilter = NovelFilter.ALL,
+        category: NovelCategoryFilter = NovelCategoryFilter.ALL,
+        order_by: NovelOrder = NovelOrder.LAST_UPDATED_AT,
+        desc: bool = True,
+        after: tuple | None = None,
+    ) -> list[NovelDTO]:
+        """소설 목록을 검색합니다. 인자는 `CRUDNovel.get_multi`와 같습니다.
+
+        Returns:
+            list[NovelDTO]: 소설 목록입니다.
+        """
+        query, order_by = normalize(query), NovelOrder(order_by)
+        field_indexes = _FIELD_INDEXES.get(filter_by, (0, 1, 2))
+        doc_ids = self._match(query, field_indexes) if query else self._docs.keys()
+        if (category := NovelCategoryFilter(category)) != NovelCategoryFilter.ALL:
+            category_value = NovelCategory[category.name].value
+            doc_ids = [doc_id for doc_id in doc_ids if self._docs[doc_id].category == category_value]
+
+        sort_key = self._sort_key(query, field_indexes, order_by)
+        ordered = sorted(doc_ids, key=sort_key, reverse=desc)
+        if after:
+            ordered, skip = _after_cursor(ordered, sort_key, after, desc), 0
+        end = skip + limit if limit else None
+        return [self._docs[doc_id] for doc_id in ordered[skip:end]]
+
+    def _sort_key(
+        self, query: str | None, field_indexes: tuple[int, ...], order_by: NovelOrder
+    ) -> Callable[[int], tuple]:
+        """소설 id를 정렬 순서에 따라 비교할 키로 바꾸는 함수를 반환합니다.
+
+        Args:
+            query (str | None): 정규화한 검색어입니다.
+            field_indexes (tuple[int, ...]): 검색하는 필드 위치입니다.
+            order_by (NovelOrder): 정렬 기준입니다.
+
+        Returns:
+            Callable[[int], tuple]: 정렬 키 함수입니다. 마지막 원소는 항상 소설 id입니다.
+        """
+        if order_by == NovelOrder.RELEVANCE and query:
+            texts = self._texts
+
+            def relevance_key(doc_id: int) -> tuple:
+                lengths = [len(texts[doc_id][i]) for i in field_indexes if query in texts[doc_id][i]]
+                return (len(query) / min(lengths), doc_id)
+
+            return relevance_key
+
+        order_field = order_by if order_by != NovelOrder.RELEVANCE else NovelOrder.LAST_UPDATED_AT
+        docs = self._docs
+
+        def column_key(doc_id: int) -> tuple:
+            # PostgreSQL과 같이 NULL은 오름차순에서 마지막, 내림차순에서 처음에 옵니다.
+            value = getattr(docs[doc_id], order_field.value)
+            return (value is None, value, doc_id)
+
+        return column_key
+
+    def _match(self, query: str, field_indexes: tuple[int, ...]) -> list[int]:
+        """검색어를 포함하는 소설의 id 목록을 반환합니다."""
+        grams = _query_grams(query)
+        matched = set()
+        for field_index in field_indexes:
+            postings = [self._postings.get((field_index, gram)) for gram in grams]
+            if not all(postings):
+                continue
+            matched.update(doc_id for doc_id in _intersect(postings) if query in self._texts[doc_id][field_index])
+        return list(matched)
+
+    @property
+    def stats(self) -> dict:
+        """색인 상태를 반환합니다."""
+        return {
+            "ready": self.ready,
+            "novels": len(self._docs),
+            "grams": len(self._postings),
+            "postings": sum(len(posting) for posting in self._postings.values()),
+        }
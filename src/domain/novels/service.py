@@ -1,37 +1,113 @@
 """소설 관련 서비스를 제공합니다."""
 # pylint: disable=redefined-builtin
+import asyncio
 import logging
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 
-import requests
+import httpx
+import numpy as np
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.domain.base.service import to_dto
-from src.domain.novels.crud import CRUDChapter, CRUDNovel
-from src.domain.novels.models import Chapter, ChapterMemo, Novel, NovelMemo
+from src.core.http import http_client
+from src.core.invalidation import invalidation_bus
+from src.db import AsyncSessionLocal, engine
+from src.domain.base.schemas import trusted_http_url
+from src.domain.base.service import foreign_key_error, orm_values, to_dto
+from src.domain.novels.cache import novel_cache
+from src.domain.novels.chapters_crud import CRUDChapter
+from src.domain.novels.content import NovelContentIndex
+from src.domain.novels.crud import NOVEL_TOPIC, CRUDNovel
+from src.domain.novels.jobs import NovelJobQueue
+from src.domain.novels.jobs_crud import NOVEL_JOB_TOPIC, CRUDNovelJob
+from src.domain.novels.models import Chapter, ChapterMemo, Novel, NovelJob, NovelMemo, NovelStats
+from src.domain.novels.recommendations import (
+    TopK,
+    interaction_matrix,
+    neighbor_matrix,
+    recommend_novels,
+    similar_novels,
+)
 from src.domain.novels.schemas import (
     ChapterDTO,
+    ChapterMemoBatch,
     ChapterMemoCreate,
     ChapterMemoDTO,
+    ChapterMemosDTO,
     ChapterMemoUpdate,
     ChaptersDTO,
     ChaptersRequest,
     NovelCreate,
     NovelDTO,
+    NovelJobDTO,
     NovelMemoCreate,
     NovelMemoDTO,
+    NovelOrder,
+    NovelProgressDTO,
+    NovelRankingDTO,
+    NovelRankingPeriod,
+    NovelRankingsDTO,
+    NovelRankingsRequest,
+    NovelRankingType,
+    NovelRecommendationDTO,
+    NovelRecommendationsDTO,
+    NovelRecommendationsRequest,
     NovelsDTO,
     NovelsRequest,
+    NovelStatsDTO,
+    ReadingPositionDTO,
+    ReadingPositionsDTO,
+    ReadingPositionsRequest,
+    SimilarNovelBasis,
+    SimilarNovelsRequest,
+    platform_urls,
 )
+from src.domain.novels.search import NovelSearchIndex
+from src.domain.novels.snapshots_crud import CRUDNovelSnapshot
+from src.domain.novels.stats_crud import CRUDNovelStats
+from src.libs.bitmap import bitmap_count, bitmap_ranges
+from src.libs.conditional import ResourceVersion
+from src.libs.counters import BucketCounter
+from src.libs.metrics import metrics
+from src.libs.pagination import decode_cursor, encode_cursor
 from src.libs.responses import NovelError
+from src.libs.singleflight import SingleFlight
+from src.libs.tasks import PeriodicTask
 
 logger = logging.getLogger(__name__)
 
 
+def _novel_values(obj: Novel) -> dict:
+    """Novel 객체의 값을 NovelDTO 필드 값으로 변환합니다."""
+    values = orm_values(obj)
+    if "stats" in values:
+        values["stats"] = to_dto(values["stats"])
+    values["image_url"] = trusted_http_url(values.get("image_url"))
+    values.update(platform_urls(values))
+    return values
+
+
+def _chapter_values(obj: Chapter) -> dict:
+    """Chapter 객체의 값을 ChapterDTO 필드 값으로 변환합니다."""
+    values = orm_values(obj)
+    values.update(platform_urls(values))
+    return values
+
+
+# 데이터베이스에서 읽은 소설과 챕터는 검증 없이 DTO로 변환합니다. 목록 응답에서 대부분의 CPU를 차지합니다.
 @to_dto.register(Novel)
 def _(obj: Novel) -> NovelDTO:
     """Novel 객체를 NovelDTO 객체로 변환합니다."""
-    return NovelDTO.model_validate(obj)
+    return NovelDTO.from_trusted(_novel_values(obj))
+
+
+@to_dto.register(NovelStats)
+def _(obj: NovelStats) -> NovelStatsDTO:
+    """NovelStats 객체를 NovelStatsDTO 객체로 변환합니다."""
+    return NovelStatsDTO.from_trusted(orm_values(obj))
 
 
 @to_dto.register(NovelMemo)
@@ -43,7 +119,7 @@ def _(obj: NovelMemo) -> NovelMemoDTO:
 @to_dto.register(Chapter)
 def _(obj: Chapter) -> ChapterDTO:
     """Chapter 객체를 ChapterDTO 객체로 변환합니다."""
-    return ChapterDTO.model_validate(obj)
+    return ChapterDTO.from_trusted(_chapter_values(obj))
 
 
 @to_dto.register(ChapterMemo)
@@ -52,20 +128,544 @@ def _(obj: ChapterMemo) -> ChapterMemoDTO:
     return ChapterMemoDTO.model_validate(obj)
 
 
+@to_dto.register(NovelJob)
+def _(obj: NovelJob) -> NovelJobDTO:
+    """NovelJob 객체를 NovelJobDTO 객체로 변환합니다."""
+    values = orm_values(obj)
+    values["novel"] = to_dto(values.get("novel"))
+    return NovelJobDTO.model_validate(values)
+
+
+def _novel_dto_with_memo(novel: Novel | NovelDTO, memo: Row | NovelMemo | None) -> NovelDTO:
+    """소설과 사용자의 소설 메모를 하나의 NovelDTO 객체로 만듭니다.
+
+    memo는 `CRUDNovel.get_multi_with_memo`의 행이나 NovelMemo 객체로, 메모가 없으면 None입니다.
+    """
+    if memo is None:
+        return novel.model_copy() if isinstance(novel, NovelDTO) else to_dto(novel)
+    memo_values = {
+        "average_star": memo.average_star,
+        "is_favorite": memo.is_favorite,
+        "content": memo.content,
+        "modified_at": memo.modified_at,
+    }
+    if isinstance(novel, NovelDTO):
+        return novel.model_copy(update=memo_values)
+    return NovelDTO.from_trusted({**_novel_values(novel), **memo_values})
+
+
+def _chapter_dto_with_memo(chapter: Chapter, memo: Row | ChapterMemo | None) -> ChapterDTO:
+    """소설 챕터와 사용자의 챕터 메모를 하나의 ChapterDTO 객체로 만듭니다.
+
+    memo는 `CRUDChapter.get_multi_with_memo`의 행이나 ChapterMemo 객체로, 메모가 없으면 None입니다.
+    """
+    if memo is None:
+        return to_dto(chapter)
+    return ChapterDTO.from_trusted({**_chapter_values(chapter), "star": memo.star, "modified_at": memo.modified_at})
+
+
+_NOVEL_CURSOR_TYPES = {
+    NovelOrder.TITLE: (str,),
+    NovelOrder.AUTHOR: (str, type(None)),
+    NovelOrder.PUBLISHED_AT: (datetime, type(None)),
+    NovelOrder.LAST_UPDATED_AT: (datetime, type(None)),
+    NovelOrder.READER_COUNT: (int,),
+    NovelOrder.FAVORITE_COUNT: (int,),
+    NovelOrder.AVERAGE_STAR: (float, int),
+}
+# 통계는 자주 바뀌므로 통계 순 목록은 검색 색인의 사본 대신 데이터베이스의 통계 인덱스로 처리합니다.
+_STATS_ORDERS = (NovelOrder.READER_COUNT, NovelOrder.FAVORITE_COUNT, NovelOrder.AVERAGE_STAR)
+
+
+def _decode_page_cursor(command: NovelsRequest | ChaptersRequest) -> list[Any]:
+    """목록 요청의 커서를 풀어 정렬 기준 이후의 위치 값을 반환합니다."""
+    try:
+        order_by, desc, *position = decode_cursor(command.cursor)
+    except ValueError as exc:
+        raise NovelError.INVALID_CURSOR.http_exception from exc
+    if order_by != command.order_by or desc != command.desc:
+        raise NovelError.INVALID_CURSOR.http_exception
+    return position
+
+
+def _novel_order(command: NovelsRequest) -> NovelOrder:
+    """검색어 유무를 반영한 실제 소설 정렬 기준을 반환합니다."""
+    if command.order_by == NovelOrder.RELEVANCE and not command.query:
+        return NovelOrder.LAST_UPDATED_AT
+    return command.order_by
+
+
+def _novels_page_params(command: NovelsRequest) -> dict:
+    """소설 목록 요청을 `CRUDNovel.get_multi` 인자로 변환합니다.
+
+    유사도 정렬은 정렬 값을 행에서 다시 얻을 수 없으므로 커서에 offset을 담습니다.
+    """
+    params = command.model_dump(exclude={"cursor"})
+    if not command.cursor:
+        return params
+    position = _decode_page_cursor(command)
+    order_by = _novel_order(command)
+    if order_by == NovelOrder.RELEVANCE:
+        if len(position) != 1 or not isinstance(position[0], int) or position[0] < 0:
+            raise NovelError.INVALID_CURSOR.http_exception
+        params["skip"] = position[0]
+        return params
+    if (
+        len(position) != 2
+        or not isinstance(position[0], _NOVEL_CURSOR_TYPES[order_by])
+        or not isinstance(position[1], int)
+    ):
+        raise NovelError.INVALID_CURSOR.http_exception
+    params["after"] = tuple(position)
+    return params
+
+
+def _novels_next_cursor(command: NovelsRequest, params: dict, items: list[NovelDTO]) -> str | None:
+    """다음 소설 목록 페이지의 커서를 반환합니다. 마지막 페이지이면 None입니다."""
+    if not command.limit or len(items) < command.limit:
+        return None
+    order_by = _novel_order(command)
+    if order_by == NovelOrder.RELEVANCE:
+        return encode_cursor(command.order_by, command.desc, params["skip"] + len(items))
+    last = items[-1]
+    # 통계 행이 없는 소설은 `CRUDNovel`과 같이 기본값으로 정렬되었습니다.
+    source = (last.stats or NovelStatsDTO()) if order_by in _STATS_ORDERS else last
+    return encode_cursor(command.order_by, command.desc, getattr(source, order_by.value), last.id)
+
+
+def _chapters_page_params(command: ChaptersRequest) -> dict:
+    """챕터 목록 요청을 `CRUDChapter.get_multi` 인자로 변환합니다."""
+    params = command.model_dump(exclude={"cursor"})
+    if command.cursor:
+        position = _decode_page_cursor(command)
+        if len(position) != 1 or not isinstance(position[0], int):
+            raise NovelError.INVALID_CURSOR.http_exception
+        params["after"] = position[0]
+    return params
+
+
+def _chapters_next_cursor(command: ChaptersRequest, items: list[ChapterDTO]) -> str | None:
+    """다음 챕터 목록 페이지의 커서를 반환합니다. 마지막 페이지이면 None입니다."""
+    if not command.limit or len(items) < command.limit:
+        return None
+    return encode_cursor(command.order_by, command.desc, items[-1].chapter_no)
+
+
+def _reading_positions_after(command: ReadingPositionsRequest) -> tuple[datetime, int] | None:
+    """이어 읽기 목록 요청의 커서를 `(읽은 시각, 소설 id)`로 변환합니다."""
+    if not command.cursor:
+        return None
+    try:
+        position = decode_cursor(command.cursor)
+    except ValueError as exc:
+        raise NovelError.INVALID_CURSOR.http_exception from exc
+    if len(position) != 2 or not isinstance(position[0], datetime) or not isinstance(position[1], int):
+        raise NovelError.INVALID_CURSOR.http_exception
+    return position[0], position[1]
+
+
+def _recommendations_dto(rows: list[Row]) -> NovelRecommendationsDTO:
+    """비슷한 소설, 추천 소설 조회 결과를 DTO로 변환합니다."""
+    items = [NovelRecommendationDTO.from_trusted({"score": row.score, "novel": to_dto(row.Novel)}) for row in rows]
+    return NovelRecommendationsDTO.from_trusted({"items": items, "computed_at": rows[0].computed_at if rows else None})
+
+
+async def _create_novel(command: NovelCreate) -> NovelDTO:
+    """작업자가 사용할 세션을 열어 소설을 등록합니다. 이미 등록된 소설이면 그 소설을 반환합니다."""
+    async with AsyncSessionLocal() as db:
+        # 다른 사용자의 작업이 같은 소설을 먼저 등록했을 수 있습니다.
+        if command.id and (novel := await CRUDNovel(db).get_by_platform_id(command.platform, command.id)):
+            return to_dto(novel)
+        novel = await NovelService(db).create(command)
+        await db.commit()
+    return await _add_novel(novel)
+
+
+async def _add_novel(novel: NovelDTO) -> NovelDTO:
+    """크롤러가 등록한 소설의 통계를 계산해 알리고, 내용이 비슷한 소설을 계산합니다.
+
+    크롤링을 함께 기다린 작업마다 실행될 수 있으므로 여러 번 실행해도 결과가 같아야 합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        crud_novel = CRUDNovel(db)
+        await CRUDNovelStats(db).refresh_stats([novel.id])
+        if item := await crud_novel.get(novel.id):
+            novel = to_dto(item)
+        # 커밋되면 모든 워커의 캐시와 검색 색인에 반영됩니다.
+        crud_novel.publish_changed(novel.id)
+        await db.commit()
+    # 평가가 없는 새 소설도 비슷한 소설을 바로 조회할 수 있도록 내용이 비슷한 소설을 계산합니다.
+    try:
+        await add_novel_content_similarities(novel.id)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("내용이 비슷한 소설을 계산하지 못했습니다. novel_id=%d", novel.id)
+    return novel
+
+
+async def cleanup_novel_jobs() -> None:
+    """작업자가 종료되어 오래 진행 중인 작업을 실패 처리하고, 보관 시간이 지난 완료 작업을 삭제합니다."""
+    now = datetime.utcnow().replace(tzinfo=timezone.utc)
+    async with AsyncSessionLocal() as db:
+        crud_novel_job = CRUDNovelJob(db)
+        stale = await crud_novel_job.fail_stale(
+            now - timedelta(seconds=settings.NOVEL_JOB_TIMEOUT_SECONDS), NovelError.UNEXPECTED_ERROR.value.detail
+        )
+        deleted = await crud_novel_job.delete_finished(now - timedelta(seconds=settings.NOVEL_JOB_TTL_SECONDS))
+        await db.commit()
+    if stale:
+        logger.warning("오래 진행 중인 소설 등록 작업을 실패 처리했습니다. jobs=%d", stale)
+    logger.debug("보관 시간이 지난 소설 등록 작업을 삭제했습니다. jobs=%d", deleted)
+
+
+novel_job_queue = NovelJobQueue(
+    _create_novel,
+    workers=settings.NOVEL_JOB_WORKERS,
+    poll_interval=settings.NOVEL_JOB_POLL_INTERVAL_SECONDS,
+)
+novel_jobs_cleanup = PeriodicTask(
+    "novel-jobs-cleanup",
+    cleanup_novel_jobs,
+    interval=settings.NOVEL_JOB_CLEANUP_INTERVAL_SECONDS,
+)
+invalidation_bus.subscribe(NOVEL_JOB_TOPIC, lambda _job_ids: novel_job_queue.wake())
+novel_fetch_flight: SingleFlight[NovelDTO] = SingleFlight()
+novel_search_index = NovelSearchIndex()
+
+metrics.register("novel_jobs", lambda: novel_job_queue.stats)
+metrics.register("novel_jobs_cleanup", lambda: novel_jobs_cleanup.stats)
+metrics.register("novel_fetch", lambda: novel_fetch_flight.stats)
+metrics.register("novel_search_index", lambda: novel_search_index.stats)
+
+
+async def load_novel_search_index() -> None:
+    """모든 소설을 읽어 프로세스 내 검색 색인을 만듭니다. 크롤러가 직접 고친 소설도 반영하도록 주기적으로 다시 실행합니다."""
+    async with AsyncSessionLocal() as db:
+        novels = [to_dto(novel) async for novel in CRUDNovel(db).stream_all()]
+    novel_search_index.build(novels)
+    logger.info("소설 검색 색인을 만들었습니다. novels=%d", len(novel_search_index))
+
+
+async def _refresh_novel_search_index(novel_ids: list[str]) -> None:
+    """바뀐 소설을 다시 읽어 검색 색인에 반영합니다."""
+    if not novel_search_index.ready:
+        return
+    novel_ids = set(map(int, novel_ids))
+    async with AsyncSessionLocal() as db:
+        novels = await CRUDNovel(db).get_multi_by_ids(list(novel_ids))
+    for novel in novels:
+        novel_search_index.add(to_dto(novel))
+    for novel_id in novel_ids - {novel.id for novel in novels}:
+        novel_search_index.remove(novel_id)
+
+
+async def _reload_novel_search_index() -> None:
+    """무효화 메시지를 놓쳤을 수 있으므로 검색 색인을 다시 만듭니다."""
+    if novel_search_index.ready:
+        await load_novel_search_index()
+
+
+invalidation_bus.subscribe(NOVEL_TOPIC, _refresh_novel_search_index)
+invalidation_bus.on_reset(_reload_novel_search_index)
+novel_search_index_refresh = PeriodicTask(
+    "novel-search-index-refresh",
+    load_novel_search_index,
+    interval=settings.NOVEL_SEARCH_INDEX_REFRESH_INTERVAL_SECONDS,
+)
+metrics.register("novel_search_index_refresh", lambda: novel_search_index_refresh.stats)
+
+
+async def refresh_novel_stats() -> None:
+    """모든 소설의 통계를 다시 계산하여 증분 갱신에서 생긴 차이를 보정합니다.
+
+    advisory lock을 얻은 워커 프로세스 하나만 실행하며, 통계 행을 오래 잠그지 않도록 배치마다 커밋합니다.
+    통계는 메모를 쓸 때마다 알리지 않으므로, 지난 실행 이후 통계가 바뀐 소설을 알려 캐시와 검색 색인에 반영합니다.
+    """
+    interval = timedelta(seconds=settings.NOVEL_STATS_REFRESH_INTERVAL_SECONDS)
+    # 다른 워커 프로세스가 한 지난 실행과 겹치도록 두 간격 전부터 알립니다.
+    since = datetime.now(timezone.utc) - 2 * interval
+    # 세션 advisory lock이 커밋 사이에도 유지되도록 세션을 하나의 연결에 묶습니다.
+    async with engine.connect() as connection, AsyncSessionLocal(bind=connection) as db:
+        crud_novel_stats = CRUDNovelStats(db)
+        if not await crud_novel_stats.try_lock_stats_refresh():
+            return
+        try:
+            await db.commit()
+            fixed, after = 0, 0
+            while novel_ids := await crud_novel_stats.get_novel_ids(
+                after=after, limit=settings.NOVEL_STATS_REFRESH_BATCH_SIZE
+            ):
+                fixed += len(await crud_novel_stats.refresh_stats(novel_ids))
+                await db.commit()
+                after = novel_ids[-1]
+            if changed := await crud_novel_stats.get_stats_changed_since(since):
+                CRUDNovel(db).publish_changed(*changed)
+            await db.commit()
+            logger.info("소설 통계를 다시 계산했습니다. fixed=%d changed=%d", fixed, len(changed))
+        finally:
+            # 실패한 트랜잭션에서는 lock을 해제할 수 없으므로 먼저 롤백합니다.
+            await db.rollback()
+            await crud_novel_stats.unlock_stats_refresh()
+            await db.commit()
+
+
+novel_stats_refresh = PeriodicTask(
+    "novel-stats-refresh", refresh_novel_stats, interval=settings.NOVEL_STATS_REFRESH_INTERVAL_SECONDS
+)
+metrics.register("novel_stats_refresh", lambda: novel_stats_refresh.stats)
+
+# 인기 순위의 집계 기간입니다.
+_TRENDING_WINDOWS = {NovelRankingPeriod.DAY: timedelta(days=1), NovelRankingPeriod.WEEK: timedelta(days=7)}
+
+novel_activity = BucketCounter(settings.NOVEL_ACTIVITY_BUCKET_SECONDS)
+metrics.register("novel_activity", lambda: novel_activity.stats)
+
+
+def _ranking_key(ranking: NovelRankingType, period: NovelRankingPeriod) -> str:
+    """순위 스냅샷에 저장하는 순위 이름을 반환합니다. 인기 순위는 기간별로 따로 저장합니다."""
+    if ranking == NovelRankingType.TRENDING:
+        return f"{ranking.value}_{period.value}"
+    return ranking.value
+
+
+async def flush_novel_activity() -> None:
+    """워커 프로세스에 모인 소설 활동 수를 DB에 더합니다. 실패하면 다음 실행에서 다시 더합니다."""
+    if not (counts := novel_activity.drain()):
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            await CRUDNovelSnapshot(db).add_activity(
+                {
+                    (novel_id, datetime.fromtimestamp(bucket, timezone.utc)): count
+                    for (novel_id, bucket), count in counts.items()
+                }
+            )
+            await db.commit()
+    except BaseException:
+        novel_activity.restore(counts)
+        raise
+
+
+async def refresh_novel_rankings() -> None:
+    """소설 순위 스냅샷을 다시 계산합니다. advisory lock을 얻은 워커 프로세스 하나만 실행합니다."""
+    async with AsyncSessionLocal() as db:
+        crud_novel_snapshot = CRUDNovelSnapshot(db)
+        if not await crud_novel_snapshot.try_lock_rankings_refresh():
+            return
+        await crud_novel_snapshot.refresh_rankings(
+            size=settings.NOVEL_RANKING_SIZE,
+            min_star_count=settings.NOVEL_RANKING_MIN_STAR_COUNT,
+            trending={
+                _ranking_key(NovelRankingType.TRENDING, period): window for period, window in _TRENDING_WINDOWS.items()
+            },
+        )
+        await db.commit()
+
+
+novel_activity_flush = PeriodicTask(
+    "novel-activity-flush", flush_novel_activity, interval=settings.NOVEL_ACTIVITY_FLUSH_INTERVAL_SECONDS
+)
+metrics.register("novel_activity_flush", lambda: novel_activity_flush.stats)
+
+novel_rankings_refresh = PeriodicTask(
+    "novel-rankings-refresh", refresh_novel_rankings, interval=settings.NOVEL_RANKING_REFRESH_INTERVAL_SECONDS
+)
+metrics.register("novel_rankings_refresh", lambda: novel_rankings_refresh.stats)
+
+
+async def refresh_novel_recommendations() -> None:
+    """메모의 평가로 비슷한 소설과 사용자별 추천 소설 스냅샷을 다시 계산합니다.
+
+    advisory lock을 얻은 워커 프로세스 하나만 실행하며, 한 트랜잭션에서 지우고 다시 쓰므로 조회하는 쪽은
+    이전 스냅샷이나 새 스냅샷 중 하나만 봅니다. 행렬 계산은 이벤트 루프를 막지 않도록 블록마다 스레드에서 실행합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        crud_novel_snapshot = CRUDNovelSnapshot(db)
+        if not await crud_novel_snapshot.try_lock_recommendations_refresh():
+            return
+        # 행마다 파이썬 객체를 쌓지 않도록 평가를 고정 크기 배열에 모읍니다.
+        user_ids, novel_ids, ratings = array("i"), array("i"), array("f")
+        async for rows in crud_novel_snapshot.stream_ratings(settings.NOVEL_RECOMMENDATION_FETCH_SIZE):
+            for row in rows:
+                user_ids.append(row.user_id)
+                novel_ids.append(row.novel_id)
+                ratings.append(row.rating)
+        matrix, users, novels = await asyncio.to_thread(interaction_matrix, user_ids, novel_ids, ratings)
+        del user_ids, novel_ids, ratings
+
+        await crud_novel_snapshot.clear_recommendations()
+        size, block_size = settings.NOVEL_RECOMMENDATION_SIZE, settings.NOVEL_RECOMMENDATION_BLOCK_SIZE
+        blocks = similar_novels(matrix, size, block_size)
+        tops = [top async for top in _add_blocks(blocks, crud_novel_snapshot.add_similarities, novels, novels)]
+        neighbors = await asyncio.to_thread(neighbor_matrix, tops, len(novels))
+        blocks = recommend_novels(matrix, neighbors, size, block_size * 8)
+        async for _ in _add_blocks(blocks, crud_novel_snapshot.add_recommendations, users, novels):
+            pass
+        await db.commit()
+        logger.info("추천 소설을 다시 계산했습니다. users=%d novels=%d ratings=%d", *matrix.shape, matrix.nnz)
+
+
+async def _add_blocks(
+    blocks: Iterator[TopK], add: Callable[..., Awaitable[None]], rows: np.ndarray, cols: np.ndarray
+) -> AsyncIterator[TopK]:
+    """블록을 스레드에서 하나씩 계산하여 행과 열 번호를 id로 바꿔 쓰고, 쓴 블록을 반환합니다."""
+    while (top := await asyncio.to_thread(next, blocks, None)) is not None:
+        await add(rows[top.rows].tolist(), top.ranks.tolist(), cols[top.cols].tolist(), top.scores.tolist())
+        yield top
+
+
+novel_recommendations_refresh = PeriodicTask(
+    "novel-recommendations-refresh",
+    refresh_novel_recommendations,
+    interval=settings.NOVEL_RECOMMENDATION_REFRESH_INTERVAL_SECONDS,
+)
+metrics.register("novel_recommendations_refresh", lambda: novel_recommendations_refresh.stats)
+
+novel_content_index = NovelContentIndex()
+metrics.register("novel_content_index", lambda: novel_content_index.stats)
+
+
+async def _load_novel_content(crud_novel: CRUDNovel) -> None:
+    """내용 색인에 아직 없는 소설을 읽어 추가합니다. 다른 워커 프로세스가 등록한 소설도 함께 추가됩니다."""
+    novels = [
+        (novel.id, novel.category, novel.title, novel.description)
+        async for novel in crud_novel.stream_all(after=novel_content_index.last_id)
+    ]
+    await asyncio.to_thread(novel_content_index.add_many, novels)
+
+
+async def add_novel_content_similarities(novel_id: int) -> None:
+    """새 소설의 내용이 비슷한 소설을 계산하여 스냅샷에 반영합니다.
+
+    전체를 다시 계산하지 않고 새 소설의 목록을 쓴 뒤, 새 소설이 들어가야 하는 기존 소설의 목록만 다시 씁니다.
+    내용 색인은 처음 사용할 때 읽고 이후에는 새 소설만 덧붙이며, 갱신은 advisory lock으로 한 번에 하나씩 합니다.
+    """
+    size = settings.NOVEL_RECOMMENDATION_SIZE
+    async with AsyncSessionLocal() as db:
+        crud_novel_snapshot = CRUDNovelSnapshot(db)
+        await crud_novel_snapshot.lock_content_similarities()
+        await _load_novel_content(CRUDNovel(db))
+        if novel_id not in novel_content_index:
+            return
+        similar_ids, scores = await asyncio.to_thread(novel_content_index.neighbors, novel_id)
+        scores = dict(zip(similar_ids.tolist(), scores.tolist()))
+
+        # 목록이 다 차지 않았거나 새 소설이 가장 낮은 유사도보다 높은 소설의 목록만 다시 씁니다.
+        bounds = {row.novel_id: row for row in await crud_novel_snapshot.get_content_similarity_bounds(list(scores))}
+        targets = [
+            similar_id
+            for similar_id, score in scores.items()
+            if similar_id not in bounds or bounds[similar_id].count < size or score > bounds[similar_id].min_score
+        ]
+        lists = {similar_id: [] for similar_id in targets}
+        for row in await crud_novel_snapshot.get_content_similarities(targets):
+            if row.similar_novel_id != novel_id:
+                lists[row.novel_id].append((row.similar_novel_id, row.score))
+        for similar_id, items in lists.items():
+            items.append((novel_id, scores[similar_id]))
+            items.sort(key=lambda item: -item[1])
+        lists[novel_id] = list(scores.items())
+
+        rows = [
+            (source_id, rank, similar_id, score)
+            for source_id, items in lists.items()
+            for rank, (similar_id, score) in enumerate(items[:size], 1)
+        ]
+        await crud_novel_snapshot.clear_content_similarities(list(lists))
+        if rows:
+            await crud_novel_snapshot.add_content_similarities(*map(list, zip(*rows)))
+        await db.commit()
+
+
+async def refresh_novel_content_similarities() -> None:
+    """내용이 비슷한 소설 스냅샷을 모두 다시 계산합니다.
+
+    새 소설마다 하는 증분 갱신에서 반영하지 못한 제목과 설명의 수정, 문서 빈도의 변화를 보정합니다.
+    """
+    size, block_size = settings.NOVEL_RECOMMENDATION_SIZE, settings.NOVEL_RECOMMENDATION_BLOCK_SIZE
+    async with AsyncSessionLocal() as db:
+        crud_novel_snapshot = CRUDNovelSnapshot(db)
+        if not await crud_novel_snapshot.try_lock_content_similarities():
+            return
+        novel_content_index.clear()
+        await _load_novel_content(CRUDNovel(db))
+        await crud_novel_snapshot.clear_content_similarities()
+        blocks = novel_content_index.similar(size, block_size)
+        while (top := await asyncio.to_thread(next, blocks, None)) is not None:
+            await crud_novel_snapshot.add_content_similarities(
+                top.rows.tolist(), top.ranks.tolist(), top.cols.tolist(), top.scores.tolist()
+            )
+        await db.commit()
+        logger.info("내용이 비슷한 소설을 다시 계산했습니다. %s", novel_content_index.stats)
+
+
+novel_content_similarities_refresh = PeriodicTask(
+    "novel-content-similarities-refresh",
+    refresh_novel_content_similarities,
+    interval=settings.NOVEL_CONTENT_SIMILARITY_REFRESH_INTERVAL_SECONDS,
+)
+metrics.register("novel_content_similarities_refresh", lambda: novel_content_similarities_refresh.stats)
+
+
 class NovelService:
     """소설 관련 서비스"""
 
     def __init__(self, db: AsyncSession):
         self.crud_novel = CRUDNovel(db)
+        self.crud_novel_job = CRUDNovelJob(db)
+        self.crud_novel_snapshot = CRUDNovelSnapshot(db)
+
+    async def register(self, command: NovelCreate, user_id: int) -> NovelJobDTO:
+        """소설 등록 작업을 대기열에 추가합니다."""
+        if command.id and await self.crud_novel.get_by_platform_id(command.platform, command.id):
+            raise NovelError.NOVEL_ALREADY_EXISTS.http_exception
+        if await self.crud_novel_job.count_pending() >= settings.NOVEL_JOB_QUEUE_SIZE:
+            raise NovelError.NOVEL_JOB_QUEUE_FULL.http_exception
+        return to_dto(await self.crud_novel_job.create(user_id, command))
+
+    @classmethod
+    @property
+    def register_errors(cls) -> tuple:
+        """에러 메시지"""
+        return (NovelError.NOVEL_ALREADY_EXISTS, NovelError.NOVEL_JOB_QUEUE_FULL)
+
+    async def get_job(self, job_id: str, user_id: int) -> NovelJobDTO:
+        """사용자가 요청한 소설 등록 작업을 조회합니다."""
+        if not (job := await self.crud_novel_job.get(job_id, user_id)):
+            raise NovelError.NOVEL_JOB_NOT_FOUND.http_exception
+        return to_dto(job)
+
+    @classmethod
+    @property
+    def get_job_errors(cls) -> tuple:
+        """에러 메시지"""
+        return (NovelError.NOVEL_JOB_NOT_FOUND,)
 
     async def create(self, command: NovelCreate) -> NovelDTO:
         """소설을 생성합니다."""
-        if await self.crud_novel.get_by_platform_id(command.platform, command.id):
+        if command.id and await self.crud_novel.get_by_platform_id(command.platform, command.id):
             raise NovelError.NOVEL_ALREADY_EXISTS.http_exception
-
-        response = requests.post(
-            settings.NOVEL_FETCH_URL, json=command.model_dump(mode="json", exclude_none=True), timeout=30
-        )
+        # 같은 소설에 대한 동시 등록은 하나의 크롤링 결과를 공유합니다. 아이디를 모르는 URL 등록은 URL로 구분합니다.
+        return await novel_fetch_flight.do((command.platform, command.key), lambda: self._fetch(command))
+
+    async def _fetch(self, command: NovelCreate) -> NovelDTO:
+        """크롤러를 호출하여 소설을 등록합니다. 동시 등록이 함께 기다리므로 크롤링 외의 작업은 하지 않습니다."""
+        if settings.NOVEL_FETCH_ADVISORY_LOCK:
+            # 다른 워커 프로세스가 같은 소설을 등록하는 중이면 끝날 때까지 기다린 뒤 다시 확인합니다.
+            await self.crud_novel.lock_platform_id(command.platform, command.key)
+            if command.id and await self.crud_novel.get_by_platform_id(command.platform, command.id):
+                raise NovelError.NOVEL_ALREADY_EXISTS.http_exception
+
+        try:
+            response = await http_client.post(
+                settings.NOVEL_FETCH_URL,
+                json=command.model_dump(mode="json", exclude_none=True),
+                timeout=settings.NOVEL_FETCH_TIMEOUT,
+            )
+        except httpx.TimeoutException as exc:
+            raise NovelError.NOVEL_FETCH_TIMEOUT.http_exception from exc
+        except httpx.HTTPError as exc:
+            logger.error("크롤러 호출에 실패했습니다. %s", exc)
+            raise NovelError.UNEXPECTED_ERROR.http_exception from exc
 
         if response.status_code == 400:
             exception = NovelError.NOVEL_CREATE_FAILED.http_exception
@@ -90,10 +690,23 @@ class NovelService:
             NovelError.NOVEL_CREATE_FAILED,
             NovelError.NOVEL_NOT_FOUND,
             NovelError.UNEXPECTED_ERROR,
+            NovelError.NOVEL_FETCH_TIMEOUT,
         )
 
-    async def get(self, id: int) -> NovelDTO:
-        """소설을 조회합니다."""
+    async def get(self, id: int, version: ResourceVersion | None) -> NovelDTO:
+        """`get_version`으로 조회한 버전의 소설을 조회합니다. 버전이 없으면 캐시를 사용하지 않습니다."""
+        if version is None:
+            return await self._get(id)
+        return await novel_cache.get_novel(id, version, lambda: self._get(id))
+
+    async def get_version(self, id: int) -> ResourceVersion | None:
+        """소설의 버전을 조회합니다. 소설이 없으면 None입니다."""
+        if (updated_at := await self.crud_novel.get_updated_at(id)) is None:
+            return None
+        return ResourceVersion.of("novel", id, updated_at=(updated_at,))
+
+    async def _get(self, id: int) -> NovelDTO:
+        """저장소에서 소설을 조회합니다."""
         item = await self.crud_novel.get(id)
         if not item:
             raise NovelError.NOVEL_NOT_FOUND.http_exception
@@ -104,13 +717,7 @@ class NovelService:
         item = await self.crud_novel.get(id)
         if not item:
             raise NovelError.NOVEL_NOT_FOUND.http_exception
-        new_item: NovelDTO = to_dto(item)
-        if memo := await self.crud_novel.get_memo(id, user_id):
-            new_item.average_star = memo.average_star
-            new_item.is_favorite = memo.is_favorite
-            new_item.content = memo.content
-            new_item.modified_at = memo.modified_at
-        return new_item
+        return _novel_dto_with_memo(item, await self.crud_novel.get_memo(id, user_id))
 
     @classmethod
     @property
@@ -118,27 +725,88 @@ class NovelService:
         """에러 메시지"""
         return (NovelError.NOVEL_NOT_FOUND,)
 
+    @classmethod
+    @property
+    def get_multi_errors(cls) -> tuple:
+        """에러 메시지"""
+        return (NovelError.INVALID_CURSOR,)
+
     async def get_multi(self, command: NovelsRequest) -> NovelsDTO:
         """소설 목록을 조회합니다."""
-        items = await self.crud_novel.get_multi(**command.model_dump())
-        return NovelsDTO(items=items)
+        params = _novels_page_params(command)
+        if novel_search_index.ready and command.order_by not in _STATS_ORDERS:
+            items = novel_search_index.search(**params)
+        else:
+            items = [to_dto(item) for item in await self.crud_novel.get_multi(**params)]
+        return NovelsDTO.from_trusted({"items": items, "next_cursor": _novels_next_cursor(command, params, items)})
 
     async def get_multi_with_memo(self, command: NovelsRequest, user_id: int) -> NovelsDTO:
         """소설 목록을 조회합니다."""
-        items = await self.crud_novel.get_multi(**command.model_dump())
-        novel_ids = [item.id for item in items]
-        memos = await self.crud_novel.get_memo_multi(user_id, novel_ids)
-        memo_dict = {memo.novel_id: memo for memo in memos}
-        new_items = []
-        for item in items:
-            new_item: NovelDTO = to_dto(item)
-            if memo := memo_dict.get(item.id):
-                new_item.average_star = memo.average_star
-                new_item.is_favorite = memo.is_favorite
-                new_item.content = memo.content
-                new_item.modified_at = memo.modified_at
-            new_items.append(new_item)
-        return NovelsDTO(items=new_items)
+        params = _novels_page_params(command)
+        if novel_search_index.ready and command.order_by not in _STATS_ORDERS:
+            novels = novel_search_index.search(**params)
+            # 색인이 소설을 찾으므로 데이터베이스에는 메모 조회 한 번만 보냅니다. 빈 목록은 모든 메모를 뜻하므로 건너뜁니다.
+            memos = await self.crud_novel.get_memo_multi(user_id, [novel.id for novel in novels]) if novels else []
+            memo_dict = {memo.novel_id: memo for memo in memos}
+            items = [_novel_dto_with_memo(novel, memo_dict.get(novel.id)) for novel in novels]
+        else:
+            rows = await self.crud_novel.get_multi_with_memo(user_id, **params)
+            items = [_novel_dto_with_memo(row.Novel, row) for row in rows]
+        return NovelsDTO.from_trusted({"items": items, "next_cursor": _novels_next_cursor(command, params, items)})
+
+    async def get_rankings(self, command: NovelRankingsRequest) -> NovelRankingsDTO:
+        """미리 계산한 소설 순위를 조회합니다."""
+        rows = await self.crud_novel_snapshot.get_rankings(
+            _ranking_key(command.type, command.period), skip=command.skip, limit=command.limit
+        )
+        items = [
+            NovelRankingDTO.from_trusted({"rank": row.rank, "score": row.score, "novel": to_dto(row.Novel)})
+            for row in rows
+        ]
+        return NovelRankingsDTO.from_trusted({"items": items, "computed_at": rows[0].computed_at if rows else None})
+
+    async def get_similar(self, novel_id: int, command: SimilarNovelsRequest) -> NovelRecommendationsDTO:
+        """미리 계산한 비슷한 소설을 조회합니다."""
+        rows = await self.crud_novel_snapshot.get_similar(
+            novel_id, command.limit, by_content=command.by == SimilarNovelBasis.CONTENT
+        )
+        return _recommendations_dto(rows)
+
+    async def get_recommendations(self, user_id: int, command: NovelRecommendationsRequest) -> NovelRecommendationsDTO:
+        """미리 계산한 추천 소설을 조회합니다."""
+        return _recommendations_dto(await self.crud_novel_snapshot.get_recommendations(user_id, command.limit))
+
+    async def get_reading_positions(self, user_id: int, command: ReadingPositionsRequest) -> ReadingPositionsDTO:
+        """이어 읽을 소설 목록을 최근에 읽은 순서로 조회합니다."""
+        rows = await self.crud_novel.get_reading_positions(
+            user_id, limit=command.limit, after=_reading_positions_after(command)
+        )
+        items = [
+            ReadingPositionDTO.from_trusted(
+                {
+                    "novel": to_dto(row.Novel),
+                    "chapter_no": row.chapter_no,
+                    "latest_chapter_no": row.latest_chapter_no,
+                    "read_at": row.read_at,
+                }
+            )
+            for row in rows
+        ]
+        next_cursor = None
+        if len(items) == command.limit:
+            next_cursor = encode_cursor(items[-1].read_at, items[-1].novel.id)
+        return ReadingPositionsDTO.from_trusted({"items": items, "next_cursor": next_cursor})
+
+    @classmethod
+    @property
+    def get_reading_positions_errors(cls) -> tuple:
+        """에러 메시지"""
+        return (NovelError.INVALID_CURSOR,)
+
+    async def get_memo_version(self, novel_id: int, user_id: int) -> ResourceVersion:
+        """소설 메모의 버전을 조회합니다."""
+        updated_at = await self.crud_novel.get_memo_updated_at(novel_id, user_id)
+        return ResourceVersion.of("novel_memo", novel_id, user_id, updated_at=(updated_at,), private=True)
 
     async def get_memo(self, novel_id: int, user_id: int) -> NovelMemoDTO:
         """소설 메모를 조회합니다."""
@@ -146,38 +814,36 @@ class NovelService:
             return NovelMemoDTO(novel_id=novel_id, user_id=user_id)
         return to_dto(item)
 
+    async def get_progress_version(self, novel_id: int, user_id: int) -> ResourceVersion:
+        """소설 진행 상황의 버전을 조회합니다."""
+        updated_at = await self.crud_novel.get_memo_updated_at(novel_id, user_id)
+        return ResourceVersion.of("novel_progress", novel_id, user_id, updated_at=(updated_at,), private=True)
+
+    async def get_progress(self, novel_id: int, user_id: int) -> NovelProgressDTO:
+        """메모를 남긴 챕터 번호를 구간으로 묶어 조회합니다."""
+        progress = await self.crud_novel.get_memo_progress(novel_id, user_id) or b""
+        return NovelProgressDTO.from_trusted({"count": bitmap_count(progress), "ranges": bitmap_ranges(progress)})
+
     async def create_memo(self, command: NovelMemoCreate) -> NovelMemoDTO:
         """소설 메모를 생성합니다."""
-        # Dependency
-        await self.get(command.novel_id)
-        if await self.crud_novel.get_memo(command.novel_id, command.user_id, content_existed=False):
+        with foreign_key_error(NovelError.NOVEL_NOT_FOUND):
+            item = await self.crud_novel.create_memo(**command.model_dump(), overwrite=False)
+        if not item:
             raise NovelError.NOVEL_MEMO_ALREADY_EXISTS.http_exception
-
-        item = await self.crud_novel.create_memo(**command.model_dump())
         return to_dto(item)
 
     async def update_memo(self, command: NovelMemoCreate) -> NovelMemoDTO:
         """소설 메모를 수정합니다."""
-        # Dependency
-        await self.get(command.novel_id)
-        item = await self.crud_novel.create_memo(**command.model_dump())
+        with foreign_key_error(NovelError.NOVEL_NOT_FOUND):
+            item = await self.crud_novel.create_memo(**command.model_dump())
         return to_dto(item)
 
     async def delete_memo(self, novel_id: int, user_id: int) -> NovelMemoDTO:
         """소설 메모를 삭제합니다."""
-        # Dependency
-        await self.get(novel_id)
         if memo := await self.crud_novel.delete_memo(novel_id, user_id):
             return to_dto(memo)
         return NovelMemoDTO(novel_id=novel_id, user_id=user_id)
 
-    async def update_average_star(self, novel_id: int, user_id: int) -> NovelDTO:
-        """소설의 평균 별점을 업데이트합니다."""
-        # Dependency
-        await self.get(novel_id)
-        item = await self.crud_novel.update_average_star(novel_id, user_id)
-        return to_dto(item)
-
     @classmethod
     @property
     def create_memo_errors(cls) -> tuple:
@@ -192,15 +858,13 @@ class NovelService:
 
     async def mark_as_favorite(self, novel_id: int, user_id: int) -> NovelMemoDTO:
         """소설을 즐겨찾기에 추가합니다."""
-        # Dependency
-        await self.get(novel_id)
-        item = await self.crud_novel.mark_as_favorite(novel_id, user_id)
+        with foreign_key_error(NovelError.NOVEL_NOT_FOUND):
+            item = await self.crud_novel.mark_as_favorite(novel_id, user_id)
+        novel_activity.add(novel_id)
         return to_dto(item)
 
     async def unmark_as_favorite(self, novel_id: int, user_id: int) -> NovelMemoDTO:
         """소설을 즐겨찾기에서 제거합니다."""
-        # Dependency
-        await self.get(novel_id)
         if item := await self.crud_novel.unmark_as_favorite(novel_id, user_id):
             return to_dto(item)
         return NovelMemoDTO(novel_id=novel_id, user_id=user_id)
@@ -224,11 +888,7 @@ class ChapterService:
         item = await self.crud_chapter.get(novel_id, chapter_no)
         if not item:
             raise NovelError.CHAPTER_NOT_FOUND.http_exception
-        new_item: ChapterDTO = to_dto(item)
-        if memo := await self.crud_chapter.get_memo(novel_id, chapter_no, user_id):
-            new_item.star = memo.star
-            new_item.updated_at = memo.updated_at
-        return new_item
+        return _chapter_dto_with_memo(item, await self.crud_chapter.get_memo(novel_id, chapter_no, user_id))
 
     @classmethod
     @property
@@ -236,31 +896,50 @@ class ChapterService:
         """에러 메시지"""
         return (NovelError.CHAPTER_NOT_FOUND,)
 
-    async def get_multi(self, novel_id: int, command: ChaptersRequest) -> ChaptersDTO:
-        """소설 챕터 목록을 조회합니다."""
-        items = await self.crud_chapter.get_multi(novel_id, **command.model_dump())
-        return ChaptersDTO(items=items)
+    @classmethod
+    @property
+    def get_multi_errors(cls) -> tuple:
+        """에러 메시지"""
+        return (NovelError.INVALID_CURSOR,)
+
+    async def get_multi(self, novel_id: int, command: ChaptersRequest, version: ResourceVersion) -> ChaptersDTO:
+        """`get_multi_version`으로 조회한 버전의 소설 챕터 목록을 조회합니다."""
+        return await novel_cache.get_chapters(novel_id, command, version, lambda: self._get_multi(novel_id, command))
+
+    async def get_multi_version(self, novel_id: int, user_id: int | None = None) -> ResourceVersion:
+        """챕터 목록의 버전을 조회합니다. 사용자를 지정하면 사용자의 챕터 메모도 반영합니다."""
+        row = await self.crud_chapter.get_multi_version(novel_id, user_id)
+        return ResourceVersion.of(
+            "chapters",
+            novel_id,
+            user_id,
+            updated_at=(row.updated_at, row.memo_updated_at),
+            counts=(row.count, row.memo_count),
+            private=user_id is not None,
+        )
+
+    async def _get_multi(self, novel_id: int, command: ChaptersRequest) -> ChaptersDTO:
+        """저장소에서 소설 챕터 목록을 조회합니다."""
+        items = [to_dto(item) for item in await self.crud_chapter.get_multi(novel_id, **_chapters_page_params(command))]
+        return ChaptersDTO.from_trusted({"items": items, "next_cursor": _chapters_next_cursor(command, items)})
 
     async def get_multi_with_memo(self, novel_id: int, command: ChaptersRequest, user_id: int) -> ChaptersDTO:
         """소설 챕터 목록을 조회합니다."""
-        items = await self.crud_chapter.get_multi(novel_id, **command.model_dump())
-        chapter_nos = [item.chapter_no for item in items]
-        memos = await self.crud_chapter.get_memo_multi(novel_id, user_id, chapter_nos)
-        memo_dict = {memo.chapter_no: memo for memo in memos}
-        new_items = []
-        for item in items:
-            new_item: ChapterDTO = to_dto(item)
-            if memo := memo_dict.get(item.chapter_no):
-                new_item.star = memo.star
-                new_item.updated_at = memo.updated_at
-            new_items.append(new_item)
-        return ChaptersDTO(items=new_items)
+        rows = await self.crud_chapter.get_multi_with_memo(novel_id, user_id, **_chapters_page_params(command))
+        items = [_chapter_dto_with_memo(row.Chapter, row) for row in rows]
+        return ChaptersDTO.from_trusted({"items": items, "next_cursor": _chapters_next_cursor(command, items)})
+
+    async def get_memo_version(self, novel_id: int, chapter_no: int, user_id: int) -> ResourceVersion | None:
+        """챕터 메모의 버전을 조회합니다. 메모가 없으면 None입니다."""
+        if (updated_at := await self.crud_chapter.get_memo_updated_at(novel_id, chapter_no, user_id)) is None:
+            return None
+        return ResourceVersion.of("chapter_memo", novel_id, chapter_no, user_id, updated_at=(updated_at,), private=True)
 
     async def get_memo(self, novel_id: int, chapter_no: int, user_id: int) -> ChapterMemoDTO:
         """소설 챕터 메모를 조회합니다."""
         if not (item := await self.crud_chapter.get_memo(novel_id, chapter_no, user_id)):
             raise NovelError.CHAPTER_MEMO_NOT_FOUND.http_exception
-        return item
+        return to_dto(item)
 
     @classmethod
     @property
@@ -270,12 +949,11 @@ class ChapterService:
 
     async def create_memo(self, command: ChapterMemoCreate) -> ChapterMemoDTO:
         """소설 챕터 메모를 생성합니다."""
-        # Dependency
-        await self.get(command.novel_id, command.chapter_no)
-        if await self.crud_chapter.get_memo(command.novel_id, command.chapter_no, command.user_id):
+        with foreign_key_error(NovelError.CHAPTER_NOT_FOUND):
+            item = await self.crud_chapter.create_memo(**command.model_dump())
+        if not item:
             raise NovelError.CHAPTER_MEMO_ALREADY_EXISTS.http_exception
-
-        item = await self.crud_chapter.create_memo(**command.model_dump())
+        novel_activity.add(command.novel_id)
         return to_dto(item)
 
     @classmethod
@@ -284,17 +962,31 @@ class ChapterService:
         """에러 메시지"""
         return cls.get_errors + (NovelError.CHAPTER_MEMO_ALREADY_EXISTS,)
 
+    async def upsert_memo_multi(self, novel_id: int, user_id: int, command: ChapterMemoBatch) -> ChapterMemosDTO:
+        """소설 챕터 메모 여러 개를 한 번에 생성하거나 덮어씁니다."""
+        chapter_nos = [item.chapter_no for item in command.items]
+        if len(await self.crud_chapter.get_chapter_nos(novel_id, chapter_nos)) != len(chapter_nos):
+            raise NovelError.CHAPTER_NOT_FOUND.http_exception
+        items = await self.crud_chapter.upsert_memo_multi(novel_id, user_id, command.model_dump()["items"])
+        novel_activity.add(novel_id, len(items))
+        return ChapterMemosDTO.from_trusted({"items": [to_dto(item) for item in items]})
+
+    @classmethod
+    @property
+    def upsert_memo_multi_errors(cls) -> tuple:
+        """에러 메시지"""
+        return ChapterMemoBatch.errors + cls.get_errors
+
     async def update_memo(self, command: ChapterMemoUpdate) -> ChapterMemoDTO:
         """소설 챕터 메모를 수정합니다."""
-        # Dependency
         item = await self.crud_chapter.update_memo(**command.model_dump())
         if not item:
             raise NovelError.CHAPTER_MEMO_NOT_FOUND.http_exception
+        novel_activity.add(command.novel_id)
         return to_dto(item)
 
     async def delete_memo(self, novel_id: int, chapter_no: int, user_id: int) -> ChapterMemoDTO:
         """소설 챕터 메모를 삭제합니다."""
-        # Dependency
         item = await self.crud_chapter.delete_memo(novel_id, chapter_no, user_id)
         if not item:
             raise NovelError.CHAPTER_MEMO_NOT_FOUND.http_exception
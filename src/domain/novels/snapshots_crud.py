@@ -0,0 +1,373 @@
+"""소설 순위, 비슷한 소설, 추천 소설 스냅샷 CRUD 관련 모듈입니다."""
+# pylint: disable=not-callable
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Mapping, Sequence
+
+from sqlalchemy import FLOAT, INTEGER, Row, case, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.domain.base.crud import CRUD
+from src.domain.novels.models import (
+    Novel,
+    NovelActivity,
+    NovelContentSimilarity,
+    NovelMemo,
+    NovelRanking,
+    NovelSimilarity,
+    NovelStats,
+    UserRecommendation,
+)
+from src.domain.novels.schemas import NovelRankingType
+
+__all__ = ("CRUDNovelSnapshot",)
+
+# 활동 수를 한 문장에 더할 최대 행 수입니다.
+_ACTIVITY_CHUNK_SIZE = 1000
+
+# 추천에 사용하는 메모의 평가입니다. 별점이 없는 메모는 중간 별점(5)으로 보고, 즐겨찾기는 별점 5만큼 더합니다.
+_MEMO_RATING = (func.coalesce(NovelMemo.average_star, 5) + case((NovelMemo.is_favorite, 5), else_=0)) / 5
+
+
+class CRUDNovelSnapshot(CRUD[Novel]):
+    """소설 순위, 비슷한 소설, 추천 소설 스냅샷과 그 계산에 쓰는 활동 수 CRUD 클래스
+
+    스냅샷은 주기 작업이 다시 계산하여 통째로 바꾸고, 요청은 읽기만 합니다.
+    """
+
+    async def try_lock_rankings_refresh(self) -> bool:
+        """소설 순위 재계산에 대한 트랜잭션 advisory lock을 기다리지 않고 획득합니다.
+
+        lock은 현재 트랜잭션이 끝날 때 해제됩니다.
+
+        Returns:
+            bool: lock을 획득했으면 True입니다.
+        """
+        return await self.db.scalar(select(func.pg_try_advisory_xact_lock(func.hashtext("novel_rankings:refresh"))))
+
+    async def try_lock_recommendations_refresh(self) -> bool:
+        """비슷한 소설과 추천 소설 재계산에 대한 트랜잭션 advisory lock을 기다리지 않고 획득합니다.
+
+        lock은 현재 트랜잭션이 끝날 때 해제됩니다.
+
+        Returns:
+            bool: lock을 획득했으면 True입니다.
+        """
+        return await self.db.scalar(
+            select(func.pg_try_advisory_xact_lock(func.hashtext("novel_recommendations:refresh")))
+        )
+
+    async def lock_content_similarities(self) -> None:
+        """내용이 비슷한 소설 갱신에 대한 트랜잭션 advisory lock을 획득합니다. 다른 갱신이 끝날 때까지 기다립니다."""
+        await self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext("novel_content_similarities"))))
+
+    async def try_lock_content_similarities(self) -> bool:
+        """내용이 비슷한 소설 갱신에 대한 트랜잭션 advisory lock을 기다리지 않고 획득합니다.
+
+        Returns:
+            bool: lock을 획득했으면 True입니다.
+        """
+        return await self.db.scalar(select(func.pg_try_advisory_xact_lock(func.hashtext("novel_content_similarities"))))
+
+    async def add_activity(self, counts: Mapping[tuple[int, datetime], int]) -> None:
+        """소설 활동 수를 버킷별로 더합니다.
+
+        Args:
+            counts (Mapping[tuple[int, datetime], int]): `(소설 id, 버킷 시작 시각)`별 증가분입니다.
+        """
+        table = NovelActivity.__table__
+        # 여러 워커 프로세스가 같은 행들을 더할 때 교착 상태가 생기지 않도록 모두 같은 순서로 씁니다.
+        items = sorted(counts.items())
+        for start in range(0, len(items), _ACTIVITY_CHUNK_SIZE):
+            stmt = pg_insert(table).values(
+                [
+                    {
+                        "novel_id": novel_id,
+                        "bucket_at": bucket_at,
+                        "count": count,
+                        "created_at": func.now(),
+                        "updated_at": func.now(),
+                    }
+                    for (novel_id, bucket_at), count in items[start : start + _ACTIVITY_CHUNK_SIZE]
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.novel_id, table.c.bucket_at],
+                set_={"count": table.c["count"] + stmt.excluded["count"], "updated_at": func.now()},
+            )
+            await self.db.execute(stmt)
+
+    async def refresh_rankings(self, *, size: int, min_star_count: int, trending: Mapping[str, timedelta]) -> None:
+        """소설 순위 스냅샷을 다시 계산하여 통째로 바꾸고, 가장 긴 인기 순위 기간보다 오래된 활동 수를 지웁니다.
+
+        별점과 즐겨찾기 순위는 소설 통계의 인덱스로, 인기 순위는 기간 안의 활동 수 버킷을 합산하여 계산합니다.
+        같은 트랜잭션에서 지우고 다시 쓰므로 조회하는 쪽은 이전 스냅샷이나 새 스냅샷 중 하나만 봅니다.
+
+        Args:
+            size (int): 순위마다 저장할 소설 수입니다.
+            min_star_count (int): 별점 순위에 오르기 위한 최소 별점 개수입니다.
+            trending (Mapping[str, timedelta]): 인기 순위 이름별 집계 기간입니다.
+        """
+        sources = {
+            NovelRankingType.TOP_RATED.value: select(
+                NovelStats.novel_id.label("novel_id"), NovelStats.average_star.label("score")
+            )
+            .where(NovelStats.star_count >= min_star_count)
+            .order_by(NovelStats.average_star.desc(), NovelStats.novel_id.desc()),
+            NovelRankingType.MOST_FAVORITED.value: select(
+                NovelStats.novel_id.label("novel_id"), NovelStats.favorite_count.label("score")
+            )
+            .where(NovelStats.favorite_count > 0)
+            .order_by(NovelStats.favorite_count.desc(), NovelStats.novel_id.desc()),
+        }
+        for name, window in trending.items():
+            score = func.sum(NovelActivity.count)
+            sources[name] = (
+                select(NovelActivity.novel_id.label("novel_id"), score.label("score"))
+                .where(NovelActivity.bucket_at > func.now() - window)
+                .group_by(NovelActivity.novel_id)
+                .order_by(score.desc(), NovelActivity.novel_id.desc())
+            )
+
+        table = NovelRanking.__table__
+        await self.db.execute(delete(table))
+        for name, source in sources.items():
+            ranked = source.limit(size).subquery("ranked")
+            rank = func.row_number().over(order_by=(ranked.c.score.desc(), ranked.c.novel_id.desc()))
+            await self.db.execute(
+                pg_insert(table).from_select(
+                    ["ranking", "rank", "novel_id", "score", "created_at", "updated_at"],
+                    select(literal(name), rank, ranked.c.novel_id, ranked.c.score, func.now(), func.now()),
+                )
+            )
+        if trending:
+            await self.db.execute(
+                delete(NovelActivity).where(NovelActivity.bucket_at <= func.now() - max(trending.values()))
+            )
+
+    async def get_rankings(self, ranking: str, *, skip: int = 0, limit: int) -> Sequence[Row]:
+        """소설 순위 스냅샷을 조회합니다.
+
+        Args:
+            ranking (str): 순위 이름입니다.
+            skip (int, optional): 건너뛸 개수입니다. Defaults to 0.
+            limit (int): 최대 개수입니다.
+
+        Returns:
+            Sequence[Row]: `Novel`과 `rank`, `score`, `computed_at` 컬럼을 담은 행 목록입니다. 순위 순서로 정렬됩니다.
+        """
+        stmt = (
+            select(Novel, NovelRanking.rank, NovelRanking.score, NovelRanking.created_at.label("computed_at"))
+            .join(NovelRanking, NovelRanking.novel_id == Novel.id)
+            .where(NovelRanking.ranking == ranking)
+            .order_by(NovelRanking.rank)
+            .offset(skip)
+            .limit(limit)
+        )
+        return (await self.db.execute(stmt)).all()
+
+    async def stream_ratings(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        """모든 소설 메모의 평가를 서버 측 커서로 나누어 조회합니다.
+
+        Args:
+            batch_size (int): 한 번에 가져올 개수입니다.
+
+        Yields:
+            Sequence[Row]: `user_id`, `novel_id`, `rating` 컬럼을 담은 행 목록입니다.
+        """
+        stmt = select(NovelMemo.user_id, NovelMemo.novel_id, _MEMO_RATING.label("rating"))
+        result = await self.db.stream(stmt.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield rows
+
+    async def clear_recommendations(self) -> None:
+        """비슷한 소설과 추천 소설 스냅샷을 모두 지웁니다."""
+        await self.db.execute(delete(NovelSimilarity))
+        await self.db.execute(delete(UserRecommendation))
+
+    async def add_similarities(
+        self,
+        novel_ids: Sequence[int],
+        ranks: Sequence[int],
+        similar_novel_ids: Sequence[int],
+        scores: Sequence[float],
+    ) -> None:
+        """비슷한 소설을 추가합니다. 모든 인자는 같은 길이입니다.
+
+        Args:
+            novel_ids (Sequence[int]): 소설 id 목록입니다.
+            ranks (Sequence[int]): 소설마다의 순위 목록입니다.
+            similar_novel_ids (Sequence[int]): 비슷한 소설 id 목록입니다.
+            scores (Sequence[float]): 코사인 유사도 목록입니다.
+        """
+        await self.db.execute(
+            _insert_arrays(
+                NovelSimilarity,
+                novel_id=(novel_ids, INTEGER),
+                rank=(ranks, INTEGER),
+                similar_novel_id=(similar_novel_ids, INTEGER),
+                score=(scores, FLOAT),
+            )
+        )
+
+    async def add_recommendations(
+        self,
+        user_ids: Sequence[int],
+        ranks: Sequence[int],
+        novel_ids: Sequence[int],
+        scores: Sequence[float],
+    ) -> None:
+        """추천 소설을 추가합니다. 모든 인자는 같은 길이입니다.
+
+        Args:
+            user_ids (Sequence[int]): 사용자 id 목록입니다.
+            ranks (Sequence[int]): 사용자마다의 순위 목록입니다.
+            novel_ids (Sequence[int]): 추천 소설 id 목록입니다.
+            scores (Sequence[float]): 추천 점수 목록입니다.
+        """
+        await self.db.execute(
+            _insert_arrays(
+                UserRecommendation,
+                user_id=(user_ids, INTEGER),
+                rank=(ranks, INTEGER),
+                novel_id=(novel_ids, INTEGER),
+                score=(scores, FLOAT),
+            )
+        )
+
+    async def clear_content_similarities(self, novel_ids: Sequence[int] | None = None) -> None:
+        """내용이 비슷한 소설 스냅샷을 지웁니다.
+
+        Args:
+            novel_ids (Sequence[int]|None, optional): 목록을 지울 소설 id 목록입니다. None이면 모두 지웁니다.
+                Defaults to None.
+        """
+        stmt = delete(NovelContentSimilarity)
+        if novel_ids is not None:
+            stmt = stmt.where(NovelContentSimilarity.novel_id.in_(novel_ids))
+        await self.db.execute(stmt)
+
+    async def add_content_similarities(
+        self,
+        novel_ids: Sequence[int],
+        ranks: Sequence[int],
+        similar_novel_ids: Sequence[int],
+        scores: Sequence[float],
+    ) -> None:
+        """내용이 비슷한 소설을 추가합니다. 모든 인자는 같은 길이입니다.
+
+        Args:
+            novel_ids (Sequence[int]): 소설 id 목록입니다.
+            ranks (Sequence[int]): 소설마다의 순위 목록입니다.
+            similar_novel_ids (Sequence[int]): 비슷한 소설 id 목록입니다.
+            scores (Sequence[float]): TF-IDF 코사인 유사도 목록입니다.
+        """
+        await self.db.execute(
+            _insert_arrays(
+                NovelContentSimilarity,
+                novel_id=(novel_ids, INTEGER),
+                rank=(ranks, INTEGER),
+                similar_novel_id=(similar_novel_ids, INTEGER),
+                score=(scores, FLOAT),
+            )
+        )
+
+    async def get_content_similarity_bounds(self, novel_ids: Sequence[int]) -> Sequence[Row]:
+        """소설들의 내용이 비슷한 소설 목록의 길이와 가장 낮은 유사도를 조회합니다.
+
+        Args:
+            novel_ids (Sequence[int]): 소설 id 목록입니다.
+
+        Returns:
+            Sequence[Row]: `novel_id`, `count`, `min_score` 컬럼을 담은 행 목록입니다. 목록이 없는 소설은 없습니다.
+        """
+        stmt = (
+            select(
+                NovelContentSimilarity.novel_id,
+                func.count().label("count"),
+                func.min(NovelContentSimilarity.score).label("min_score"),
+            )
+            .where(NovelContentSimilarity.novel_id.in_(novel_ids))
+            .group_by(NovelContentSimilarity.novel_id)
+        )
+        return (await self.db.execute(stmt)).all()
+
+    async def get_content_similarities(self, novel_ids: Sequence[int]) -> Sequence[Row]:
+        """소설들의 내용이 비슷한 소설 목록을 조회합니다.
+
+        Args:
+            novel_ids (Sequence[int]): 소설 id 목록입니다.
+
+        Returns:
+            Sequence[Row]: `novel_id`, `similar_novel_id`, `score` 컬럼을 담은 행 목록입니다. 소설, 순위 순서로 정렬됩니다.
+        """
+        stmt = (
+            select(
+                NovelContentSimilarity.novel_id,
+                NovelContentSimilarity.similar_novel_id,
+                NovelContentSimilarity.score,
+            )
+            .where(NovelContentSimilarity.novel_id.in_(novel_ids))
+            .order_by(NovelContentSimilarity.novel_id, NovelContentSimilarity.rank)
+        )
+        return (await self.db.execute(stmt)).all()
+
+    async def get_similar(self, novel_id: int, limit: int, *, by_content: bool = False) -> Sequence[Row]:
+        """비슷한 소설 스냅샷을 조회합니다.
+
+        Args:
+            novel_id (int): 소설 id입니다.
+            limit (int): 최대 개수입니다.
+            by_content (bool, optional): True이면 평가 대신 내용이 비슷한 소설을 조회합니다. Defaults to False.
+
+        Returns:
+            Sequence[Row]: `Novel`과 `score`, `computed_at` 컬럼을 담은 행 목록입니다. 유사도 순서로 정렬됩니다.
+        """
+        model = NovelContentSimilarity if by_content else NovelSimilarity
+        stmt = (
+            select(Novel, model.score, model.created_at.label("computed_at"))
+            .join(model, model.similar_novel_id == Novel.id)
+            .where(model.novel_id == novel_id)
+            .order_by(model.rank)
+            .limit(limit)
+        )
+        return (await self.db.execute(stmt)).all()
+
+    async def get_recommendations(self, user_id: int, limit: int) -> Sequence[Row]:
+        """추천 소설 스냅샷을 조회합니다. 계산한 뒤 서재에 추가한 소설은 제외합니다.
+
+        Args:
+            user_id (int): 사용자 id입니다.
+            limit (int): 최대 개수입니다.
+
+        Returns:
+            Sequence[Row]: `Novel`과 `score`, `computed_at` 컬럼을 담은 행 목록입니다. 점수 순서로 정렬됩니다.
+        """
+        in_library = (
+            select(NovelMemo.novel_id)
+            .where(NovelMemo.novel_id == UserRecommendation.novel_id, NovelMemo.user_id == user_id)
+            .exists()
+        )
+        stmt = (
+            select(Novel, UserRecommendation.score, UserRecommendation.created_at.label("computed_at"))
+            .join(UserRecommendation, UserRecommendation.novel_id == Novel.id)
+            .where(UserRecommendation.user_id == user_id, ~in_library)
+            .order_by(UserRecommendation.rank)
+            .limit(limit)
+        )
+        return (await self.db.execute(stmt)).all()
+
+
+def _insert_arrays(model: type, **columns: tuple[Sequence, Any]) -> Insert:
+    """같은 길이의 배열들을 `unnest`로 펼쳐 한 문장으로 삽입하는 문을 반환합니다.
+
+    Args:
+        model (type): 삽입할 모델입니다.
+        **columns (tuple[Sequence, Any]): 컬럼 이름별 (값 목록, 컬럼 타입)입니다.
+
+    Returns:
+        Insert: 삽입 문입니다. `created_at`과 `updated_at`은 현재 시각입니다.
+    """
+    arrays = [literal(list(values), ARRAY(type_)) for values, type_ in columns.values()]
+    rows = func.unnest(*arrays).table_valued(*columns).render_derived()
+    return pg_insert(model).from_select([*columns, "created_at", "updated_at"], select(*rows.c, func.now(), func.now()))
@@ -0,0 +1,125 @@
+"""소설 통계 재계산 CRUD 관련 모듈입니다."""
+# pylint: disable=not-callable
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.domain.base.crud import CRUD
+from src.domain.novels.models import Chapter, Novel, NovelMemo, NovelStats
+
+__all__ = ("CRUDNovelStats",)
+
+
+class CRUDNovelStats(CRUD[NovelStats]):
+    """소설 통계 재계산 CRUD 클래스
+
+    메모를 쓰는 문장이 소설 통계를 증분 갱신하고, 이 클래스는 주기적으로 다시 계산하여 보정합니다.
+    """
+
+    async def try_lock_stats_refresh(self) -> bool:
+        """소설 통계 재계산에 대한 세션 advisory lock을 기다리지 않고 획득합니다.
+
+        lock은 트랜잭션이 끝나도 유지되고 `unlock_stats_refresh`를 호출하거나 연결이 끊어질 때 해제되므로,
+        세션을 하나의 연결에 묶어서 사용해야 합니다.
+
+        Returns:
+            bool: lock을 획득했으면 True입니다.
+        """
+        return await self.db.scalar(select(func.pg_try_advisory_lock(func.hashtext("novel_stats:refresh"))))
+
+    async def unlock_stats_refresh(self) -> None:
+        """`try_lock_stats_refresh`로 획득한 lock을 해제합니다."""
+        await self.db.execute(select(func.pg_advisory_unlock(func.hashtext("novel_stats:refresh"))))
+
+    async def refresh_stats(self, novel_ids: Sequence[int]) -> Sequence[NovelStats]:
+        """챕터와 소설 메모로부터 소설 통계를 다시 계산하고, 통계 행이 없으면 만듭니다.
+
+        통계 행을 먼저 잠근 뒤 다음 문장에서 다시 계산하므로, 같은 소설의 메모를 쓰는 트랜잭션의 증분 갱신은
+        재계산 결과에 포함되거나 재계산이 끝난 뒤에 더해집니다.
+
+        Args:
+            novel_ids (Sequence[int]): 소설의 id입니다.
+
+        Returns:
+            Sequence[NovelStats]: 값이 바뀌었거나 새로 만든 소설 통계 목록입니다.
+        """
+        table = NovelStats.__table__
+        await self.db.execute(
+            select(table.c.novel_id).where(table.c.novel_id.in_(novel_ids)).order_by(table.c.novel_id).with_for_update()
+        )
+        chapters = (
+            select(
+                Chapter.novel_id,
+                func.count().label("chapter_count"),
+                func.max(Chapter.chapter_no).label("latest_chapter_no"),
+            )
+            .where(Chapter.novel_id.in_(novel_ids))
+            .group_by(Chapter.novel_id)
+            .subquery("chapters")
+        )
+        memos = (
+            select(
+                NovelMemo.novel_id,
+                func.count().label("reader_count"),
+                func.count().filter(NovelMemo.is_favorite).label("favorite_count"),
+                func.sum(NovelMemo.star_sum).label("star_sum"),
+                func.sum(NovelMemo.star_count).label("star_count"),
+            )
+            .where(NovelMemo.novel_id.in_(novel_ids))
+            .group_by(NovelMemo.novel_id)
+            .subquery("memos")
+        )
+        columns = ("chapter_count", "latest_chapter_no", "reader_count", "favorite_count", "star_sum", "star_count")
+        stmt = pg_insert(table).from_select(
+            ["novel_id", *columns, "created_at", "updated_at"],
+            select(
+                Novel.id,
+                func.coalesce(chapters.c.chapter_count, 0),
+                chapters.c.latest_chapter_no,
+                func.coalesce(memos.c.reader_count, 0),
+                func.coalesce(memos.c.favorite_count, 0),
+                func.coalesce(memos.c.star_sum, 0),
+                func.coalesce(memos.c.star_count, 0),
+                func.now(),
+                func.now(),
+            )
+            .outerjoin(chapters, chapters.c.novel_id == Novel.id)
+            .outerjoin(memos, memos.c.novel_id == Novel.id)
+            .where(Novel.id.in_(novel_ids)),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.novel_id],
+            set_={**{name: stmt.excluded[name] for name in columns}, "updated_at": func.now()},
+            # 증분 갱신으로 이미 맞는 행은 쓰지 않습니다.
+            where=tuple_(*(table.c[name] for name in columns)).is_distinct_from(
+                tuple_(*(stmt.excluded[name] for name in columns))
+            ),
+        )
+        stmt = select(NovelStats).from_statement(stmt.returning(*table.c)).execution_options(populate_existing=True)
+        return (await self.db.scalars(stmt)).all()
+
+    async def get_novel_ids(self, *, after: int = 0, limit: int) -> Sequence[int]:
+        """소설 id를 오름차순으로 조회합니다.
+
+        Args:
+            after (int, optional): 이 id보다 큰 소설만 조회합니다. Defaults to 0.
+            limit (int): 최대 개수입니다.
+
+        Returns:
+            Sequence[int]: 소설 id 목록입니다.
+        """
+        stmt = select(Novel.id).where(Novel.id > after).order_by(Novel.id).limit(limit)
+        return (await self.db.scalars(stmt)).all()
+
+    async def get_stats_changed_since(self, since: datetime) -> Sequence[int]:
+        """통계가 주어진 시각 이후에 바뀐 소설의 id를 조회합니다.
+
+        Args:
+            since (datetime): 기준 시각입니다.
+
+        Returns:
+            Sequence[int]: 소설 id 목록입니다.
+        """
+        return (await self.db.scalars(select(NovelStats.novel_id).where(NovelStats.updated_at > since))).all()
@@ -0,0 +1,166 @@
+"""동기화에 사용하는 변경 조회를 정의합니다."""
+# pylint: disable=too-many-arguments
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import Select, and_, select, true, union_all
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from src.domain.base.crud import CRUD
+from src.domain.novels.models import Chapter, ChapterMemo, Novel, NovelMemo
+from src.domain.sync.models import MemoTombstone
+
+__all__ = ("CRUDSync",)
+
+
+def _changed_since(column, since: datetime | None):
+    """`since` 이후에 바뀐 행의 조건을 반환합니다. `since`가 None이면 모든 행입니다."""
+    return true() if since is None else column > since
+
+
+def _library_changes(
+    model: type,
+    novel_id: InstrumentedAttribute,
+    updated_at: InstrumentedAttribute,
+    user_id: int,
+    since: datetime | None,
+    *,
+    order_by: tuple[InstrumentedAttribute, ...],
+) -> Select:
+    """서재의 소설에 속한 행 중 `since` 이후 바뀌었거나, 서재에 새로 추가된 소설의 행을 조회하는 문을 반환합니다.
+
+    두 조건을 OR로 묶으면 `updated_at` 인덱스로 범위를 좁힐 수 없어 서재의 모든 행을 읽으므로,
+    새로 추가된 소설의 모든 행과 나머지 소설의 바뀐 행을 따로 조회하여 UNION ALL로 합칩니다.
+
+    Args:
+        model (type): 조회할 모델입니다.
+        novel_id (InstrumentedAttribute): 모델의 소설 id 컬럼입니다.
+        updated_at (InstrumentedAttribute): 모델의 수정일 컬럼입니다.
+        user_id (int): 사용자의 id입니다.
+        since (datetime|None): 이 시각 이후의 변경만 조회합니다. None이면 서재의 모든 행입니다.
+        order_by (tuple[InstrumentedAttribute, ...]): 정렬할 모델의 컬럼입니다.
+
+    Returns:
+        Select: 조회 문입니다.
+    """
+    stmt = select(model).join(NovelMemo, and_(NovelMemo.novel_id == novel_id, NovelMemo.user_id == user_id))
+    if since is None:
+        return stmt.order_by(*order_by)
+    changes = union_all(
+        stmt.where(NovelMemo.created_at > since),
+        stmt.where(NovelMemo.created_at <= since, updated_at > since),
+    ).subquery("changes")
+    return select(aliased(model, changes)).order_by(*(changes.c[column.key] for column in order_by))
+
+
+class CRUDSync(CRUD[MemoTombstone]):
+    """사용자의 서재(소설 메모가 있는 소설)에서 `since` 이후 바뀐 행을 조회합니다.
+
+    메모와 챕터는 `updated_at` 인덱스로 바뀐 행만 읽으며, 모든 조회는 서버 측 커서로 나누어 가져옵니다.
+    서재에 새로 추가된 소설은 소설 메모의 생성일로 찾아 소설과 모든 챕터를 함께 반환합니다.
+    """
+
+    async def stream_tombstones(
+        self, user_id: int, since: datetime | None, batch_size: int
+    ) -> AsyncIterator[MemoTombstone]:
+        """삭제된 메모의 기록을 조회합니다.
+
+        Args:
+            user_id (int): 사용자의 id입니다.
+            since (datetime|None): 이 시각 이후의 기록만 조회합니다. None이면 모든 기록입니다.
+            batch_size (int): 한 번에 가져올 개수입니다.
+
+        Yields:
+            MemoTombstone: 삭제된 메모의 기록입니다.
+        """
+        stmt = (
+            select(MemoTombstone)
+            .where(MemoTombstone.user_id == user_id, _changed_since(MemoTombstone.updated_at, since))
+            .order_by(MemoTombstone.updated_at, MemoTombstone.id)
+        )
+        async for tombstone in self._stream(stmt, batch_size):
+            yield tombstone
+
+    async def stream_novels(self, user_id: int, since: datetime | None, batch_size: int) -> AsyncIterator[Novel]:
+        """서재의 소설 중 바뀌었거나 새로 추가된 소설을 조회합니다.
+
+        Args:
+            user_id (int): 사용자의 id입니다.
+            since (datetime|None): 이 시각 이후의 변경만 조회합니다. None이면 서재의 모든 소설입니다.
+            batch_size (int): 한 번에 가져올 개수입니다.
+
+        Yields:
+            Novel: 소설 객체입니다.
+        """
+        stmt = _library_changes(Novel, Novel.id, Novel.updated_at, user_id, since, order_by=(Novel.id,))
+        async for novel in self._stream(stmt, batch_size):
+            yield novel
+
+    async def stream_chapters(self, user_id: int, since: datetime | None, batch_size: int) -> AsyncIterator[Chapter]:
+        """서재의 소설 중 바뀌었거나 새로 추가된 소설의 챕터를 조회합니다.
+
+        Args:
+            user_id (int): 사용자의 id입니다.
+            since (datetime|None): 이 시각 이후의 변경만 조회합니다. None이면 서재의 모든 챕터입니다.
+            batch_size (int): 한 번에 가져올 개수입니다.
+
+        Yields:
+            Chapter: 챕터 객체입니다.
+        """
+        stmt = _library_changes(
+            Chapter,
+            Chapter.novel_id,
+            Chapter.updated_at,
+            user_id,
+            since,
+            order_by=(Chapter.novel_id, Chapter.chapter_no),
+        )
+        async for chapter in self._stream(stmt, batch_size):
+            yield chapter
+
+    async def stream_novel_memos(
+        self, user_id: int, since: datetime | None, batch_size: int
+    ) -> AsyncIterator[NovelMemo]:
+        """바뀐 소설 메모를 조회합니다.
+
+        Args:
+            user_id (int): 사용자의 id입니다.
+            since (datetime|None): 이 시각 이후의 변경만 조회합니다. None이면 모든 소설 메모입니다.
+            batch_size (int): 한 번에 가져올 개수입니다.
+
+        Yields:
+            NovelMemo: 소설 메모 객체입니다.
+        """
+        stmt = (
+            select(NovelMemo)
+            .where(NovelMemo.user_id == user_id, _changed_since(NovelMemo.updated_at, since))
+            .order_by(NovelMemo.updated_at)
+        )
+        async for memo in self._stream(stmt, batch_size):
+            yield memo
+
+    async def stream_chapter_memos(
+        self, user_id: int, since: datetime | None, batch_size: int
+    ) -> AsyncIterator[ChapterMemo]:
+        """바뀐 챕터 메모를 조회합니다.
+
+        Args:
+            user_id (int): 사용자의 id입니다.
+            since (datetime|None): 이 시각 이후의 변경만 조회합니다. None이면 모든 챕터 메모입니다.
+            batch_size (int): 한 번에 가져올 개수입니다.
+
+        Yields:
+            ChapterMemo: 챕터 메모 객체입니다.
+        """
+        stmt = (
+            select(ChapterMemo)
+            .where(ChapterMemo.user_id == user_id, _changed_since(ChapterMemo.updated_at, since))
+            .order_by(ChapterMemo.updated_at)
+        )
+        async for memo in self._stream(stmt, batch_size):
+            yield memo
+
+    async def _stream(self, stmt: Select, batch_size: int) -> AsyncIterator:
+        """서버 측 커서로 나누어 조회합니다."""
+        async for item in await self.db.stream_scalars(stmt.execution_options(yield_per=batch_size)):
+            yield item
@@ -0,0 +1,23 @@
+"""데이터베이스 모델."""
+from sqlalchemy import BIGINT, INTEGER, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.base.models import Base
+
+__all__ = ("MemoTombstone",)
+
+
+class MemoTombstone(Base):
+    """삭제된 메모의 기록. 동기화하는 클라이언트에 삭제를 알리는 데 사용합니다."""
+
+    __tablename__ = "memo_tombstones"
+
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True, comment="아이디")
+    user_id: Mapped[int] = mapped_column(INTEGER, ForeignKey("users.id"), nullable=False, comment="사용자 아이디 (외래 키)")
+    novel_id: Mapped[int] = mapped_column(INTEGER, nullable=False, comment="소설 아이디")
+    chapter_no: Mapped[int | None] = mapped_column(INTEGER, comment="챕터 번호, 소설 메모이면 NULL")
+
+    __table_args__ = (
+        Index("memo_tombstones_user_id_updated_at_idx", user_id, "updated_at"),
+        {"comment": "삭제된 메모"},
+    )
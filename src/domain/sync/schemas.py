@@ -0,0 +1,59 @@
+"""동기화 DTO 정의"""
+from datetime import datetime
+
+from pydantic import Field
+from typing_extensions import Annotated
+
+from src.domain.base.schemas import DTO
+from src.domain.novels.schemas import NovelMemoDTO, StrEnum
+
+__all__ = (
+    "SyncRecordType",
+    "SyncNovelMemoDTO",
+    "SyncChapterMemoDTO",
+    "MemoTombstoneDTO",
+    "SyncEndDTO",
+)
+
+
+class SyncRecordType(StrEnum):
+    """동기화 응답 한 줄의 종류"""
+
+    NOVEL = "novel"
+    CHAPTER = "chapter"
+    NOVEL_MEMO = "novel_memo"
+    CHAPTER_MEMO = "chapter_memo"
+    TOMBSTONE = "tombstone"
+    END = "end"
+
+
+class SyncNovelMemoDTO(NovelMemoDTO):
+    """동기화용 소설 메모 DTO"""
+
+    novel_id: Annotated[int, Field(description="소설 ID")]
+    updated_at: Annotated[datetime, Field(description="수정일")]
+
+
+class SyncChapterMemoDTO(DTO):
+    """동기화용 챕터 메모 DTO"""
+
+    novel_id: Annotated[int, Field(description="소설 ID")]
+    chapter_no: Annotated[int, Field(description="챕터 번호")]
+    content: Annotated[str | None, Field(description="내용")] = None
+    star: Annotated[int | None, Field(description="별점")] = None
+    modified_at: Annotated[datetime | None, Field(description="내용 수정일")] = None
+    updated_at: Annotated[datetime, Field(description="수정일")]
+
+
+class MemoTombstoneDTO(DTO):
+    """삭제된 메모 DTO"""
+
+    novel_id: Annotated[int, Field(description="소설 ID")]
+    chapter_no: Annotated[int | None, Field(description="챕터 번호, 소설 메모이면 null")] = None
+    deleted_at: Annotated[datetime, Field(description="삭제일")]
+
+
+class SyncEndDTO(DTO):
+    """동기화 응답의 마지막 줄"""
+
+    next_token: Annotated[str, Field(description="다음 동기화 요청의 since 값")]
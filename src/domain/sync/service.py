@@ -0,0 +1,103 @@
+"""동기화 서비스를 제공합니다."""
+# pylint: disable=not-callable
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+from sqlalchemy import func, select
+
+from src.core.config import settings
+from src.db import AsyncSessionLocal
+from src.domain.base.service import orm_values
+from src.domain.novels.models import ChapterMemo, NovelMemo
+from src.domain.novels.service import to_dto
+from src.domain.sync.crud import CRUDSync
+from src.domain.sync.models import MemoTombstone
+from src.domain.sync.schemas import MemoTombstoneDTO, SyncChapterMemoDTO, SyncEndDTO, SyncNovelMemoDTO, SyncRecordType
+from src.libs.pagination import decode_cursor, encode_cursor
+from src.libs.responses import NovelError
+
+__all__ = ("SyncService",)
+
+# 응답을 한 줄씩 보내지 않고 이 크기만큼 모아서 보냅니다.
+_CHUNK_BYTES = 64 * 1024
+
+
+@to_dto.register(MemoTombstone)
+def _(obj: MemoTombstone) -> MemoTombstoneDTO:
+    """MemoTombstone 객체를 MemoTombstoneDTO 객체로 변환합니다."""
+    return MemoTombstoneDTO.from_trusted({**orm_values(obj), "deleted_at": obj.updated_at})
+
+
+def _novel_memo_dto(obj: NovelMemo) -> SyncNovelMemoDTO:
+    """NovelMemo 객체를 SyncNovelMemoDTO 객체로 변환합니다."""
+    return SyncNovelMemoDTO.from_trusted(orm_values(obj))
+
+
+def _chapter_memo_dto(obj: ChapterMemo) -> SyncChapterMemoDTO:
+    """ChapterMemo 객체를 SyncChapterMemoDTO 객체로 변환합니다."""
+    return SyncChapterMemoDTO.from_trusted(orm_values(obj))
+
+
+def _line(record_type: SyncRecordType, dto: BaseModel) -> bytes:
+    """동기화 응답의 한 줄을 만듭니다."""
+    data = dto.__pydantic_serializer__.to_json(dto, by_alias=True)
+    return b'{"type":"%s","data":%s}\n' % (record_type.value.encode("ascii"), data)
+
+
+class SyncService:
+    """동기화 서비스
+
+    응답은 스트리밍하는 동안 요청의 세션보다 오래 살아 있으므로 직접 세션을 엽니다.
+    """
+
+    def __init__(self, batch_size: int = settings.SYNC_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    @staticmethod
+    def parse_token(token: str | None) -> datetime | None:
+        """동기화 토큰을 시각으로 변환합니다. 토큰이 없으면 None입니다."""
+        if token is None:
+            return None
+        try:
+            values = decode_cursor(token)
+        except ValueError:
+            raise NovelError.INVALID_SYNC_TOKEN.http_exception from None
+        if len(values) != 1 or not isinstance(values[0], datetime) or values[0].tzinfo is None:
+            raise NovelError.INVALID_SYNC_TOKEN.http_exception
+        return values[0]
+
+    @classmethod
+    @property
+    def sync_errors(cls) -> tuple:
+        """동기화 시 발생할 수 있는 에러 목록"""
+        return (NovelError.INVALID_SYNC_TOKEN,)
+
+    async def stream(self, user_id: int, since: datetime | None) -> AsyncIterator[bytes]:
+        """`since` 이후 바뀐 서재의 소설, 챕터, 메모와 삭제된 메모를 NDJSON으로 반환합니다.
+
+        모든 조회를 하나의 REPEATABLE READ 트랜잭션에서 실행하여 같은 시점의 데이터를 반환합니다.
+        다음 토큰은 트랜잭션 시작 시각보다 `SYNC_OVERLAP_SECONDS`만큼 앞선 시각이므로, 그 사이의 행은 다음
+        동기화에서 다시 보낼 수 있습니다. 클라이언트는 같은 행을 여러 번 받아도 덮어쓰기만 하면 됩니다.
+        """
+        async with AsyncSessionLocal() as db:
+            await db.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+            now = await db.scalar(select(func.now()))
+            crud_sync = CRUDSync(db)
+            # 삭제 후 다시 만든 메모가 삭제로 덮어쓰이지 않도록 삭제 기록을 먼저 보냅니다.
+            sources = (
+                (SyncRecordType.TOMBSTONE, crud_sync.stream_tombstones, to_dto),
+                (SyncRecordType.NOVEL, crud_sync.stream_novels, to_dto),
+                (SyncRecordType.CHAPTER, crud_sync.stream_chapters, to_dto),
+                (SyncRecordType.NOVEL_MEMO, crud_sync.stream_novel_memos, _novel_memo_dto),
+                (SyncRecordType.CHAPTER_MEMO, crud_sync.stream_chapter_memos, _chapter_memo_dto),
+            )
+            chunk = bytearray()
+            for record_type, stream, convert in sources:
+                async for item in stream(user_id, since, self.batch_size):
+                    chunk += _line(record_type, convert(item))
+                    if len(chunk) >= _CHUNK_BYTES:
+                        yield bytes(chunk)
+                        chunk.clear()
+        next_token = encode_cursor(now - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS))
+        yield bytes(chunk + _line(SyncRecordType.END, SyncEndDTO(next_token=next_token)))
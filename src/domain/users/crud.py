@@ -2,9 +2,15 @@
 # pylint: disable=redefined-builtin
 from sqlalchemy import or_, select
 
+from src.core.invalidation import invalidation_bus
 from src.domain.base.crud import CRUD
 from src.domain.users.models import User
 
+__all__ = ("CRUDUser", "USER_TOPIC")
+
+# 캐시 무효화 토픽입니다. 사용자 id를 키로 사용합니다.
+USER_TOPIC = "user"
+
 
 class CRUDUser(CRUD[User]):
     """유저 CRUD 클래스"""
@@ -58,4 +64,5 @@ class CRUDUser(CRUD[User]):
             self.db.add(user)
         await self.db.flush()
         await self.db.refresh(user)
+        invalidation_bus.publish(self.db, USER_TOPIC, id)
         return user
@@ -2,7 +2,7 @@
 # pylint: disable=redefined-builtin
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import get_password_hash
+from src.core.security import password_hasher
 from src.domain.base.service import to_dto
 from src.domain.users.crud import CRUDUser
 from src.domain.users.models import User
@@ -51,7 +51,7 @@ class UserService:
         model = User(
             email=command.email,
             nickname=command.nickname,
-            hashed_password=get_password_hash(command.password),
+            hashed_password=await password_hasher.hash(command.password),
             is_admin=False,
             is_active=True,
         )
@@ -69,6 +69,7 @@ class UserService:
         return (
             UserError.EMAIL_ALREADY_EXISTS,
             UserError.NICKNAME_ALREADY_EXISTS,
+            UserError.PASSWORD_HASHER_BUSY,
         )
 
     @classmethod
@@ -0,0 +1,45 @@
+"""`bytea` 비트맵을 다루는 함수를 정의합니다.
+
+비트 n은 (n // 8)번째 바이트의 (n % 8)번째 비트(최하위 비트부터)로, PostgreSQL의 `set_bit` / `get_bit`과 같습니다.
+"""
+
+__all__ = ("bitmap_count", "bitmap_ranges")
+
+
+def bitmap_count(bitmap: bytes) -> int:
+    """켜진 비트의 수를 반환합니다.
+
+    Args:
+        bitmap (bytes): 비트맵입니다.
+
+    Returns:
+        int: 켜진 비트의 수입니다.
+    """
+    return bin(int.from_bytes(bitmap, "little")).count("1")
+
+
+def bitmap_ranges(bitmap: bytes) -> list[tuple[int, int]]:
+    """켜진 비트를 연속된 구간으로 묶어 반환합니다.
+
+    Args:
+        bitmap (bytes): 비트맵입니다.
+
+    Returns:
+        list[tuple[int, int]]: 켜진 비트 번호의 `(시작, 끝)` 구간 목록입니다. 양 끝을 포함합니다.
+
+    Examples:
+        >>> bitmap_ranges(bytes([0b10001110, 0b00000001]))
+        [(1, 3), (7, 8)]
+    """
+    value = int.from_bytes(bitmap, "little")
+    ranges = []
+    offset = 0
+    while value:
+        # 가장 낮은 켜진 비트까지 건너뛴 뒤, 이어서 켜진 비트의 수를 셉니다.
+        zeros = (value & -value).bit_length() - 1
+        value >>= zeros
+        ones = (~value & (value + 1)).bit_length() - 1
+        ranges.append((offset + zeros, offset + zeros + ones - 1))
+        value >>= ones
+        offset += zeros + ones
+    return ranges
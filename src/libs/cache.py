@@ -0,0 +1,201 @@
+"""프로세스 내 메모리 캐시를 정의합니다."""
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+__all__ = ("TTLCache", "CacheBackend", "MemoryCacheBackend")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """항목마다 만료 시간을 가지는 LRU 캐시입니다.
+
+    가득 차면 가장 오래 사용하지 않은 항목부터 제거하고, 만료된 항목은 조회할 때 제거합니다.
+    이벤트 루프 안에서만 사용한다고 가정하므로 잠금을 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        on_evict: Callable[[K, V], None] | None = None,
+    ):
+        """TTLCache 생성자
+
+        Args:
+            maxsize (int): 최대 항목 수입니다.
+            ttl (float, optional): 기본 만료 시간(초)입니다. None이면 만료되지 않습니다. Defaults to None.
+            on_evict (Callable[[K, V], None], optional): 항목이 제거될 때 호출할 함수입니다. Defaults to None.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: K) -> bool:
+        item = self._items.get(key)
+        return item is not None and item[0] > time.monotonic()
+
+    def get(self, key: K) -> V | None:
+        """항목을 조회합니다.
+
+        Args:
+            key (K): 키입니다.
+
+        Returns:
+            V|None: 값입니다. 없거나 만료되었으면 None입니다.
+        """
+        item = self._items.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self._misses += 1
+            return None
+        self._items.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """항목을 저장합니다.
+
+        Args:
+            key (K): 키입니다.
+            value (V): 값입니다.
+            ttl (float, optional): 이 항목의 만료 시간(초)입니다. None이면 기본 만료 시간을 사용합니다.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        if key in self._items:
+            self._items.move_to_end(key)
+        self._items[key] = (expires_at, value)
+        while len(self._items) > self.maxsize:
+            oldest = next(iter(self._items))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """항목을 제거합니다.
+
+        Args:
+            key (K): 키입니다.
+
+        Returns:
+            V|None: 제거한 값입니다. 없으면 None입니다.
+        """
+        if key not in self._items:
+            return None
+        return self._remove(key)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        for key in list(self._items):
+            self._remove(key)
+
+    def _remove(self, key: K) -> V:
+        """항목을 제거하고 제거 콜백을 호출합니다."""
+        _, value = self._items.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+        return value
+
+    @property
+    def stats(self) -> dict:
+        """캐시 상태를 반환합니다."""
+        requests = self._hits + self._misses
+        return {
+            "size": len(self._items),
+            "maxsize": self.maxsize,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_ratio": self._hits / requests if requests else 0.0,
+        }
+
+
+class CacheBackend(ABC, Generic[V]):
+    """문자열 키로 값을 저장하는 캐시 저장소의 인터페이스입니다.
+
+    항목에 태그를 붙여 저장하고, 태그 단위로 한 번에 무효화할 수 있습니다. 여러 워커 프로세스가
+    캐시를 공유하려면 외부 저장소를 사용하는 구현으로 바꿉니다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> V | None:
+        """항목을 조회합니다. 없거나 만료되었으면 None을 반환합니다."""
+
+    @abstractmethod
+    async def set(self, key: str, value: V, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        """항목을 저장합니다. ttl이 None이면 저장소의 기본 만료 시간을 사용합니다."""
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """태그가 붙은 모든 항목을 제거합니다."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+
+    @property
+    @abstractmethod
+    def stats(self) -> dict:
+        """캐시 상태를 반환합니다."""
+
+
+class MemoryCacheBackend(CacheBackend[V]):
+    """`TTLCache`를 사용하는 프로세스 내 캐시 저장소입니다."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        """MemoryCacheBackend 생성자
+
+        Args:
+            maxsize (int): 최대 항목 수입니다.
+            ttl (float, optional): 기본 만료 시간(초)입니다. None이면 만료되지 않습니다. Defaults to None.
+        """
+        self._cache: TTLCache[str, tuple[tuple[str, ...], V]] = TTLCache(maxsize, ttl, on_evict=self._forget)
+        self._tag_keys: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> V | None:
+        if (item := self._cache.get(key)) is None:
+            return None
+        return item[1]
+
+    async def set(self, key: str, value: V, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        self._cache.set(key, (tags, value), ttl)
+        if key in self._cache:
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            for key in list(self._tag_keys.get(tag, ())):
+                self._cache.pop(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def _forget(self, key: str, item: tuple[tuple[str, ...], V]) -> None:
+        """캐시에서 제거된 항목을 태그별 목록에서도 제거합니다."""
+        for tag in item[0]:
+            if keys := self._tag_keys.get(tag):
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    @property
+    def stats(self) -> dict:
+        return {**self._cache.stats, "tags": len(self._tag_keys)}
@@ -0,0 +1,132 @@
+"""HTTP 조건부 요청(ETag / Last-Modified / 304)을 처리합니다."""
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from src.libs.responses import DTOResponse
+
+__all__ = ("ResourceVersion", "conditional_response")
+
+
+def _latest(*values: datetime | None) -> datetime | None:
+    """None을 제외한 가장 최근 시각을 반환합니다."""
+    return max((value for value in values if value is not None), default=None)
+
+
+def _opaque_tag(etag: str) -> str:
+    """약한 비교를 위해 `W/` 접두사를 뗀 ETag를 반환합니다."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    """응답 본문을 만들지 않고 계산한 리소스의 버전입니다.
+
+    ETag는 리소스의 수정일과 행 수 같은 값으로 만든 약한 ETag이며, 본문 바이트가 아닌 내용의 버전을 나타냅니다.
+    행 수가 포함된 버전은 행을 삭제해도 수정일이 바뀌지 않을 수 있으므로 If-Modified-Since로 검증하지 않습니다.
+    """
+
+    etag: str
+    last_modified: datetime | None = None
+    private: bool = False
+    check_modified_since: bool = True
+
+    @classmethod
+    def of(
+        cls,
+        *parts: Any,
+        updated_at: tuple[datetime | None, ...] = (),
+        counts: tuple[int, ...] = (),
+        private: bool = False,
+    ) -> "ResourceVersion":
+        """값들로 리소스 버전을 만듭니다.
+
+        Args:
+            *parts (Any): 리소스의 종류와 식별자처럼 바뀌면 응답도 바뀌는 값입니다.
+            updated_at (tuple[datetime|None, ...], optional): 응답에 포함되는 행들의 수정일입니다. 가장 최근 값이
+                Last-Modified가 됩니다. Defaults to ().
+            counts (tuple[int, ...], optional): 응답에 포함되는 행의 수입니다. 지정하면 삭제를 수정일로 알 수 없으므로
+                If-Modified-Since를 검증에 사용하지 않습니다. Defaults to ().
+            private (bool, optional): 사용자마다 다른 응답인지 여부입니다. Defaults to False.
+
+        Returns:
+            ResourceVersion: 리소스 버전입니다.
+        """
+        digest = hashlib.blake2b(repr((parts, updated_at, counts)).encode("utf-8"), digest_size=12).hexdigest()
+        return cls(
+            etag=f'W/"{digest}"',
+            last_modified=_latest(*updated_at),
+            private=private,
+            check_modified_since=not counts,
+        )
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """응답에 붙일 캐시 관련 헤더를 반환합니다."""
+        headers = {
+            "ETag": self.etag,
+            # 캐시된 응답을 쓰기 전에 항상 재검증하도록 합니다.
+            "Cache-Control": "private, no-cache" if self.private else "no-cache",
+        }
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+    def is_not_modified(self, request: Request) -> bool:
+        """요청의 조건부 헤더로 보아 클라이언트가 가진 응답이 최신인지 확인합니다.
+
+        RFC 9110에 따라 If-None-Match가 있으면 If-Modified-Since는 무시합니다. 행 수가 포함된 버전은
+        If-Modified-Since만으로는 304로 응답하지 않습니다.
+
+        Args:
+            request (Request): 요청 객체입니다.
+
+        Returns:
+            bool: 304로 응답해도 되면 True입니다.
+        """
+        if (if_none_match := request.headers.get("if-none-match")) is not None:
+            tags = {_opaque_tag(tag.strip()) for tag in if_none_match.split(",")}
+            return "*" in tags or _opaque_tag(self.etag) in tags
+        if not self.check_modified_since or self.last_modified is None:
+            return False
+        if (if_modified_since := request.headers.get("if-modified-since")) is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위이므로 수정일의 초 미만은 버리고 비교합니다.
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def not_modified_response(self) -> Response:
+        """304 응답을 반환합니다."""
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+
+
+async def conditional_response(
+    request: Request,
+    version: ResourceVersion | None,
+    build: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """클라이언트의 응답이 최신이면 본문을 만들지 않고 304를, 아니면 버전 헤더를 붙인 응답을 반환합니다.
+
+    Args:
+        request (Request): 요청 객체입니다.
+        version (ResourceVersion|None): 리소스 버전입니다. None이면 리소스가 없는 것으로 보고 `build`를 호출합니다.
+        build (Callable[[], Awaitable[BaseModel]]): 응답 DTO를 만드는 함수입니다.
+
+    Returns:
+        Response: 응답 객체입니다.
+    """
+    if version is None:
+        return DTOResponse(await build())
+    if version.is_not_modified(request):
+        return version.not_modified_response()
+    return DTOResponse(await build(), headers=version.headers)
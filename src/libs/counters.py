@@ -0,0 +1,68 @@
+"""시간 버킷 단위로 증가분을 모아두는 프로세스 내 카운터를 정의합니다."""
+import time
+from typing import Callable, Hashable, Mapping
+
+__all__ = ("BucketCounter",)
+
+
+class BucketCounter:
+    """키별 증가분을 시간 버킷 단위로 모아두는 카운터입니다.
+
+    쓰기 경로에서는 dict 하나만 갱신하고, 모인 증가분은 `drain`으로 꺼내 저장소에 한 번에 더합니다.
+    키에 버킷의 시작 시각이 포함되므로 여러 워커 프로세스의 증가분을 저장소에서 그대로 합산할 수 있고,
+    최근 버킷들의 합으로 슬라이딩 윈도의 개수를 구할 수 있습니다.
+    """
+
+    def __init__(self, bucket_seconds: int, *, max_keys: int = 10000, clock: Callable[[], float] = time.time):
+        """BucketCounter 생성자
+
+        Args:
+            bucket_seconds (int): 버킷의 길이(초)입니다.
+            max_keys (int, optional): 꺼내기 전까지 모아둘 최대 (키, 버킷) 수입니다. 넘으면 새 키의 증가분은 버립니다.
+                Defaults to 10000.
+            clock (Callable[[], float], optional): 현재 시각(epoch 초)을 반환하는 함수입니다. Defaults to time.time.
+        """
+        self.bucket_seconds = bucket_seconds
+        self.max_keys = max_keys
+        self.clock = clock
+        self._pending: dict[tuple[Hashable, int], int] = {}
+        self.added = 0
+        self.dropped = 0
+
+    def add(self, key: Hashable, amount: int = 1) -> None:
+        """현재 버킷에 증가분을 더합니다.
+
+        Args:
+            key (Hashable): 키입니다.
+            amount (int, optional): 증가분입니다. Defaults to 1.
+        """
+        bucket = int(self.clock()) // self.bucket_seconds * self.bucket_seconds
+        pending_key = (key, bucket)
+        if pending_key not in self._pending and len(self._pending) >= self.max_keys:
+            self.dropped += amount
+            return
+        self._pending[pending_key] = self._pending.get(pending_key, 0) + amount
+        self.added += amount
+
+    def drain(self) -> dict[tuple[Hashable, int], int]:
+        """모인 증가분을 꺼내고 비웁니다.
+
+        Returns:
+            dict[tuple[Hashable, int], int]: `(키, 버킷 시작 epoch 초)`별 증가분입니다.
+        """
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, counts: Mapping[tuple[Hashable, int], int]) -> None:
+        """저장하지 못한 증가분을 다시 더합니다.
+
+        Args:
+            counts (Mapping[tuple[Hashable, int], int]): `drain`으로 꺼낸 증가분입니다.
+        """
+        for pending_key, amount in counts.items():
+            self._pending[pending_key] = self._pending.get(pending_key, 0) + amount
+
+    @property
+    def stats(self) -> dict:
+        """카운터의 상태를 반환합니다."""
+        return {"pending": len(self._pending), "added": self.added, "dropped": self.dropped}
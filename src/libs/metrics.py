@@ -0,0 +1,29 @@
+"""워커 프로세스 단위의 런타임 지표를 모으는 모듈입니다."""
+import os
+from typing import Callable
+
+__all__ = ("MetricsRegistry", "metrics")
+
+
+class MetricsRegistry:
+    """이름별 지표 수집 함수를 등록하고, 한 번에 모아서 반환합니다."""
+
+    def __init__(self):
+        """MetricsRegistry 생성자"""
+        self._collectors: dict[str, Callable[[], dict]] = {}
+
+    def register(self, name: str, collector: Callable[[], dict]) -> None:
+        """지표 수집 함수를 등록합니다.
+
+        Args:
+            name (str): 지표 이름입니다.
+            collector (Callable[[], dict]): 지표를 반환하는 함수입니다.
+        """
+        self._collectors[name] = collector
+
+    def collect(self) -> dict:
+        """등록된 모든 지표를 반환합니다."""
+        return {"pid": os.getpid(), **{name: collector() for name, collector in self._collectors.items()}}
+
+
+metrics = MetricsRegistry()
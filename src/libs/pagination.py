@@ -0,0 +1,63 @@
+"""커서 기반 페이지네이션에 사용하는 불투명 커서를 정의합니다."""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+__all__ = ("encode_cursor", "decode_cursor")
+
+_DATETIME_KEY = "$dt"
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON으로 표현할 수 없는 값을 변환합니다."""
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """`_encode_value`로 변환한 값을 되돌립니다."""
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value[_DATETIME_KEY])
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """값들을 URL에 그대로 쓸 수 있는 커서 문자열로 만듭니다.
+
+    Args:
+        *values (Any): 커서에 담을 값입니다. 문자열, 숫자, None, datetime을 지원합니다.
+
+    Returns:
+        str: 커서 문자열입니다.
+
+    Examples:
+        >>> decode_cursor(encode_cursor("title", True, "전지적 독자 시점", 3))
+        ['title', True, '전지적 독자 시점', 3]
+    """
+    payload = json.dumps([_encode_value(value) for value in values], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """커서 문자열을 값 목록으로 되돌립니다.
+
+    Args:
+        cursor (str): 커서 문자열입니다.
+
+    Raises:
+        ValueError: 올바르지 않은 커서인 경우 발생합니다.
+
+    Returns:
+        list[Any]: 커서에 담긴 값 목록입니다.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        if not isinstance(values, list):
+            raise ValueError("커서는 목록이어야 합니다.")
+        return [_decode_value(value) for value in values]
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, json.JSONDecodeError) as exc:
+        raise ValueError("올바르지 않은 커서입니다.") from exc
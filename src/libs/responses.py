@@ -2,14 +2,17 @@
 from collections import defaultdict
 from enum import Enum
 from functools import partial
+from typing import Any
 
 from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing_extensions import Annotated, Sequence
 
 from src.libs.http_status_codes import STATUS_CODE_DESCRIPTION
 
 __all__ = (
+    "DTOResponse",
     "get_error_response",
     "UserError",
     "NovelError",
@@ -48,6 +51,19 @@ def get_error_response(
     }
 
 
+class DTOResponse(JSONResponse):
+    """pydantic 모델을 pydantic-core 직렬화기로 바로 JSON 바이트로 만드는 응답입니다.
+
+    `JSONResponse`는 `jsonable_encoder`로 만든 dict를 `json.dumps`로 다시 직렬화합니다. 모델은 한 번에
+    직렬화하고, 그 외의 값은 `JSONResponse`와 같이 렌더링하므로 결과 JSON은 `JSONResponse`와 같습니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        return super().render(content)
+
+
 class Error(BaseModel):
     """에러 메시지"""
 
@@ -77,6 +93,8 @@ NotFoundError = partial(Error, status_code=status.HTTP_404_NOT_FOUND)
 ConflictError = partial(Error, status_code=status.HTTP_409_CONFLICT)
 UnprocessableEntityError = partial(Error, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 InternalServerError = partial(Error, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+ServiceUnavailableError = partial(Error, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+GatewayTimeoutError = partial(Error, status_code=status.HTTP_504_GATEWAY_TIMEOUT)
 
 
 class UserError(BaseError):
@@ -105,6 +123,9 @@ class UserError(BaseError):
     PASSWORD_TOO_LONG = UnprocessableEntityError(detail="비밀번호는 20자 이하이어야 합니다.")
     PASSWORD_MIX_REQUIRD = UnprocessableEntityError(detail="비밀번호에는 영문과 숫자가 모두 포함되어야 합니다.")
 
+    # 503
+    PASSWORD_HASHER_BUSY = ServiceUnavailableError(detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
 
 class NovelError(BaseError):
     """소설 관련 에러 메시지"""
@@ -112,12 +133,16 @@ class NovelError(BaseError):
     # 400
     NEED_NOVEL_REF = BadRequestError(detail="소설 ID 혹은 URL이 필요합니다.")
     NOVEL_CREATE_FAILED = BadRequestError(detail="소설 생성에 실패했습니다.")
+    INVALID_CURSOR = BadRequestError(detail="올바르지 않은 커서입니다.")
+    INVALID_SYNC_TOKEN = BadRequestError(detail="올바르지 않은 동기화 토큰입니다.")
+    DUPLICATE_CHAPTER_NO = BadRequestError(detail="중복된 챕터 번호가 있습니다.")
 
     # 404
     NOVEL_NOT_FOUND = NotFoundError(detail="존재하지 않는 소설입니다.")
     NOVEL_MEMO_NOT_FOUND = NotFoundError(detail="존재하지 않는 소설 메모입니다.")
     CHAPTER_NOT_FOUND = NotFoundError(detail="존재하지 않는 챕터입니다.")
     CHAPTER_MEMO_NOT_FOUND = NotFoundError(detail="존재하지 않는 챕터 메모입니다.")
+    NOVEL_JOB_NOT_FOUND = NotFoundError(detail="존재하지 않는 소설 등록 작업입니다.")
 
     # 409
     NOVEL_ALREADY_EXISTS = ConflictError(detail="이미 등록된 소설입니다.")
@@ -126,3 +151,9 @@ class NovelError(BaseError):
 
     # 500
     UNEXPECTED_ERROR = InternalServerError(detail="예상치 못한 에러가 발생했습니다.")
+
+    # 503
+    NOVEL_JOB_QUEUE_FULL = ServiceUnavailableError(detail="소설 등록 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+
+    # 504
+    NOVEL_FETCH_TIMEOUT = GatewayTimeoutError(detail="소설 정보를 가져오는 데 시간이 너무 오래 걸립니다.")
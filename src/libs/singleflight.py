@@ -0,0 +1,73 @@
+"""동일한 작업의 동시 실행을 하나로 합치는 single-flight를 정의합니다."""
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+__all__ = ("SingleFlight",)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """같은 키로 동시에 들어온 호출이 하나의 실행 결과를 공유하도록 합니다.
+
+    먼저 들어온 호출만 작업을 실행하고, 실행 중에 들어온 호출은 그 결과(혹은 예외)를 함께 기다립니다.
+    실행하던 호출이 취소되면 기다리던 호출 중 하나가 작업을 다시 실행합니다.
+    """
+
+    def __init__(self):
+        """SingleFlight 생성자"""
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """키에 해당하는 작업을 실행하거나, 이미 실행 중이면 그 결과를 기다립니다.
+
+        Args:
+            key (Hashable): 작업을 구분하는 키입니다.
+            func (Callable[[], Awaitable[T]]): 실행할 코루틴 함수입니다.
+
+        Returns:
+            T: 작업 결과입니다.
+        """
+        self.calls += 1
+        while (future := self._flights.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 기다리던 호출이 아니라 실행하던 호출이 취소되었으면 다시 시도합니다.
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._flights[key] = future
+        self.executions += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            self.failures += 1
+            future.set_exception(exc)
+            future.exception()  # 기다리는 호출이 없어도 경고가 남지 않도록 예외를 확인 처리합니다.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+
+    @property
+    def stats(self) -> dict:
+        """호출 통계를 반환합니다."""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,86 @@
+"""일정한 간격으로 반복 실행하는 프로세스 내 작업을 정의합니다."""
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable
+
+__all__ = ("PeriodicTask",)
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """코루틴 함수를 일정한 간격으로 실행하는 작업입니다.
+
+    실행이 끝난 뒤부터 다음 간격을 재므로 실행이 겹치지 않고, 실패해도 기록만 하고 다음 간격에 다시 실행합니다.
+    워커 프로세스마다 하나씩 실행되므로 한 프로세스에서만 실행해야 하는 작업은 함수 안에서 advisory lock 등으로 조정합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        *,
+        interval: float,
+        jitter: float = 0.1,
+    ):
+        """PeriodicTask 생성자
+
+        Args:
+            name (str): 로그와 작업 이름에 사용할 이름입니다.
+            func (Callable[[], Awaitable[Any]]): 실행할 코루틴 함수입니다.
+            interval (float): 실행 간격(초)입니다.
+            jitter (float, optional): 워커 프로세스들이 같은 시각에 실행하지 않도록 간격에 더하는 임의 비율의
+                최댓값입니다. Defaults to 0.1.
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.failures = 0
+        self.last_duration: float | None = None
+
+    async def start(self) -> None:
+        """작업을 시작합니다. 첫 실행은 한 간격 뒤입니다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        """작업을 종료합니다. 실행 중이면 취소합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> None:
+        """함수를 한 번 실행하고 결과를 기록합니다."""
+        started = time.perf_counter()
+        try:
+            await self.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.failures += 1
+            logger.exception("주기 작업이 실패했습니다. name=%s", self.name)
+        finally:
+            self.runs += 1
+            self.last_duration = time.perf_counter() - started
+
+    @property
+    def stats(self) -> dict:
+        """작업의 상태를 반환합니다."""
+        return {
+            "running": self._task is not None,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_duration": self.last_duration,
+        }
+
+    async def _loop(self) -> None:
+        """간격마다 함수를 실행합니다."""
+        while True:
+            await asyncio.sleep(self.interval * (1 + random.uniform(0, self.jitter)))
+            await self.run_once()
@@ -1,17 +1,72 @@
 """FastAPI 앱을 생성하고, API 라우터를 등록합니다."""
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, Response
 from starlette.middleware.cors import CORSMiddleware
 
+from src.api import deps
 from src.api import router as api_router
 from src.core.config import settings
+from src.core.http import http_client
+from src.core.invalidation import invalidation_bus
+from src.core.queries import query_tracker
+from src.core.security import password_hasher
+from src.domain.novels.service import (
+    load_novel_search_index,
+    novel_activity_flush,
+    novel_content_similarities_refresh,
+    novel_job_queue,
+    novel_jobs_cleanup,
+    novel_rankings_refresh,
+    novel_recommendations_refresh,
+    novel_search_index_refresh,
+    novel_stats_refresh,
+)
+from src.libs.metrics import metrics
+from src.libs.responses import UserError, get_error_response
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """앱의 시작과 종료 시점에 공용 리소스를 생성하고 정리합니다."""
+    await http_client.start()
+    password_hasher.start()
+    await novel_job_queue.start()
+    await invalidation_bus.start()
+    if settings.NOVEL_SEARCH_INDEX_ENABLED:
+        await load_novel_search_index()
+        await novel_search_index_refresh.start()
+    await novel_stats_refresh.start()
+    await novel_activity_flush.start()
+    await novel_rankings_refresh.start()
+    await novel_recommendations_refresh.start()
+    await novel_content_similarities_refresh.start()
+    await novel_jobs_cleanup.start()
+    try:
+        yield
+    finally:
+        await novel_search_index_refresh.stop()
+        await novel_jobs_cleanup.stop()
+        await novel_content_similarities_refresh.stop()
+        await novel_recommendations_refresh.stop()
+        await novel_rankings_refresh.stop()
+        await novel_activity_flush.stop()
+        # 종료 전에 모인 활동 수를 마지막으로 저장합니다.
+        await novel_activity_flush.run_once()
+        await novel_stats_refresh.stop()
+        await novel_job_queue.stop()
+        await invalidation_bus.close()
+        await password_hasher.close()
+        await http_client.close()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,  # 프로젝트 이름을 설정합니다.
+    lifespan=lifespan,
 )
 
 
@@ -24,6 +79,23 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 HTTP 헤더에 대해 CORS를 허용합니다.
 )
 
+
+@app.middleware("http")
+async def track_queries(request: Request, call_next: Response) -> Response:
+    """
+    요청마다 실행한 SQL 문장의 수와 시간, 행 수를 기록합니다.
+    """
+    with query_tracker.track() as stats:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    query_tracker.report(f"{request.method} {getattr(route, 'path', request.url.path)}", stats)
+    if settings.SQL_STATS_HEADERS:
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time"] = f"{stats.duration:.4f}"
+        response.headers["X-DB-Rows"] = str(stats.rows)
+    return response
+
+
 if settings.DEBUG:
 
     @app.middleware("http")
@@ -70,4 +142,20 @@ async def health():
     return {"detail": "OK"}
 
 
+@app.get(
+    "/metrics",
+    summary="요청을 받은 워커 프로세스의 런타임 지표를 조회합니다. 관리자만 조회할 수 있습니다.",
+    status_code=status.HTTP_200_OK,
+    responses=get_error_response(UserError.CREDENTIALS_EXCEPTION, UserError.FORBIDDEN),
+    response_class=JSONResponse,
+    dependencies=[Depends(deps.get_admin_token_payload)],
+)
+async def get_metrics():
+    """요청을 받은 워커 프로세스의 런타임 지표를 조회합니다.
+
+    지표는 워커 프로세스마다 따로 모으며 합산하지 않습니다. 여러 워커로 실행하면 응답한 프로세스의 `pid`를 확인하세요.
+    """
+    return metrics.collect()
+
+
 app.include_router(api_router)
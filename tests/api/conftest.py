@@ -0,0 +1,21 @@
+"""API 테스트 공통 fixture입니다."""
+from typing import AsyncIterator
+
+import httpx
+import pytest
+
+from src.core.security import create_jwt_token
+from src.main import app
+
+
+@pytest.fixture
+async def client(database) -> AsyncIterator[httpx.AsyncClient]:  # pylint: disable=unused-argument
+    """테스트 데이터를 넣은 데이터베이스로 앱에 요청을 보내는 클라이언트를 반환합니다."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client_:
+        yield client_
+
+
+@pytest.fixture
+def auth_headers() -> dict[str, str]:
+    """첫 번째 사용자의 인증 헤더를 반환합니다."""
+    return {"Authorization": f"Bearer {create_jwt_token({'id': 1, 'email': 'reader@example.com'}, 60)}"}
@@ -0,0 +1,27 @@
+"""런타임 지표 API 테스트"""
+import os
+
+import httpx
+import pytest
+
+from src.core.security import create_jwt_token
+from src.main import app
+
+
+def bearer(**payload) -> dict[str, str]:
+    """payload로 만든 토큰의 인증 헤더를 반환합니다."""
+    return {"Authorization": f"Bearer {create_jwt_token({'id': 1, 'email': 'admin@example.com', **payload}, 60)}"}
+
+
+@pytest.mark.parametrize(
+    "headers, status_code",
+    [({}, 401), (bearer(), 403), (bearer(is_admin=True), 200)],
+)
+async def test_get_metrics_requires_admin(headers: dict[str, str], status_code: int):
+    """지표는 관리자만 조회할 수 있고, 응답한 워커 프로세스의 pid를 포함합니다."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/metrics", headers=headers)
+
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert response.json()["pid"] == os.getpid()
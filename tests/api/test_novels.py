@@ -0,0 +1,70 @@
+"""소설 API 테스트"""
+import httpx
+import pytest
+from sqlalchemy import text
+
+from src.core.queries import assert_max_queries
+from src.db import engine
+
+CHAPTER_MEMO = {"content": "재밌다", "star": 8}
+
+
+async def get_novel_ids(client: httpx.AsyncClient, **params) -> list[int]:
+    """커서를 따라 모든 페이지의 소설 id를 조회합니다."""
+    ids, cursor = [], None
+    while True:
+        response = await client.get("/v1/novels", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        ids.extend(item["id"] for item in response.json()["items"])
+        if not (cursor := response.json()["next_cursor"]):
+            return ids
+
+
+@pytest.mark.parametrize("order_by", ["reader_count", "favorite_count", "average_star"])
+async def test_get_novels_by_stats_includes_novels_without_stats(client: httpx.AsyncClient, order_by: str):
+    """통계 행이 아직 없는 소설도 통계가 0인 것처럼 통계 순 목록에 포함됩니다."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO novel_stats (novel_id, reader_count, favorite_count, star_sum, star_count)"
+                " VALUES (2, 1, 1, 8, 1)"
+            )
+        )
+
+    assert await get_novel_ids(client, order_by=order_by, desc=True, limit=1) == [2, 3, 1]
+    assert await get_novel_ids(client, order_by=order_by, desc=False, limit=2) == [1, 3, 2]
+
+
+async def test_upsert_chapter_memos_unknown_chapter(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """없는 챕터가 하나라도 있으면 챕터를 한 번만 조회하고 메모를 쓰지 않은 채 404를 반환합니다."""
+    items = [{"chapter_no": no, **CHAPTER_MEMO} for no in (1, 2, 99)]
+
+    with assert_max_queries(1):
+        response = await client.put("/v1/novels/1/chapters/memos", json={"items": items}, headers=auth_headers)
+    chapters = await client.get("/v1/novels/1/chapters", params={"limit": 2}, headers=auth_headers)
+
+    assert response.status_code == 404
+    assert [item["star"] for item in chapters.json()["items"]] == [None, None]
+
+
+async def test_upsert_chapter_memos_duplicate_chapter_no(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """같은 챕터 번호가 두 번 있으면 400을 반환합니다."""
+    items = [{"chapter_no": no, **CHAPTER_MEMO} for no in (1, 1)]
+
+    response = await client.put("/v1/novels/1/chapters/memos", json={"items": items}, headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+async def test_chapter_memo_reloads_cached_novel_stats(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """챕터 메모가 바꾼 통계는 무효화 메시지 없이도 소설 버전이 바뀌어 캐시된 소설 상세에 반영됩니다."""
+    async with engine.begin() as conn:
+        await conn.execute(text("INSERT INTO novel_stats (novel_id) VALUES (1)"))
+    cached = await client.get("/v1/novels/1")
+
+    await client.post("/v1/novels/1/chapters/1/memo", json=CHAPTER_MEMO, headers=auth_headers)
+    response = await client.get("/v1/novels/1")
+
+    assert response.headers["ETag"] != cached.headers["ETag"]
+    assert (cached.json()["stats"]["star_count"], response.json()["stats"]["star_count"]) == (0, 1)
+    assert response.json()["stats"]["average_star"] == CHAPTER_MEMO["star"]
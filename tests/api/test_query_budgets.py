@@ -0,0 +1,105 @@
+"""엔드포인트별 SQL 문장 수 테스트
+
+요청 하나가 실행하는 문장 수의 상한을 고정해 N+1이나 불필요한 조회가 추가되면 실패하게 합니다.
+"""
+import httpx
+import pytest
+
+from src.core.queries import assert_max_queries
+from src.domain.novels.service import load_novel_search_index, novel_search_index
+
+CHAPTER_MEMO = {"content": "재밌다", "star": 8}
+
+
+async def request(client: httpx.AsyncClient, limit: int, method: str, url: str, **kwargs) -> httpx.Response:
+    """요청을 보내고 실행한 문장이 `limit`개 이하인지 확인합니다."""
+    with assert_max_queries(limit):
+        response = await client.request(method, url, **kwargs)
+    assert not response.is_error, response.text
+    return response
+
+
+@pytest.mark.parametrize("authorized", [False, True])
+async def test_get_novel(client: httpx.AsyncClient, auth_headers: dict[str, str], authorized: bool):
+    """소설 상세 조회는 버전과 소설을 조회하고, 캐시된 소설은 버전만 조회합니다."""
+    headers = auth_headers if authorized else {}
+
+    response = await request(client, 2, "GET", "/v1/novels/1", headers=headers)
+    await request(client, 1, "GET", "/v1/novels/1", headers=headers)
+    not_modified = await request(
+        client, 1, "GET", "/v1/novels/1", headers={**headers, "If-None-Match": response.headers["ETag"]}
+    )
+
+    assert not_modified.status_code == 304
+
+
+async def test_get_novel_chapters(client: httpx.AsyncClient):
+    """챕터 목록 조회는 버전과 한 페이지의 챕터를 조회하며, 페이지 크기와 관계없이 문장 수가 같습니다."""
+    first = await request(client, 2, "GET", "/v1/novels/1/chapters", params={"limit": 20})
+    second = await request(
+        client, 2, "GET", "/v1/novels/1/chapters", params={"limit": 20, "cursor": first.json()["next_cursor"]}
+    )
+
+    assert len(first.json()["items"]) == 20
+    assert len(second.json()["items"]) == 10
+
+
+async def test_get_novel_chapters_with_memo(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """로그인한 사용자의 챕터 목록은 메모를 함께 조회하므로 챕터마다 메모를 조회하지 않습니다."""
+    items = [{"chapter_no": no, **CHAPTER_MEMO} for no in range(1, 31)]
+    await client.put("/v1/novels/1/chapters/memos", json={"items": items}, headers=auth_headers)
+
+    response = await request(client, 2, "GET", "/v1/novels/1/chapters", params={"limit": 30}, headers=auth_headers)
+
+    assert [item["star"] for item in response.json()["items"]] == [CHAPTER_MEMO["star"]] * 30
+
+
+async def test_novel_memo(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """소설 메모 작성, 수정, 삭제는 통계 갱신을 포함해 문장 하나로 처리합니다."""
+    await request(client, 1, "POST", "/v1/novels/1/memo", json={"content": "메모"}, headers=auth_headers)
+    await request(client, 1, "PATCH", "/v1/novels/1/memo", json={"content": "수정"}, headers=auth_headers)
+    await request(client, 1, "DELETE", "/v1/novels/1/memo", headers=auth_headers)
+
+
+async def test_chapter_memo(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """챕터 메모 작성, 수정, 삭제는 소설 메모 집계와 통계 갱신을 포함해 문장 하나로 처리합니다."""
+    url = "/v1/novels/1/chapters/1/memo"
+
+    await request(client, 1, "POST", url, json=CHAPTER_MEMO, headers=auth_headers)
+    await request(client, 1, "PATCH", url, json={"star": 3}, headers=auth_headers)
+    await request(client, 1, "DELETE", url, headers=auth_headers)
+
+
+@pytest.mark.parametrize("count", [1, 30])
+async def test_upsert_chapter_memos(client: httpx.AsyncClient, auth_headers: dict[str, str], count: int):
+    """여러 챕터 메모 등록은 메모 수와 관계없이 챕터 확인과 등록 두 문장으로 처리합니다."""
+    items = [{"chapter_no": no, **CHAPTER_MEMO} for no in range(1, count + 1)]
+
+    await request(client, 2, "PUT", "/v1/novels/1/chapters/memos", json={"items": items}, headers=auth_headers)
+    await request(client, 2, "PUT", "/v1/novels/1/chapters/memos", json={"items": items}, headers=auth_headers)
+
+
+async def test_favorite(client: httpx.AsyncClient, auth_headers: dict[str, str]):
+    """관심 소설 등록과 해제"""
+    await request(client, 1, "POST", "/v1/novels/1/favorites", headers=auth_headers)
+    await request(client, 1, "DELETE", "/v1/novels/1/favorites", headers=auth_headers)
+
+
+@pytest.mark.parametrize("authorized", [False, True])
+async def test_get_novels_with_search_index(client: httpx.AsyncClient, auth_headers: dict[str, str], authorized: bool):
+    """검색 색인을 쓰면 소설 목록은 데이터베이스를 조회하지 않고, 로그인한 사용자의 메모만 한 번에 조회합니다."""
+    await client.post("/v1/novels/1/memo", json={"content": "메모"}, headers=auth_headers)
+    await load_novel_search_index()
+    try:
+        response = await request(
+            client, int(authorized), "GET", "/v1/novels", headers=auth_headers if authorized else {}
+        )
+        empty = await request(
+            client, 0, "GET", "/v1/novels", params={"query": "없는 소설"}, headers=auth_headers if authorized else {}
+        )
+    finally:
+        novel_search_index.build([])
+        novel_search_index.ready = False
+
+    assert len(response.json()["items"]) == 3
+    assert not empty.json()["items"]
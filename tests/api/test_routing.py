@@ -0,0 +1,111 @@
+"""DTORoute 테스트"""
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+from src.api.routing import DTORoute
+from src.domain.novels.schemas import ChapterDTO, ChaptersDTO, NovelDTO, NovelsDTO, NovelStatsDTO
+from src.libs.responses import DTOResponse
+
+PUBLISHED_AT = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+
+NOVEL = NovelDTO(
+    id=1,
+    title='전지적 "독자" 시점',
+    author="싱숑",
+    description="멸망한 세계\n그리고 독자",
+    published_at=PUBLISHED_AT,
+    last_updated_at=PUBLISHED_AT,
+    category="판타지",
+    image_url="https://img.example.com/1.jpg",
+    ridi_id="1000",
+    average_star=8.5,
+    is_favorite=True,
+    stats=NovelStatsDTO(chapter_count=551, latest_chapter_no=551, reader_count=3, average_star=9.25, star_count=4),
+)
+NOVELS = NovelsDTO(items=[NOVEL, NOVEL.model_copy(update={"id": 2, "stats": None})], next_cursor="abc")
+CHAPTERS = ChaptersDTO(
+    items=[
+        ChapterDTO(novel_id=1, chapter_no=no, title=f"{no}화", published_at=PUBLISHED_AT, ridi_id=str(no), star=no)
+        for no in range(1, 4)
+    ]
+)
+
+
+def create_app(route_class: type[APIRoute]) -> FastAPI:
+    """같은 엔드포인트를 주어진 라우트 클래스로 등록한 앱을 만듭니다."""
+    router = APIRouter(route_class=route_class, default_response_class=DTOResponse)
+
+    @router.get("/novel", response_model=NovelDTO)
+    async def get_novel():
+        return NOVEL
+
+    @router.get("/novels", response_model=NovelsDTO)
+    async def get_novels():
+        return NOVELS
+
+    @router.get("/chapters", response_model=ChaptersDTO)
+    async def get_chapters():
+        return CHAPTERS
+
+    @router.post("/novel", response_model=NovelDTO, status_code=201)
+    async def create_novel():
+        return NOVEL
+
+    @router.get("/stats", response_model=NovelStatsDTO)
+    async def get_stats():
+        return {"chapter_count": 3, "average_star": 7}
+
+    @router.get("/novel-without-none", response_model=NovelDTO, response_model_exclude_none=True)
+    async def get_novel_without_none():
+        return NOVEL
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+fast_app = create_app(DTORoute)
+default_app = create_app(APIRoute)
+
+
+async def request(app: FastAPI, method: str, path: str) -> httpx.Response:
+    """앱에 요청을 보냅니다."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.request(method, path)
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("GET", "/novel"),
+        ("GET", "/novels"),
+        ("GET", "/chapters"),
+        ("POST", "/novel"),
+        ("GET", "/stats"),
+        ("GET", "/novel-without-none"),
+    ],
+)
+async def test_same_response_as_api_route(method: str, path: str):
+    """DTORoute의 응답은 FastAPI 기본 라우트의 응답과 바이트 단위로 같습니다."""
+    fast = await request(fast_app, method, path)
+    default = await request(default_app, method, path)
+
+    assert fast.status_code == default.status_code
+    assert fast.content == default.content
+    assert fast.headers["content-type"] == default.headers["content-type"]
+    assert fast.headers["content-length"] == default.headers["content-length"]
+
+
+@pytest.mark.parametrize(
+    "path, direct",
+    [("/novel", True), ("/novels", True), ("/stats", True), ("/novel-without-none", False)],
+)
+def test_serializes_directly_only_when_output_is_unchanged(path: str, direct: bool):
+    """`response_model_*` 옵션이 없는 라우트만 엔드포인트를 감쌉니다."""
+    route = next(route for route in fast_app.routes if route.path == path)
+
+    assert (route.dependant.call is not route.endpoint) is direct
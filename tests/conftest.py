@@ -0,0 +1,58 @@
+"""테스트 공통 설정입니다."""
+import os
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+
+# 앱 설정은 모듈을 import할 때 읽으므로, 환경변수가 없으면 테스트용 값을 먼저 채웁니다.
+os.environ.setdefault("DEBUG", "0")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DB_PATH", "postgresql://postgres@localhost/novelog_test")
+os.environ.setdefault("NOVEL_FETCH_URL", "http://localhost:9000/novels")
+os.environ.setdefault("CORS_ORIGINS", '["*"]')
+
+SCHEMA = (Path(__file__).parents[1] / "sql" / "create.sql").read_text(encoding="utf-8")
+
+SEED = """
+INSERT INTO users (login_id, hashed_password, nickname, is_admin, is_active)
+VALUES ('reader@example.com', 'x', 'reader', false, true), ('other@example.com', 'x', 'other', false, true);
+
+INSERT INTO novels (title, description, author, published_at, last_updated_at, category, ridi_id, image_url)
+SELECT '소설 ' || i, '설명 ' || i, '작가 ' || i, NOW() - i * INTERVAL '1 day', NOW(), '판타지', (1000 + i)::TEXT,
+    'https://img.example.com/' || i || '.jpg'
+FROM generate_series(1, 3) i;
+
+INSERT INTO chapters (novel_id, chapter_no, title, published_at, ridi_id)
+SELECT n, c, n || '-' || c, NOW(), (n * 10000 + c)::TEXT
+FROM generate_series(1, 3) n, generate_series(1, 30) c;
+"""
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    """`DB_PATH`의 public 스키마를 다시 만들고 테스트 데이터를 넣습니다.
+
+    데이터베이스에 연결할 수 없으면 테스트를 건너뜁니다. 프로세스 내 캐시도 비웁니다.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.exc import DBAPIError
+
+    from src.db import engine
+    from src.domain.auth.cache import token_cache
+    from src.domain.novels.cache import novel_cache
+
+    try:
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.execute(f"DROP SCHEMA public CASCADE; CREATE SCHEMA public;\n{SCHEMA}\n{SEED}")
+    except (OSError, DBAPIError) as exc:
+        await engine.dispose()
+        pytest.skip(f"테스트 데이터베이스에 연결할 수 없습니다: {exc}")
+    await novel_cache.clear()
+    token_cache.clear()
+    try:
+        yield
+    finally:
+        # 테스트마다 이벤트 루프가 다르므로 이전 루프에서 만든 연결을 다시 쓰지 않도록 연결 풀을 비웁니다.
+        await engine.dispose()
@@ -0,0 +1,38 @@
+"""캐시 무효화 메시지 인코딩 테스트"""
+from src.core.invalidation import _MAX_PAYLOAD_BYTES, _decode, _encode
+
+
+def merge(payloads: list[str]) -> dict[str, list[str]]:
+    """payload들을 디코딩해 토픽별로 합칩니다."""
+    messages: dict[str, list[str]] = {}
+    for payload in payloads:
+        for topic, keys in _decode(payload).items():
+            messages.setdefault(topic, []).extend(keys)
+    return messages
+
+
+def test_encode_decode_round_trip():
+    """토픽별 키를 정렬된 한 줄씩으로 인코딩하고 그대로 되돌립니다."""
+    messages = {"novel": {"3", "1", "2"}, "token": {"user:1"}}
+
+    payloads = _encode(messages)
+
+    assert payloads == ["novel:1\nnovel:2\nnovel:3\ntoken:user:1"]
+    assert _decode(payloads[0]) == {"novel": ["1", "2", "3"], "token": ["user:1"]}
+
+
+def test_encode_empty():
+    """보낼 키가 없으면 payload도 없습니다."""
+    assert not _encode({})
+    assert not _encode({"novel": set()})
+
+
+def test_encode_splits_large_payloads():
+    """NOTIFY payload 한도를 넘지 않도록 여러 payload로 나눕니다."""
+    messages = {"novel": {f"{i:06d}" for i in range(3000)}, "소설": {"가" * 100}}
+
+    payloads = _encode(messages)
+
+    assert len(payloads) > 1
+    assert all(len(payload.encode("utf-8")) <= _MAX_PAYLOAD_BYTES for payload in payloads)
+    assert merge(payloads) == {topic: sorted(keys) for topic, keys in messages.items()}
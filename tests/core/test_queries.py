@@ -0,0 +1,53 @@
+"""SQL 문장 기록 테스트"""
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.core.queries import assert_max_queries, statement_shape
+
+
+@pytest.mark.parametrize(
+    "statement, shape",
+    [
+        ("SELECT 1", "SELECT 1"),
+        ("SELECT * FROM novels WHERE id = $1::INTEGER", "SELECT * FROM novels WHERE id = ?::INTEGER"),
+        (
+            "SELECT * FROM novels WHERE id IN ($1::INTEGER, $2::INTEGER) LIMIT $3::INTEGER",
+            "SELECT * FROM novels WHERE id IN (?::INTEGER) LIMIT ?::INTEGER",
+        ),
+        ("SELECT * FROM novels WHERE id = ANY($1::INTEGER[])", "SELECT * FROM novels WHERE id = ANY(?::INTEGER[])"),
+        ("UPDATE users SET nickname = $1::VARCHAR, id = $12", "UPDATE users SET nickname = ?::VARCHAR, id = ?"),
+    ],
+)
+def test_statement_shape(statement: str, shape: str):
+    """bind parameter의 번호를 지우고, 같은 타입이 이어지는 목록은 하나로 묶습니다."""
+    assert statement_shape(statement) == shape
+
+
+def test_statement_shape_ignores_list_length():
+    """IN 목록의 길이만 다른 문장은 같은 형태입니다."""
+    short = "SELECT * FROM novels WHERE id IN ($1::INTEGER)"
+    long = "SELECT * FROM novels WHERE id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER)"
+
+    assert statement_shape(short) == statement_shape(long)
+
+
+def test_assert_max_queries():
+    """범위 안에서 실행한 문장이 한도를 넘으면 형태별 실행 횟수와 함께 실패합니다."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with assert_max_queries(2) as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 1"))
+        assert stats.count == 2
+        assert stats.repeated(2) == {"SELECT 1": 2}
+
+        with pytest.raises(AssertionError, match="1x SELECT 2"):
+            with assert_max_queries(1):
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+        with assert_max_queries(2) as outer:
+            with assert_max_queries(1) as inner:
+                conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        assert (inner.count, outer.count) == (1, 2)
@@ -0,0 +1,31 @@
+"""CRUD 공통 함수 테스트"""
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+
+from src.domain.base.crud import keyset_condition
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("value", Integer, nullable=True))
+
+ROWS = [(1, 10), (2, None), (3, 20), (4, 10), (5, None), (6, 30), (7, 20), (8, 10)]
+
+
+def postgres_order(desc: bool) -> list[tuple[int, int | None]]:
+    """PostgreSQL처럼 NULL을 내림차순에서 처음, 오름차순에서 마지막에 두고 `ORDER BY value, id`로 정렬합니다."""
+    return sorted(ROWS, key=lambda row: ((row[1] is None, row[1] or 0), row[0]), reverse=desc)
+
+
+@pytest.mark.parametrize("desc", [False, True])
+def test_keyset_condition(desc: bool):
+    """모든 커서 위치에서 조건에 맞는 행은 정렬 순서상 커서 다음에 오는 행과 같습니다."""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    ordered = postgres_order(desc)
+    with engine.begin() as conn:
+        conn.execute(insert(items), [{"id": row_id, "value": value} for row_id, value in ROWS])
+        for position, (row_id, value) in enumerate(ordered):
+            condition = keyset_condition(items.c.value, value, items.c.id, row_id, desc)
+
+            selected = set(conn.scalars(select(items.c.id).where(condition)))
+
+            assert selected == {row[0] for row in ordered[position + 1 :]}, (row_id, value)
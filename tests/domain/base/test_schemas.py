@@ -0,0 +1,96 @@
+"""DTO 기본 클래스 테스트
+
+검증을 건너뛰는 `from_trusted`, `trusted_http_url`, `platform_urls`가 pydantic 검증과 같은 값을 만드는지 확인합니다.
+"""
+from datetime import datetime, timezone
+from typing import Annotated
+
+import pytest
+from pydantic import Field, HttpUrl, ValidationError
+
+from src.domain.base.schemas import DTO, trusted_http_url
+from src.domain.novels.schemas import NovelDTO, NovelProgressDTO, NovelStatsDTO, platform_urls
+
+
+class SampleDTO(DTO):
+    """테스트용 DTO"""
+
+    id: int
+    name: str = "이름"
+    tags: list[str] = []
+    extra: Annotated[dict[str, int], Field(default_factory=dict)]
+    stats: NovelStatsDTO | None = None
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"id": 1},
+        {"id": 1, "name": "소설", "tags": ["a"], "extra": {"a": 1}},
+        {"id": 1, "stats": NovelStatsDTO(reader_count=3), "unknown": "무시"},
+    ],
+)
+def test_from_trusted_equals_model_validate(values: dict):
+    """검증된 값이면 `model_validate`와 같은 값과 설정된 필드를 가집니다."""
+    trusted, validated = SampleDTO.from_trusted(values), SampleDTO.model_validate(values)
+
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_from_trusted_copies_mutable_defaults():
+    """리스트와 default_factory 기본값은 객체마다 새로 만듭니다."""
+    first, second = SampleDTO.from_trusted({"id": 1}), SampleDTO.from_trusted({"id": 2})
+    first.tags.append("a")
+    first.extra["a"] = 1
+
+    assert second.tags == [] and second.extra == {}
+    assert NovelProgressDTO.from_trusted({"count": 0}).ranges is not NovelProgressDTO.from_trusted({"count": 0}).ranges
+
+
+def test_from_trusted_validates_missing_required_field():
+    """필수 필드가 빠지면 `model_validate`와 같은 에러를 발생시킵니다."""
+    with pytest.raises(ValidationError) as trusted:
+        SampleDTO.from_trusted({"name": "소설"})
+    with pytest.raises(ValidationError) as validated:
+        SampleDTO.model_validate({"name": "소설"})
+
+    assert trusted.value.errors() == validated.value.errors()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "https://ridibooks.com/books/5211000001",
+        "https://img.example.com/a%20b.jpg?size=large#top",
+        "http://EXAMPLE.com:8080/경로",
+        "https://page.kakao.com",
+    ],
+)
+def test_trusted_http_url_equals_http_url(value: str):
+    """검증된 URL 문자열이면 `HttpUrl`과 같은 URL을 만듭니다."""
+    trusted = trusted_http_url(value)
+
+    assert trusted == HttpUrl(value)
+    assert str(trusted) == str(HttpUrl(value))
+    assert trusted.host == HttpUrl(value).host
+    assert trusted_http_url(None) is None
+
+
+@pytest.mark.parametrize("ridi_id", ["5211000001", None])
+def test_platform_urls_equals_validator(ridi_id: str | None):
+    """`platform_urls`는 `NovelDTO`의 URL validator와 같은 URL을 만듭니다."""
+    values = {
+        "id": 1,
+        "title": "제목",
+        "author": "작가",
+        "published_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "last_updated_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "category": "판타지",
+        "ridi_id": ridi_id,
+    }
+
+    trusted = NovelDTO.from_trusted({**values, **platform_urls(values)})
+
+    assert trusted == NovelDTO.model_validate(values)
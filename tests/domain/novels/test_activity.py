@@ -0,0 +1,47 @@
+"""소설 활동 수 저장 테스트"""
+import pytest
+from sqlalchemy import text
+
+from src.db import engine
+from src.domain.novels import service
+from src.libs.counters import BucketCounter
+
+
+@pytest.fixture(name="activity")
+def fixture_activity(monkeypatch: pytest.MonkeyPatch) -> BucketCounter:
+    """다른 테스트의 활동 수와 섞이지 않도록 새 카운터를 사용합니다."""
+    activity = BucketCounter(60, clock=lambda: 120)
+    monkeypatch.setattr(service, "novel_activity", activity)
+    return activity
+
+
+async def test_flush_restores_counts_on_failure(activity: BucketCounter, monkeypatch: pytest.MonkeyPatch):
+    """저장에 실패하면 꺼낸 활동 수를 되돌려 다음 실행에서 다시 저장합니다."""
+
+    async def fail(*_args, **_kwargs):
+        raise ConnectionError("저장 실패")
+
+    monkeypatch.setattr(service.CRUDNovelSnapshot, "add_activity", fail)
+    activity.add(1, 2)
+
+    with pytest.raises(ConnectionError):
+        await service.flush_novel_activity()
+    activity.add(1)
+
+    assert activity.drain() == {(1, 120): 3}
+
+
+@pytest.mark.usefixtures("database")
+async def test_flush_adds_counts(activity: BucketCounter):
+    """모인 활동 수를 버킷별로 더하고 카운터를 비웁니다."""
+    activity.add(1, 2)
+    await service.flush_novel_activity()
+    activity.add(1)
+    activity.add(2)
+    await service.flush_novel_activity()
+
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text("SELECT novel_id, count FROM novel_activity ORDER BY novel_id"))).all()
+
+    assert [tuple(row) for row in rows] == [(1, 3), (2, 1)]
+    assert activity.stats["pending"] == 0
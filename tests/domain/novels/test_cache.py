@@ -0,0 +1,84 @@
+"""소설 캐시 테스트"""
+import asyncio
+
+from src.domain.novels.cache import NovelCache
+from src.libs.cache import MemoryCacheBackend
+from src.libs.conditional import ResourceVersion
+
+V1 = ResourceVersion.of("novel", 1, counts=(1,))
+V2 = ResourceVersion.of("novel", 1, counts=(2,))
+
+
+class Loader:
+    """호출 횟수를 세고 정해진 값을 반환하는 불러오기 함수입니다."""
+
+    def __init__(self, value: str, started: asyncio.Event | None = None, release: asyncio.Event | None = None):
+        self.value = value
+        self.started = started
+        self.release = release
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.started is not None:
+            self.started.set()
+            await self.release.wait()
+        return self.value
+
+
+async def test_get_reloads_on_version_mismatch():
+    """같은 버전이면 캐시된 값을 반환하고, 버전이 바뀌면 다시 불러옵니다."""
+    novel_cache = NovelCache(MemoryCacheBackend(10))
+    first, second = Loader("v1"), Loader("v2")
+
+    assert await novel_cache.get_novel(1, V1, first) == "v1"
+    assert await novel_cache.get_novel(1, V1, first) == "v1"
+    assert await novel_cache.get_novel(1, V2, second) == "v2"
+    assert await novel_cache.get_novel(1, V2, first) == "v2"
+
+    assert (first.calls, second.calls) == (1, 1)
+
+
+async def test_invalidate_removes_novel_entries():
+    """소설을 무효화하면 그 소설의 상세와 챕터 목록을 다시 불러옵니다."""
+    novel_cache = NovelCache(MemoryCacheBackend(10))
+    one, two = Loader("1"), Loader("2")
+    await novel_cache.get_novel(1, V1, one)
+    await novel_cache.get_novel(2, V1, two)
+
+    await novel_cache.invalidate(1)
+    await novel_cache.get_novel(1, V1, one)
+    await novel_cache.get_novel(2, V1, two)
+
+    assert (one.calls, two.calls) == (2, 1)
+
+
+async def test_invalidation_during_load_is_not_cached():
+    """불러오는 동안 무효화가 있었다면 불러온 값은 반환하지만 저장하지 않습니다."""
+    novel_cache = NovelCache(MemoryCacheBackend(10))
+    started, release = asyncio.Event(), asyncio.Event()
+    stale = Loader("stale", started, release)
+
+    task = asyncio.create_task(novel_cache.get_novel(1, V1, stale))
+    await started.wait()
+    await novel_cache.invalidate(1)
+    release.set()
+    fresh = Loader("fresh")
+
+    assert await task == "stale"
+    assert await novel_cache.get_novel(1, V1, fresh) == "fresh"
+    assert fresh.calls == 1
+
+
+async def test_concurrent_loads_are_coalesced():
+    """같은 키와 버전의 동시 요청은 한 번만 불러옵니다."""
+    novel_cache = NovelCache(MemoryCacheBackend(10))
+    started, release = asyncio.Event(), asyncio.Event()
+    loader = Loader("v1", started, release)
+
+    tasks = [asyncio.create_task(novel_cache.get_novel(1, V1, loader)) for _ in range(3)]
+    await started.wait()
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["v1"] * 3
+    assert loader.calls == 1
@@ -0,0 +1,79 @@
+"""소설 내용 색인 테스트"""
+# pylint: disable=protected-access
+import numpy as np
+import pytest
+
+from src.domain.novels.content import NovelContentIndex, terms
+
+_WORDS = ("회귀", "마법사", "검술", "아카데미", "황녀", "계약", "무림", "천마", "던전", "헌터", "레벨업", "복수")
+NOVELS = [
+    (
+        novel_id,
+        "판타지" if novel_id % 3 else "무협",
+        f"{_WORDS[novel_id % 12]} {_WORDS[novel_id * 5 % 12]}",
+        " ".join(_WORDS[(novel_id * step) % 12] for step in (1, 2, 7)),
+    )
+    for novel_id in range(1, 41)
+]
+
+
+def test_terms_counts_title_grams_more():
+    """제목의 n-gram은 설명보다 여러 번 세고, 한 음절 단어는 그대로 셉니다."""
+    counts = terms("마법사 검", "마법")
+
+    assert counts["마법"] == 4 and counts["법사"] == 3 and counts["검"] == 3
+
+
+@pytest.mark.parametrize("initial", [10, 39])
+def test_incremental_neighbors_equals_rebuild(initial: int):
+    """소설을 추가한 뒤 새 행만 계산한 유사도는 같은 IDF로 행렬을 처음부터 만든 결과와 같습니다."""
+    incremental = NovelContentIndex()
+    incremental.add_many(NOVELS[:initial])
+    incremental.neighbors(NOVELS[0][0])
+    incremental.add_many(NOVELS[initial:])
+
+    rebuilt = NovelContentIndex()
+    rebuilt.add_many(NOVELS)
+    rebuilt._idf = incremental._frozen_idf()
+
+    for novel_id, *_ in NOVELS:
+        ids, scores = incremental.neighbors(novel_id)
+        expected_ids, expected_scores = rebuilt.neighbors(novel_id)
+        np.testing.assert_array_equal(ids, expected_ids)
+        np.testing.assert_allclose(scores, expected_scores, rtol=1e-5)
+
+
+def test_neighbors_matches_cosine_similarity():
+    """유사도는 같은 카테고리의 TF-IDF 벡터끼리 계산한 코사인 유사도이고 자기 자신은 제외합니다."""
+    index = NovelContentIndex()
+    index.add_many(NOVELS)
+    idf = index._frozen_idf()
+    vectors = {}
+    for novel_id, category, title, description in NOVELS:
+        vector = np.zeros(len(idf))
+        for term, count in terms(title, description).items():
+            vector[index._vocabulary[term]] = (1 + np.log(count)) * idf[index._vocabulary[term]]
+        vectors[novel_id] = (category, vector / (np.linalg.norm(vector) or 1))
+
+    category, vector = vectors[1]
+    expected = {
+        novel_id: float(vector @ other)
+        for novel_id, (other_category, other) in vectors.items()
+        if other_category == category and novel_id != 1 and vector @ other > 1e-6
+    }
+    ids, scores = index.neighbors(1)
+
+    assert set(ids.tolist()) == set(expected)
+    assert list(scores) == sorted(scores, reverse=True)
+    np.testing.assert_allclose(scores, [expected[novel_id] for novel_id in ids.tolist()], rtol=1e-5)
+
+
+def test_add_ignores_existing_novel():
+    """이미 색인한 소설은 다시 더하지 않습니다."""
+    index = NovelContentIndex()
+    index.add_many(NOVELS[:5])
+    index.add(*NOVELS[0])
+
+    assert len(index) == 5 and index.last_id == 5
+    index.clear()
+    assert len(index) == 0 and index.last_id == 0
@@ -0,0 +1,52 @@
+"""소설 등록 작업 CRUD 테스트"""
+import pytest
+
+from src.db import AsyncSessionLocal
+from src.domain.novels.jobs_crud import CRUDNovelJob
+from src.domain.novels.schemas import NovelCreate, Platform
+
+pytestmark = pytest.mark.usefixtures("database")
+
+FIRST = NovelCreate(platform=Platform.KAKAO, url="https://page.kakao.com/content/111")
+SECOND = NovelCreate(platform=Platform.KAKAO, url="https://page.kakao.com/content/222")
+
+
+async def create(user_id: int, command: NovelCreate) -> str:
+    """작업을 추가하고 id를 반환합니다."""
+    async with AsyncSessionLocal() as db:
+        job = await CRUDNovelJob(db).create(user_id, command)
+        await db.commit()
+        return job.id
+
+
+async def claim() -> str | None:
+    """대기 중인 작업 하나를 가져가 id를 반환합니다."""
+    async with AsyncSessionLocal() as db:
+        job = await CRUDNovelJob(db).claim()
+        await db.commit()
+        return job.id if job else None
+
+
+async def test_create_deduplicates_url_only_jobs():
+    """아이디를 모르는 URL 등록도 같은 사용자의 같은 소설이면 진행 중인 작업을 반환합니다."""
+    first = await create(1, FIRST)
+
+    assert await create(1, FIRST) == first
+    assert await create(1, SECOND) != first
+    assert await create(2, FIRST) != first
+
+
+async def test_claim_skips_novel_being_crawled():
+    """같은 소설을 크롤링하는 작업이 진행 중이면 그 소설의 다른 작업은 건너뜁니다."""
+    first = await create(1, FIRST)
+    other_user = await create(2, FIRST)
+    other_novel = await create(1, SECOND)
+
+    assert await claim() == first
+    assert await claim() == other_novel
+    assert await claim() is None
+
+    async with AsyncSessionLocal() as db:
+        await CRUDNovelJob(db).finish(first, error="failed")
+        await db.commit()
+    assert await claim() == other_user
@@ -0,0 +1,76 @@
+"""추천 소설 계산 테스트
+
+희소 행렬을 블록으로 나누어 계산한 결과를 밀집 행렬로 한 번에 계산한 결과와 비교합니다.
+"""
+import numpy as np
+import pytest
+from scipy import sparse
+
+from src.domain.novels.recommendations import (
+    TopK,
+    interaction_matrix,
+    neighbor_matrix,
+    recommend_novels,
+    similar_novels,
+)
+
+K = 3
+
+
+@pytest.fixture(name="matrix")
+def fixture_matrix() -> sparse.csr_matrix:
+    """사용자 12명이 소설 15편 중 일부를 평가한 행렬입니다."""
+    rng = np.random.default_rng(0)
+    users, novels = np.nonzero(rng.random((12, 15)) < 0.35)
+    ratings = rng.uniform(0.2, 2, len(users))
+    matrix, user_ids, novel_ids = interaction_matrix((users + 100).tolist(), (novels + 200).tolist(), ratings.tolist())
+    np.testing.assert_array_equal(user_ids, np.unique(users) + 100)
+    np.testing.assert_array_equal(novel_ids, np.unique(novels) + 200)
+    return matrix
+
+
+def assert_top_k(tops: list[TopK], scores: np.ndarray) -> None:
+    """블록들이 행마다 양수 점수 중 상위 K개를 점수 내림차순으로 골랐는지 밀집 점수 행렬과 비교합니다.
+
+    점수가 같은 열은 어느 쪽을 골라도 되므로 열 번호 대신 고른 열의 점수를 비교합니다.
+    """
+    rows = np.concatenate([top.rows for top in tops])
+    ranks = np.concatenate([top.ranks for top in tops])
+    cols = np.concatenate([top.cols for top in tops])
+    values = np.concatenate([top.scores for top in tops])
+    for row in range(scores.shape[0]):
+        expected = np.sort(scores[row][scores[row] > 1e-6])[::-1][:K]
+        selected = rows == row
+        assert ranks[selected].tolist() == list(range(1, len(expected) + 1))
+        np.testing.assert_allclose(values[selected], expected, rtol=1e-5)
+        np.testing.assert_allclose(scores[row, cols[selected]], values[selected], rtol=1e-5)
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 100])
+def test_similar_novels_matches_dense(matrix: sparse.csr_matrix, block_size: int):
+    """소설마다 자신을 제외하고 평가 벡터의 코사인 유사도가 높은 소설 K개를 고릅니다."""
+    dense = matrix.toarray().astype(np.float64)
+    normalized = dense / np.linalg.norm(dense, axis=0)
+    scores = normalized.T @ normalized
+    np.fill_diagonal(scores, 0)
+
+    assert_top_k(list(similar_novels(matrix, K, block_size)), scores)
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 100])
+def test_recommend_novels_matches_dense(matrix: sparse.csr_matrix, block_size: int):
+    """사용자마다 평가하지 않은 소설 중 평가로 가중한 유사도 합이 높은 소설 K개를 고릅니다."""
+    tops = list(similar_novels(matrix, K, 4))
+    neighbors = neighbor_matrix(tops, matrix.shape[1])
+    dense = matrix.toarray().astype(np.float64)
+    scores = np.where(dense > 0, 0, dense @ neighbors.toarray())
+
+    assert_top_k(list(recommend_novels(matrix, neighbors, K, block_size)), scores)
+
+
+def test_neighbor_matrix_places_scores():
+    """비슷한 소설 블록의 점수를 행과 열 위치에 모으고, 블록이 없으면 빈 행렬입니다."""
+    top = TopK(np.array([0, 0, 2]), np.array([1, 2, 1]), np.array([2, 1, 0]), np.array([0.9, 0.5, 0.7]))
+
+    np.testing.assert_allclose(neighbor_matrix([top], 3).toarray(), [[0, 0.5, 0.9], [0, 0, 0], [0.7, 0, 0]], rtol=1e-6)
+    assert neighbor_matrix([], 3).nnz == 0
@@ -0,0 +1,29 @@
+"""소설 DTO 테스트"""
+import pytest
+from fastapi import HTTPException
+
+from src.domain.novels.schemas import ChapterMemoBatch, NovelCreate, Platform
+from src.libs.responses import NovelError
+
+
+def test_novel_create_key():
+    """아이디를 아는 요청은 아이디로, URL만 있는 요청은 URL로 같은 소설인지 구분합니다."""
+    ridi = NovelCreate(platform=Platform.RIDI, url="https://ridibooks.com/books/5211000001?_rdt_idx=0")
+    first = NovelCreate(platform=Platform.KAKAO, url="https://page.kakao.com/content/111")
+    second = NovelCreate(platform=Platform.KAKAO, url="https://page.kakao.com/content/222")
+
+    assert ridi.key == NovelCreate(platform=Platform.RIDI, id="5211000001").key == "5211000001"
+    assert first.id is None and first.key == "https://page.kakao.com/content/111"
+    assert first.key != second.key
+    assert first.key == NovelCreate(platform=Platform.KAKAO, url="HTTPS://PAGE.KAKAO.COM/content/111").key
+
+
+def test_chapter_memo_batch_rejects_duplicate_chapter_no():
+    """같은 챕터 번호가 두 번 있으면 요청을 거부합니다."""
+    items = [{"chapter_no": no, "content": "메모", "star": 8} for no in (1, 2, 1)]
+
+    with pytest.raises(HTTPException) as exc_info:
+        ChapterMemoBatch(items=items)
+
+    assert exc_info.value.status_code == NovelError.DUPLICATE_CHAPTER_NO.http_exception.status_code
+    assert [item.chapter_no for item in ChapterMemoBatch(items=items[:2]).items] == [1, 2]
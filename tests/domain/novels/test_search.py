@@ -0,0 +1,141 @@
+"""소설 검색 색인 테스트
+
+색인 검색 결과를 데이터베이스의 ILIKE 검색과 keyset 페이지네이션 의미를 그대로 옮긴 단순 구현과 비교합니다.
+"""
+# pylint: disable=too-many-arguments
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.novels.models import NovelCategory
+from src.domain.novels.schemas import NovelCategoryFilter, NovelDTO, NovelFilter, NovelOrder
+from src.domain.novels.search import NovelSearchIndex
+
+_FIELDS = {
+    NovelFilter.ALL: ("title", "author", "description"),
+    NovelFilter.TITLE: ("title",),
+    NovelFilter.AUTHOR: ("author",),
+    NovelFilter.DESCRIPTION: ("description",),
+}
+_COLUMN_ORDERS = (NovelOrder.TITLE, NovelOrder.AUTHOR, NovelOrder.PUBLISHED_AT, NovelOrder.LAST_UPDATED_AT)
+
+_BASE = datetime(2024, 1, 1)
+_TITLES = ("나 혼자만 레벨업", "전지적 독자 시점", "Solo Leveling", "레벨업 하는 독자", "화산귀환", "SOLO 독자")
+_AUTHORS = ("추공", "싱숑", "Chugong", None, "비가", "추공")
+_CATEGORIES = tuple(NovelCategory)
+NOVELS = [
+    NovelDTO.from_trusted(
+        {
+            "id": novel_id,
+            "title": _TITLES[novel_id % len(_TITLES)] + f" {novel_id // len(_TITLES)}",
+            "author": _AUTHORS[novel_id % len(_AUTHORS)],
+            "description": "회귀한 주인공의 레벨업" if novel_id % 3 == 0 else "독자를 위한 이야기",
+            # 공개일이 없는 소설과 최종 업데이트일이 같은 소설로 NULL과 동점 처리를 확인합니다.
+            "published_at": None if novel_id % 4 == 0 else _BASE + timedelta(days=novel_id % 7),
+            "last_updated_at": _BASE + timedelta(hours=novel_id % 5),
+            "category": _CATEGORIES[novel_id % len(_CATEGORIES)].value,
+        }
+    )
+    for novel_id in range(1, 31)
+]
+
+
+@pytest.fixture(name="index", scope="module")
+def fixture_index() -> NovelSearchIndex:
+    """테스트 소설을 색인합니다."""
+    index = NovelSearchIndex()
+    index.build(NOVELS)
+    return index
+
+
+def expected(
+    query: str | None, filter_by: NovelFilter, category: NovelCategoryFilter, order_by: NovelOrder, desc: bool
+) -> list[int]:
+    """ILIKE 검색과 NULL을 가장 큰 값으로 보는 PostgreSQL 정렬로 계산한 소설 id 목록입니다."""
+    novels = [
+        novel
+        for novel in NOVELS
+        if not query
+        or any(query.casefold() in (getattr(novel, field) or "").casefold() for field in _FIELDS[filter_by])
+    ]
+    if category != NovelCategoryFilter.ALL:
+        novels = [novel for novel in novels if novel.category == NovelCategory[category.name].value]
+    order_field = order_by if order_by in _COLUMN_ORDERS else NovelOrder.LAST_UPDATED_AT
+
+    def sort_key(novel: NovelDTO) -> tuple:
+        value = getattr(novel, order_field.value)
+        return (value is None, value, novel.id)
+
+    return [novel.id for novel in sorted(novels, key=sort_key, reverse=desc)]
+
+
+@pytest.mark.parametrize(
+    ("query", "filter_by", "category"),
+    [
+        (None, NovelFilter.ALL, NovelCategoryFilter.ALL),
+        ("레벨업", NovelFilter.ALL, NovelCategoryFilter.ALL),
+        ("레벨업", NovelFilter.TITLE, NovelCategoryFilter.ALL),
+        ("독자", NovelFilter.DESCRIPTION, NovelCategoryFilter.FANTASY),
+        ("solo", NovelFilter.TITLE, NovelCategoryFilter.ALL),
+        ("CHU", NovelFilter.AUTHOR, NovelCategoryFilter.ALL),
+        ("추", NovelFilter.AUTHOR, NovelCategoryFilter.ALL),
+        ("자 시", NovelFilter.ALL, NovelCategoryFilter.ALL),
+        ("없는 소설", NovelFilter.ALL, NovelCategoryFilter.ALL),
+    ],
+)
+@pytest.mark.parametrize("order_by", [*_COLUMN_ORDERS, NovelOrder.RELEVANCE])
+@pytest.mark.parametrize("desc", [True, False])
+def test_search_matches_ilike(
+    index: NovelSearchIndex,
+    query: str | None,
+    filter_by: NovelFilter,
+    category: NovelCategoryFilter,
+    order_by: NovelOrder,
+    desc: bool,
+):
+    """검색 결과는 ILIKE 검색과 같고, 관련도 순이 아니면 순서도 데이터베이스와 같습니다."""
+    result = [
+        novel.id
+        for novel in index.search(query=query, filter_by=filter_by, category=category, order_by=order_by, desc=desc)
+    ]
+
+    if order_by == NovelOrder.RELEVANCE and query:
+        assert sorted(result) == sorted(expected(query, filter_by, category, order_by, desc))
+    else:
+        assert result == expected(query, filter_by, category, order_by, desc)
+
+
+@pytest.mark.parametrize("order_by", _COLUMN_ORDERS)
+@pytest.mark.parametrize("desc", [True, False])
+@pytest.mark.parametrize("query", [None, "독자"])
+def test_search_keyset_paging(index: NovelSearchIndex, query: str | None, order_by: NovelOrder, desc: bool):
+    """커서로 이어 받은 페이지를 합치면 한 번에 조회한 결과와 같습니다."""
+    pages, after = [], None
+    while True:
+        page = index.search(query=query, order_by=order_by, desc=desc, limit=4, after=after)
+        if not page:
+            break
+        pages.extend(novel.id for novel in page)
+        after = (getattr(page[-1], order_by.value), page[-1].id)
+
+    assert pages == expected(query, NovelFilter.ALL, NovelCategoryFilter.ALL, order_by, desc)
+
+
+def test_search_skip_limit(index: NovelSearchIndex):
+    """커서가 없으면 skip과 limit으로 자릅니다."""
+    ids = expected(None, NovelFilter.ALL, NovelCategoryFilter.ALL, NovelOrder.LAST_UPDATED_AT, True)
+
+    assert [novel.id for novel in index.search(skip=5, limit=10)] == ids[5:15]
+
+
+def test_search_reflects_add_and_remove(index: NovelSearchIndex):
+    """소설을 다시 색인하거나 제거하면 바로 검색 결과에 반영됩니다."""
+    renamed = NOVELS[0].model_copy(update={"title": "새 제목"})
+    index.add(renamed)
+    try:
+        assert [novel.id for novel in index.search(query="새 제목")] == [renamed.id]
+        index.remove(renamed.id)
+        assert not index.search(query="새 제목")
+        assert renamed.id not in {novel.id for novel in index.search()}
+    finally:
+        index.build(NOVELS)
@@ -0,0 +1,45 @@
+"""bytea 비트맵 함수 테스트"""
+import random
+
+import pytest
+
+from src.libs.bitmap import bitmap_count, bitmap_ranges
+
+
+def set_bits(numbers: list[int]) -> bytes:
+    """PostgreSQL의 `set_bit`처럼 비트를 켠 비트맵을 만듭니다."""
+    bitmap = bytearray(max(numbers, default=-1) // 8 + 1)
+    for number in numbers:
+        bitmap[number // 8] |= 1 << (number % 8)
+    return bytes(bitmap)
+
+
+@pytest.mark.parametrize(
+    "bitmap, ranges",
+    [
+        (b"", []),
+        (bytes(3), []),
+        (bytes([0b00000001]), [(0, 0)]),
+        (bytes([0b11111111]), [(0, 7)]),
+        (bytes([0b10001110, 0b00000001]), [(1, 3), (7, 8)]),
+        (bytes([0b10000000, 0b00000000, 0b00000001]), [(7, 7), (16, 16)]),
+        (bytes([0b11111111, 0b11111111]), [(0, 15)]),
+    ],
+)
+def test_bitmap_ranges(bitmap: bytes, ranges: list[tuple[int, int]]):
+    """켜진 비트를 양 끝을 포함하는 연속 구간으로 묶습니다."""
+    assert bitmap_ranges(bitmap) == ranges
+
+
+def test_bitmap_ranges_matches_bits():
+    """임의의 비트맵에서 구간을 펼치면 켜진 비트 번호와 같습니다."""
+    rng = random.Random(0)
+    for _ in range(100):
+        numbers = sorted(rng.sample(range(2000), rng.randint(0, 300)))
+        bitmap = set_bits(numbers)
+
+        ranges = bitmap_ranges(bitmap)
+
+        assert [number for start, end in ranges for number in range(start, end + 1)] == numbers
+        assert all(end + 1 < start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+        assert bitmap_count(bitmap) == len(numbers)
@@ -0,0 +1,78 @@
+"""프로세스 내 메모리 캐시 테스트"""
+import pytest
+
+from src.libs import cache
+from src.libs.cache import MemoryCacheBackend, TTLCache
+
+
+class Clock:
+    """`time.monotonic` 대신 사용하는 시계입니다."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """캐시 모듈의 시계를 직접 움직일 수 있게 바꿉니다."""
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return clock
+
+
+def test_ttl_cache_expires(clock: Clock):
+    """항목은 기본 만료 시간이나 항목별 만료 시간이 지나면 조회되지 않고 제거됩니다."""
+    evicted = []
+    ttl_cache = TTLCache(10, ttl=10, on_evict=lambda key, value: evicted.append(key))
+    ttl_cache.set("default", 1)
+    ttl_cache.set("short", 2, ttl=1)
+    ttl_cache.set("skipped", 3, ttl=0)
+
+    clock.now = 5
+    assert (ttl_cache.get("default"), ttl_cache.get("short"), ttl_cache.get("skipped")) == (1, None, None)
+    clock.now = 10
+    assert "default" not in ttl_cache and ttl_cache.get("default") is None
+
+    assert evicted == ["short", "default"]
+    assert len(ttl_cache) == 0
+    assert ttl_cache.stats["hits"] == 1 and ttl_cache.stats["misses"] == 3
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """가득 차면 가장 오래 사용하지 않은 항목부터 제거합니다."""
+    ttl_cache = TTLCache(2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ("a" in ttl_cache, "b" in ttl_cache, "c" in ttl_cache) == (True, False, True)
+    assert ttl_cache.stats["evictions"] == 1
+
+
+async def test_memory_backend_invalidates_tags():
+    """태그를 무효화하면 그 태그가 붙은 항목만 제거합니다."""
+    backend = MemoryCacheBackend(10)
+    await backend.set("a", 1, tags=("novel:1",))
+    await backend.set("b", 2, tags=("novel:1", "novel:2"))
+    await backend.set("c", 3, tags=("novel:2",))
+
+    await backend.invalidate_tags("novel:1")
+
+    assert [await backend.get(key) for key in "abc"] == [None, None, 3]
+    assert backend.stats["tags"] == 1
+
+
+async def test_memory_backend_forgets_evicted_keys(clock: Clock):
+    """크기나 만료로 제거된 항목은 태그 목록에서도 제거되어 태그가 쌓이지 않습니다."""
+    backend = MemoryCacheBackend(1, ttl=10)
+    await backend.set("a", 1, tags=("novel:1",))
+    await backend.set("b", 2, tags=("novel:2",))
+    clock.now = 10
+    await backend.get("b")
+
+    assert backend.stats["size"] == 0
+    assert backend.stats["tags"] == 0
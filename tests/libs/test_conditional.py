@@ -0,0 +1,84 @@
+"""HTTP 조건부 요청 테스트"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from starlette.requests import Request
+
+from src.libs.conditional import ResourceVersion
+
+UPDATED_AT = datetime(2024, 3, 1, 12, 30, 15, 500000, tzinfo=timezone.utc)
+
+
+def make_request(**headers: str) -> Request:
+    """헤더만 있는 GET 요청을 만듭니다."""
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+def test_of_is_stable():
+    """같은 값으로 만든 버전은 같은 약한 ETag를 가지고, 값이 바뀌면 ETag도 바뀝니다."""
+    version = ResourceVersion.of("novel", 1, updated_at=(UPDATED_AT, None))
+
+    assert version == ResourceVersion.of("novel", 1, updated_at=(UPDATED_AT, None))
+    assert version.etag.startswith('W/"')
+    assert version.last_modified == UPDATED_AT
+    assert version.etag != ResourceVersion.of("novel", 2, updated_at=(UPDATED_AT, None)).etag
+    assert version.etag != ResourceVersion.of("novel", 1, updated_at=(UPDATED_AT, None), counts=(1,)).etag
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('W/"other", W/"abc"', True),
+        ("*", True),
+        ('W/"other"', False),
+        ("", False),
+    ],
+)
+def test_is_not_modified_if_none_match(if_none_match: str, expected: bool):
+    """If-None-Match는 약한 비교로 ETag 목록과 `*`를 확인합니다."""
+    version = ResourceVersion('W/"abc"', last_modified=UPDATED_AT)
+
+    assert version.is_not_modified(make_request(if_none_match=if_none_match)) is expected
+
+
+def test_is_not_modified_prefers_if_none_match():
+    """If-None-Match가 있으면 If-Modified-Since는 무시합니다."""
+    version = ResourceVersion('W/"abc"', last_modified=UPDATED_AT)
+    request = make_request(if_none_match='W/"other"', if_modified_since="Fri, 01 Mar 2030 00:00:00 GMT")
+
+    assert not version.is_not_modified(request)
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        ("Fri, 01 Mar 2024 12:30:15 GMT", True),
+        ("Fri, 01 Mar 2024 12:30:16 GMT", True),
+        ("Fri, 01 Mar 2024 12:30:14 GMT", False),
+        ("Fri, 01 Mar 2024 21:30:15 +0900", True),
+        ("not a date", False),
+    ],
+)
+def test_is_not_modified_if_modified_since(if_modified_since: str, expected: bool):
+    """If-Modified-Since는 초 미만을 버린 수정일과 비교하고, 잘못된 날짜는 무시합니다."""
+    version = ResourceVersion('W/"abc"', last_modified=UPDATED_AT)
+
+    assert version.is_not_modified(make_request(if_modified_since=if_modified_since)) is expected
+
+
+def test_is_not_modified_without_headers():
+    """조건부 헤더가 없으면 항상 본문으로 응답합니다."""
+    assert not ResourceVersion('W/"abc"', last_modified=UPDATED_AT).is_not_modified(make_request())
+
+
+def test_is_not_modified_skips_if_modified_since_with_counts():
+    """행 수가 포함되었거나 수정일이 없는 버전은 If-Modified-Since로 304를 보내지 않습니다."""
+    since = (UPDATED_AT + timedelta(days=1)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    request = make_request(if_modified_since=since)
+
+    assert ResourceVersion.of("chapters", 1, updated_at=(UPDATED_AT,)).is_not_modified(request)
+    assert not ResourceVersion.of("chapters", 1, updated_at=(UPDATED_AT,), counts=(30,)).is_not_modified(request)
+    assert not ResourceVersion.of("chapters", 1).is_not_modified(request)
@@ -0,0 +1,52 @@
+"""시간 버킷 카운터 테스트"""
+from src.libs.counters import BucketCounter
+
+
+class Clock:
+    """정해진 시각을 반환하는 시계입니다."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_add_groups_by_bucket():
+    """증가분은 키와 버킷 시작 시각별로 합쳐집니다."""
+    clock = Clock(1000.5)
+    counter = BucketCounter(60, clock=clock)
+    counter.add(1)
+    counter.add(1, 2)
+    counter.add(2)
+    clock.now = 1020
+    counter.add(1)
+
+    assert counter.drain() == {(1, 960): 3, (2, 960): 1, (1, 1020): 1}
+    assert not counter.drain()
+    assert counter.stats == {"pending": 0, "added": 5, "dropped": 0}
+
+
+def test_add_drops_new_keys_over_max_keys():
+    """모아둔 키가 가득 차면 이미 있는 키에는 더하고 새 키의 증가분은 버립니다."""
+    counter = BucketCounter(60, max_keys=2, clock=Clock(0))
+    counter.add(1)
+    counter.add(2)
+    counter.add(3, 4)
+    counter.add(1)
+
+    assert counter.drain() == {(1, 0): 2, (2, 0): 1}
+    assert counter.dropped == 4
+
+
+def test_restore_merges_with_new_counts():
+    """저장하지 못한 증가분을 되돌리면 그동안 새로 모인 증가분과 합쳐집니다."""
+    counter = BucketCounter(60, clock=Clock(0))
+    counter.add(1, 2)
+    drained = counter.drain()
+    counter.add(1)
+    counter.add(2)
+
+    counter.restore(drained)
+
+    assert counter.drain() == {(1, 0): 3, (2, 0): 1}
@@ -0,0 +1,105 @@
+"""single-flight 테스트"""
+import asyncio
+
+import pytest
+
+from src.libs.singleflight import SingleFlight
+
+
+class Fetcher:
+    """호출 수를 세고, `release`될 때까지 기다렸다가 키를 반환하는 작업입니다."""
+
+    def __init__(self, error: Exception | None = None):
+        self.calls = 0
+        self.error = error
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    def __call__(self, key: str):
+        async def fetch() -> str:
+            self.calls += 1
+            self.started.set()
+            await self.release.wait()
+            if self.error:
+                raise self.error
+            return key
+
+        return fetch
+
+
+async def test_coalesces_same_key():
+    """같은 키로 동시에 들어온 호출은 한 번만 실행하고 결과를 공유합니다."""
+    flight: SingleFlight[str] = SingleFlight()
+    fetcher = Fetcher()
+
+    tasks = [asyncio.create_task(flight.do("a", fetcher("a"))) for _ in range(3)]
+    await fetcher.started.wait()
+    fetcher.release.set()
+
+    assert await asyncio.gather(*tasks) == ["a", "a", "a"]
+    assert fetcher.calls == 1
+    assert flight.stats == {"calls": 3, "executions": 1, "coalesced": 2, "failures": 0, "in_flight": 0}
+
+
+async def test_does_not_coalesce_different_keys():
+    """키가 다르면 따로 실행합니다."""
+    flight: SingleFlight[str] = SingleFlight()
+    fetcher = Fetcher()
+    fetcher.release.set()
+
+    assert await asyncio.gather(flight.do("a", fetcher("a")), flight.do("b", fetcher("b"))) == ["a", "b"]
+    assert fetcher.calls == 2
+
+
+async def test_shares_error():
+    """실행이 실패하면 기다리던 호출도 같은 예외를 받고, 다음 호출은 다시 실행합니다."""
+    flight: SingleFlight[str] = SingleFlight()
+    fetcher = Fetcher(ValueError("crawler"))
+
+    tasks = [asyncio.create_task(flight.do("a", fetcher("a"))) for _ in range(2)]
+    await fetcher.started.wait()
+    fetcher.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats["failures"] == 1
+    fetcher.error = None
+    assert await flight.do("a", fetcher("a")) == "a"
+    assert fetcher.calls == 2
+
+
+async def test_leader_cancelled():
+    """실행하던 호출이 취소되면 기다리던 호출이 다시 실행합니다."""
+    flight: SingleFlight[str] = SingleFlight()
+    fetcher = Fetcher()
+
+    leader = asyncio.create_task(flight.do("a", fetcher("a")))
+    await fetcher.started.wait()
+    follower = asyncio.create_task(flight.do("a", fetcher("a")))
+    await asyncio.sleep(0)
+    leader.cancel()
+    fetcher.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == "a"
+    assert fetcher.calls == 2
+    assert flight.stats["in_flight"] == 0
+
+
+async def test_follower_cancelled():
+    """기다리던 호출이 취소되어도 실행 중인 작업은 계속되어 다른 호출에 결과를 줍니다."""
+    flight: SingleFlight[str] = SingleFlight()
+    fetcher = Fetcher()
+
+    leader = asyncio.create_task(flight.do("a", fetcher("a")))
+    await fetcher.started.wait()
+    follower = asyncio.create_task(flight.do("a", fetcher("a")))
+    await asyncio.sleep(0)
+    follower.cancel()
+    fetcher.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+    assert await leader == "a"
+    assert fetcher.calls == 1